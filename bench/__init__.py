@@ -0,0 +1,3 @@
+"""
+iThome Bot 效能測試工具
+"""
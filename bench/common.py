@@ -0,0 +1,107 @@
+"""
+效能測試共用工具
+"""
+import asyncio
+import os
+from pathlib import Path
+
+
+def process_tree_rss(pid: int | None = None) -> int | None:
+    """
+    取得行程與所有子行程（包含瀏覽器）的 RSS 總和
+
+    優先使用 psutil，未安裝時改讀 Linux 的 /proc
+
+    Args:
+        pid: 根行程 ID（預設為目前行程）
+
+    Returns:
+        int | None: RSS 總和（bytes），無法取得時回傳 None
+    """
+    pid = pid or os.getpid()
+
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+
+    if psutil:
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+            return sum(process.memory_info().rss for process in processes if process.is_running())
+        except psutil.Error:
+            return None
+
+    proc = Path("/proc")
+    if not proc.exists():
+        return None
+
+    # 建立 ppid -> pid 對照表後找出所有子孫行程
+    children = {}
+    rss = {}
+    for status_file in proc.glob("[0-9]*/status"):
+        try:
+            fields = dict(
+                line.split(":", 1) for line in status_file.read_text().splitlines() if ":" in line
+            )
+        except OSError:
+            continue
+        child_pid = int(status_file.parent.name)
+        children.setdefault(int(fields.get("PPid", "0").strip()), []).append(child_pid)
+        # VmRSS 單位為 kB（核心執行緒沒有這個欄位）
+        rss[child_pid] = int(fields.get("VmRSS", "0 kB").split()[0]) * 1024
+
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        total += rss.get(current, 0)
+        pending.extend(children.get(current, []))
+    return total
+
+
+class PeakRssSampler:
+    """在背景定期取樣行程樹的 RSS，記錄峰值"""
+
+    def __init__(self, interval: float = 0.1):
+        """
+        初始化
+
+        Args:
+            interval: 取樣間隔（秒）
+        """
+        self.interval = interval
+        self.peak = None
+        self._task = None
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._sample())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._record()
+
+    async def _sample(self) -> None:
+        """定期取樣"""
+        while True:
+            self._record()
+            await asyncio.sleep(self.interval)
+
+    def _record(self) -> None:
+        """取樣一次並更新峰值"""
+        rss = process_tree_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+
+def format_bytes(value: int | None) -> str:
+    """將 bytes 轉為 MB 字串"""
+    if value is None:
+        return "n/a"
+    return f"{value / 1024 / 1024:.1f} MB"
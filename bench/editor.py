@@ -0,0 +1,195 @@
+"""
+編輯器更新效能比較
+
+在真正的 SimpleMDE（CodeMirror）編輯器中比較整份取代（simplemde.value）與差異更新（replaceRange）
+對 10 KB、100 KB、1 MB 文件做小幅修改時的耗時。SimpleMDE 與 jQuery 由 CDN 載入，需要網路。
+
+使用範例:
+    python -m bench.editor
+    python -m bench.editor --engine webkit --rounds 10 --json editor.json
+"""
+import asyncio
+import json
+import statistics
+import sys
+import time
+
+import click
+from playwright.async_api import Page, async_playwright
+
+from ithome_bot.browser import BROWSER_NAMES, browser_options, launch_browser
+from ithome_bot.editor import MAX_CHANGED_RATIO, MAX_EDIT_DISTANCE, UPDATE_EDITOR
+
+DEFAULT_SIZES = (10 * 1024, 100 * 1024, 1024 * 1024)
+
+SIMPLEMDE_URL = "https://cdn.jsdelivr.net/npm/simplemde@1.11.2/dist"
+JQUERY_URL = "https://cdn.jsdelivr.net/npm/jquery@3.7.1/dist/jquery.min.js"
+
+EDITOR_PAGE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <link rel="stylesheet" href="{simplemde_url}/simplemde.min.css">
+    <script src="{jquery_url}"></script>
+    <script src="{simplemde_url}/simplemde.min.js"></script>
+</head>
+<body>
+    <textarea name="description"></textarea>
+    <script>
+        const textarea = document.querySelector('textarea[name="description"]');
+        $(textarea).data('simplemde', new SimpleMDE({{element: textarea, spellChecker: false}}));
+    </script>
+</body>
+</html>
+"""
+
+# 等待瀏覽器繪製完成（兩次 requestAnimationFrame）
+WAIT_FOR_PAINT = "() => new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)))"
+
+
+def build_document(base: str, size: int) -> str:
+    """重複文章內容直到接近指定大小（位元組）"""
+    sections = []
+    total = 0
+    index = 0
+    while total < size:
+        section = f"## 第 {index + 1} 節\n\n{base}\n"
+        sections.append(section)
+        total += len(section.encode('utf-8'))
+        index += 1
+    return "\n".join(sections)
+
+
+def small_edit(document: str) -> str:
+    """修改文件中間的一行並在結尾加上一段，模擬小幅修改"""
+    lines = document.split("\n")
+    middle = len(lines) // 2
+    lines[middle] = lines[middle] + "（已修改）"
+    lines.append("<!-- 更新 -->")
+    return "\n".join(lines)
+
+
+async def _measure(page: Page, document: str, edited: str, incremental: bool, rounds: int) -> tuple[list[float], str]:
+    """
+    量測從 document 更新為 edited 的耗時
+
+    Returns:
+        tuple[list[float], str]: 每輪耗時（秒）與最後一次的更新模式
+    """
+    durations = []
+    mode = None
+    for _ in range(rounds):
+        # 重設為原始內容（不計時）
+        await page.evaluate(UPDATE_EDITOR, [document, False, MAX_EDIT_DISTANCE, MAX_CHANGED_RATIO])
+        await page.evaluate(WAIT_FOR_PAINT)
+
+        started = time.perf_counter()
+        result = await page.evaluate(UPDATE_EDITOR, [edited, incremental, MAX_EDIT_DISTANCE, MAX_CHANGED_RATIO])
+        await page.evaluate(WAIT_FOR_PAINT)
+        durations.append(time.perf_counter() - started)
+        mode = result['mode']
+    return durations, mode
+
+
+async def bench_editor(
+    engine: str, sizes: tuple, rounds: int, base: str, options: dict, simplemde_url: str, jquery_url: str
+) -> list[dict]:
+    """
+    在指定的瀏覽器引擎上比較整份取代與差異更新
+
+    Args:
+        engine: 瀏覽器引擎
+        sizes: 文件大小（位元組）
+        rounds: 每種模式的重複次數
+        base: 用來組成文件的文章內容
+        options: 瀏覽器啟動選項
+        simplemde_url: SimpleMDE dist 目錄的網址
+        jquery_url: jQuery 的網址
+
+    Returns:
+        list[dict]: 每個文件大小的測試結果
+    """
+    playwright = await async_playwright().start()
+    browser = await launch_browser(playwright, {**options, "browser": engine})
+    results = []
+    try:
+        page = await browser.new_page()
+        await page.set_content(EDITOR_PAGE.format(simplemde_url=simplemde_url, jquery_url=jquery_url))
+        await page.wait_for_function("() => window.jQuery && window.SimpleMDE")
+
+        for size in sizes:
+            document = build_document(base, size)
+            edited = small_edit(document)
+            full, _ = await _measure(page, document, edited, False, rounds)
+            incremental, mode = await _measure(page, document, edited, True, rounds)
+            results.append({
+                "engine": engine,
+                "size": len(document.encode('utf-8')),
+                "full_median": statistics.median(full),
+                "incremental_median": statistics.median(incremental),
+                "incremental_mode": mode,
+            })
+    finally:
+        await browser.close()
+        await playwright.stop()
+    return results
+
+
+def _format_size(size: int) -> str:
+    if size >= 1024 * 1024:
+        return f"{size / 1024 / 1024:.1f} MB"
+    return f"{size / 1024:.0f} KB"
+
+
+@click.command()
+@click.option('--engine', 'engines', multiple=True, type=click.Choice(BROWSER_NAMES), help='要測試的瀏覽器引擎（預設全部）')
+@click.option('--size', 'sizes', multiple=True, type=click.IntRange(min=1), help='文件大小（位元組，可重複指定；預設 10 KB、100 KB、1 MB）')
+@click.option('--rounds', default=5, show_default=True, type=click.IntRange(min=1), help='每種模式的重複次數（取中位數）')
+@click.option('--description-file', type=click.Path(exists=True), help='用來組成文件的文章內容（預設使用測試用文章）')
+@click.option('--simplemde-url', default=SIMPLEMDE_URL, show_default=True, help='SimpleMDE dist 目錄的網址')
+@click.option('--jquery-url', default=JQUERY_URL, show_default=True, help='jQuery 的網址')
+@click.option('--headless/--headed', default=True, show_default=True, help='是否使用無頭模式')
+@click.option('--json', 'json_file', type=click.Path(), help='將結果寫入 JSON 檔案')
+def main(
+    engines: tuple, sizes: tuple, rounds: int, description_file: str, simplemde_url: str, jquery_url: str,
+    headless: bool, json_file: str
+):
+    """比較整份取代與差異更新編輯器內容的效能"""
+    if description_file is None:
+        description_file = "tests/fixtures/day01-python-environment-setup.md"
+    with open(description_file, 'r', encoding='utf-8') as f:
+        base = f.read()
+
+    options = browser_options(headless=headless)
+    results = []
+    for engine in engines or BROWSER_NAMES:
+        click.echo(f"🚀 測試 {engine}...")
+        try:
+            results.extend(asyncio.run(bench_editor(
+                engine, sizes or DEFAULT_SIZES, rounds, base, options, simplemde_url, jquery_url
+            )))
+        except Exception as e:
+            click.echo(f"❌ {engine} 測試失敗: {e}")
+
+    click.echo("=" * 64)
+    click.echo(f"{'引擎':<10}{'大小':>10}{'整份取代 (秒)':>16}{'差異更新 (秒)':>16}{'加速':>8}")
+    for result in results:
+        speedup = result['full_median'] / result['incremental_median'] if result['incremental_median'] else 0
+        click.echo(
+            f"{result['engine']:<10}{_format_size(result['size']):>10}{result['full_median']:>16.3f}"
+            f"{result['incremental_median']:>16.3f}{speedup:>7.1f}x"
+        )
+        if result['incremental_mode'] != "incremental":
+            click.echo(f"⚠️ {result['engine']} {_format_size(result['size'])}: 差異更新改用 {result['incremental_mode']}")
+
+    if json_file:
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        click.echo(f"💾 結果已寫入 {json_file}")
+
+    sys.exit(0 if results else 1)
+
+
+if __name__ == "__main__":
+    main()
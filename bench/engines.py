@@ -0,0 +1,121 @@
+"""
+瀏覽器引擎效能比較
+
+在各個瀏覽器引擎上執行相同的文章更新流程，比較啟動時間、每篇文章耗時與記憶體峰值。
+iThome 的頁面由本機的替身伺服器（ithome_bot.standin）模擬，不需要網路與帳號。
+
+使用範例:
+    python -m bench.engines
+    python -m bench.engines --engine chromium --engine webkit --articles 10 --json engines.json
+"""
+import asyncio
+import json
+import statistics
+import sys
+import time
+
+import click
+from playwright.async_api import async_playwright
+
+from ithome_bot.article_updater import ArticleUpdater
+from ithome_bot.authenticator import Authenticator
+from ithome_bot.browser import BROWSER_NAMES, browser_options, launch_browser
+from ithome_bot.standin import STANDIN_ACCOUNT, STANDIN_PASSWORD, StandInServer
+
+from .common import PeakRssSampler, format_bytes
+
+
+async def bench_engine(engine: str, articles: int, description: str, options: dict) -> dict:
+    """
+    在指定的瀏覽器引擎上執行更新流程
+
+    Args:
+        engine: 瀏覽器引擎
+        articles: 更新的文章篇數
+        description: 文章內容
+        options: 瀏覽器啟動選項
+
+    Returns:
+        dict: 測試結果
+    """
+    per_article = []
+
+    with StandInServer() as server:
+        article_id = server.add_article()
+
+        async with PeakRssSampler() as sampler:
+            started = time.perf_counter()
+            playwright = await async_playwright().start()
+            browser = await launch_browser(playwright, {**options, "browser": engine})
+            launch_time = time.perf_counter() - started
+
+            try:
+                context = await browser.new_context()
+                page = await context.new_page()
+                if not await Authenticator(page, server.base_url, server.login_url).login(STANDIN_ACCOUNT, STANDIN_PASSWORD):
+                    raise RuntimeError(f"{engine}: 登入替身伺服器失敗")
+                updater = ArticleUpdater(page, base_url=server.base_url)
+
+                for index in range(articles):
+                    article_started = time.perf_counter()
+                    result = await updater.update({
+                        "article_id": article_id,
+                        "subject": f"[Day {index + 1:02d}] 效能測試",
+                        "description": f"{description}\n\n<!-- {index} -->",
+                    })
+                    if result != article_id:
+                        raise RuntimeError(f"{engine}: 第 {index + 1} 篇更新失敗")
+                    per_article.append(time.perf_counter() - article_started)
+            finally:
+                await browser.close()
+                await playwright.stop()
+
+    return {
+        "engine": engine,
+        "launch_time": launch_time,
+        "article_time_mean": statistics.mean(per_article),
+        "article_time_median": statistics.median(per_article),
+        "peak_rss": sampler.peak,
+    }
+
+
+@click.command()
+@click.option('--engine', 'engines', multiple=True, type=click.Choice(BROWSER_NAMES), help='要測試的瀏覽器引擎（預設全部）')
+@click.option('--articles', default=5, show_default=True, type=click.IntRange(min=1), help='每個引擎更新的文章篇數')
+@click.option('--description-file', type=click.Path(exists=True), help='文章內容檔案（預設使用測試用文章）')
+@click.option('--headless/--headed', default=True, show_default=True, help='是否使用無頭模式')
+@click.option('--json', 'json_file', type=click.Path(), help='將結果寫入 JSON 檔案')
+def main(engines: tuple, articles: int, description_file: str, headless: bool, json_file: str):
+    """比較各瀏覽器引擎執行文章更新流程的效能"""
+    if description_file is None:
+        description_file = "tests/fixtures/day01-python-environment-setup.md"
+    with open(description_file, 'r', encoding='utf-8') as f:
+        description = f.read()
+
+    options = browser_options(headless=headless)
+    results = []
+    for engine in engines or BROWSER_NAMES:
+        click.echo(f"🚀 測試 {engine}...")
+        try:
+            results.append(asyncio.run(bench_engine(engine, articles, description, options)))
+        except Exception as e:
+            click.echo(f"❌ {engine} 測試失敗: {e}")
+
+    click.echo("=" * 64)
+    click.echo(f"{'引擎':<10}{'啟動 (秒)':>12}{'每篇平均 (秒)':>16}{'每篇中位數 (秒)':>18}{'記憶體峰值':>12}")
+    for result in results:
+        click.echo(
+            f"{result['engine']:<10}{result['launch_time']:>12.3f}{result['article_time_mean']:>16.3f}"
+            f"{result['article_time_median']:>18.3f}{format_bytes(result['peak_rss']):>12}"
+        )
+
+    if json_file:
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        click.echo(f"💾 結果已寫入 {json_file}")
+
+    sys.exit(0 if results else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,473 @@
+"""
+端到端效能測試
+
+在本機替身伺服器上量測各階段的效能，結果寫入 JSON，
+並可與先前的結果比較，任何階段退步超過門檻時以非零狀態結束（適合在發行前或 CI 中執行）。
+
+量測階段:
+    - cold_start: 在新的 Python 行程中 import 並啟動瀏覽器
+    - login_fresh: 沒有 cookies 時以帳密登入
+    - login_saved: 以已儲存的登入狀態登入
+    - single_update: 更新單篇文章
+    - single_create: 建立單篇文章
+    - batch_throughput: 批次更新的吞吐量（篇/分鐘）
+    - memory_growth: 同一個 Page 連續更新後的記憶體成長
+
+使用範例:
+    python -m bench.run run --json baseline.json
+    python -m bench.run run --json current.json --baseline baseline.json --threshold 10
+    python -m bench.run compare baseline.json current.json --threshold 10 --stage-threshold memory_growth=50
+"""
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+
+import click
+from playwright.async_api import Browser, async_playwright
+
+from ithome_bot.article_creator import ArticleCreator
+from ithome_bot.article_updater import ArticleUpdater
+from ithome_bot.authenticator import Authenticator
+from ithome_bot.batch import BatchRunner
+from ithome_bot.browser import BROWSER_NAMES, browser_options, launch_browser
+from ithome_bot.client import Client
+from ithome_bot.standin import STANDIN_ACCOUNT, STANDIN_PASSWORD, StandInServer
+
+from .common import format_bytes, process_tree_rss
+
+# 各階段的單位與方向（higher_is_better 為 True 時數值越大越好）
+STAGES = {
+    "cold_start": {"unit": "s", "higher_is_better": False},
+    "login_fresh": {"unit": "s", "higher_is_better": False},
+    "login_saved": {"unit": "s", "higher_is_better": False},
+    "single_update": {"unit": "s", "higher_is_better": False},
+    "single_create": {"unit": "s", "higher_is_better": False},
+    "batch_throughput": {"unit": "articles/min", "higher_is_better": True},
+    "memory_growth": {"unit": "bytes", "higher_is_better": False},
+}
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 在新的行程中量測 import 與啟動瀏覽器的時間
+COLD_START_SCRIPT = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+import ithome_bot
+from ithome_bot.browser import launch_browser
+from playwright.async_api import async_playwright
+imported = time.perf_counter()
+
+async def launch():
+    playwright = await async_playwright().start()
+    browser = await launch_browser(playwright, json.loads(sys.argv[1]))
+    launched = time.perf_counter()
+    await browser.close()
+    await playwright.stop()
+    return launched
+
+launched = asyncio.run(launch())
+print(json.dumps({"import": imported - started, "launch": launched - imported}))
+"""
+
+
+def measure_cold_start(options: dict) -> dict:
+    """
+    在新的 Python 行程中量測 import 與啟動瀏覽器的時間
+
+    Args:
+        options: 瀏覽器啟動選項
+
+    Returns:
+        dict: 包含 import 與 launch 的秒數
+    """
+    completed = subprocess.run(
+        [sys.executable, "-c", COLD_START_SCRIPT, json.dumps(options)],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+class Suite:
+    """在替身伺服器上執行各階段的量測"""
+
+    def __init__(
+        self,
+        server: StandInServer,
+        browser: Browser,
+        description: str,
+        batch_articles: int = 20,
+        concurrency: int = 1,
+        memory_updates: int = 100,
+        fast_fill: bool = False
+    ):
+        """
+        初始化
+
+        Args:
+            server: 已啟動的替身伺服器
+            browser: 已啟動的瀏覽器
+            description: 文章內容
+            batch_articles: 批次階段的文章篇數
+            concurrency: 批次階段同時處理的文章數量
+            memory_updates: 記憶體階段連續更新的次數
+            fast_fill: 是否在一次頁面呼叫中設定並驗證標題與內容
+        """
+        self.server = server
+        self.browser = browser
+        self.description = description
+        self.batch_articles = batch_articles
+        self.concurrency = concurrency
+        self.memory_updates = memory_updates
+        self.fast_fill = fast_fill
+        self.storage_state = None
+        self._counter = 0
+
+    async def login_fresh(self) -> float:
+        """沒有 cookies 時以帳密登入"""
+        context = await self.browser.new_context()
+        try:
+            page = await context.new_page()
+            started = time.perf_counter()
+            await self._login(page)
+            elapsed = time.perf_counter() - started
+            self.storage_state = await context.storage_state()
+            return elapsed
+        finally:
+            await context.close()
+
+    async def login_saved(self) -> float:
+        """以已儲存的登入狀態登入"""
+        context = await self.browser.new_context(storage_state=self.storage_state)
+        try:
+            page = await context.new_page()
+            started = time.perf_counter()
+            await self._login(page)
+            return time.perf_counter() - started
+        finally:
+            await context.close()
+
+    async def single_update(self) -> float:
+        """更新單篇文章"""
+        article_id = self.server.add_article("舊標題", "舊內容")
+        async with self._logged_in_page() as page:
+            started = time.perf_counter()
+            result = await ArticleUpdater(page, base_url=self.server.base_url, fast_fill=self.fast_fill).update(self._article(article_id=article_id))
+            elapsed = time.perf_counter() - started
+        self._check(result, "更新文章")
+        return elapsed
+
+    async def single_create(self) -> float:
+        """建立單篇文章"""
+        category_id = next(iter(self.server.series))
+        async with self._logged_in_page() as page:
+            started = time.perf_counter()
+            result = await ArticleCreator(page, base_url=self.server.base_url, fast_fill=self.fast_fill).create(self._article(category_id=category_id))
+            elapsed = time.perf_counter() - started
+        self._check(result, "建立文章")
+        return elapsed
+
+    async def batch_throughput(self) -> float:
+        """批次更新的吞吐量（篇/分鐘）"""
+        articles = [
+            self._article(article_id=self.server.add_article("舊標題", "舊內容"))
+            for _ in range(self.batch_articles)
+        ]
+        async with self._logged_in_page() as page:
+            client = Client(page, base_url=self.server.base_url, login_url=self.server.login_url, fast_fill=self.fast_fill)
+            started = time.perf_counter()
+            results = await BatchRunner(client, self.concurrency).run(articles)
+            elapsed = time.perf_counter() - started
+
+        failed = [result for result in results if not result['success']]
+        if failed:
+            raise RuntimeError(f"批次更新失敗 {len(failed)} 篇")
+        return len(articles) / elapsed * 60
+
+    async def memory_growth(self) -> dict:
+        """同一個 Page 連續更新後的記憶體成長"""
+        article_id = self.server.add_article("舊標題", "舊內容")
+        async with self._logged_in_page() as page:
+            updater = ArticleUpdater(page, base_url=self.server.base_url, fast_fill=self.fast_fill)
+
+            # 先更新一次，排除第一次載入的成本
+            self._check(await updater.update(self._article(article_id=article_id)), "更新文章")
+            before = process_tree_rss()
+
+            started = time.perf_counter()
+            for _ in range(self.memory_updates):
+                self._check(await updater.update(self._article(article_id=article_id)), "更新文章")
+            elapsed = time.perf_counter() - started
+            after = process_tree_rss()
+
+        return {
+            "growth": (after - before) if before is not None and after is not None else None,
+            "before": before,
+            "after": after,
+            "update_time_mean": elapsed / self.memory_updates,
+        }
+
+    async def _login(self, page) -> None:
+        authenticator = Authenticator(page, self.server.base_url, self.server.login_url)
+        if not await authenticator.login(STANDIN_ACCOUNT, STANDIN_PASSWORD):
+            raise RuntimeError("登入替身伺服器失敗")
+
+    @asynccontextmanager
+    async def _logged_in_page(self):
+        """以已儲存的登入狀態開啟新的 Page"""
+        context = await self.browser.new_context(storage_state=self.storage_state)
+        try:
+            yield await context.new_page()
+        finally:
+            await context.close()
+
+    def _article(self, **target) -> dict:
+        """產生每次內容都不同的文章資料"""
+        self._counter += 1
+        return {
+            **target,
+            "subject": f"[Day {self._counter:03d}] 效能測試",
+            "description": f"{self.description}\n\n<!-- {self._counter} -->",
+        }
+
+    @staticmethod
+    def _check(result: str | None, action: str) -> None:
+        if result is None:
+            raise RuntimeError(f"{action}失敗")
+
+
+async def run_suite(
+    options: dict,
+    description: str,
+    rounds: int,
+    batch_articles: int,
+    concurrency: int,
+    memory_updates: int,
+    latency: float,
+    fast_fill: bool = False
+) -> dict:
+    """
+    執行所有階段並回傳結果
+
+    Returns:
+        dict: 包含 meta 與 stages 的結果
+    """
+    stages = {}
+
+    def record(name: str, samples: list, details: dict | None = None) -> None:
+        stages[name] = {
+            **STAGES[name],
+            "value": statistics.median(samples),
+            "samples": samples,
+        }
+        if details:
+            stages[name]['details'] = details
+        click.echo(f"  {name:<18}{_format_value(name, stages[name]['value'])}")
+
+    cold_starts = [measure_cold_start(options) for _ in range(rounds)]
+    record("cold_start", [sample['import'] + sample['launch'] for sample in cold_starts], {
+        "import": statistics.median(sample['import'] for sample in cold_starts),
+        "launch": statistics.median(sample['launch'] for sample in cold_starts),
+    })
+
+    with StandInServer(latency=latency) as server:
+        playwright = await async_playwright().start()
+        browser = await launch_browser(playwright, options)
+        try:
+            suite = Suite(server, browser, description, batch_articles, concurrency, memory_updates, fast_fill)
+            for name in ("login_fresh", "login_saved", "single_update", "single_create"):
+                record(name, [await getattr(suite, name)() for _ in range(rounds)])
+
+            record("batch_throughput", [await suite.batch_throughput()], {
+                "articles": batch_articles,
+                "concurrency": concurrency,
+            })
+
+            memory = await suite.memory_growth()
+            if memory['growth'] is None:
+                click.echo("  memory_growth     無法取得記憶體用量，略過")
+            else:
+                record("memory_growth", [memory['growth']], {**memory, "updates": memory_updates})
+        finally:
+            await browser.close()
+            await playwright.stop()
+
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "browser": options['browser'],
+            "headless": options['headless'],
+            "rounds": rounds,
+            "latency": latency,
+            "fast_fill": fast_fill,
+        },
+        "stages": stages,
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float, stage_thresholds: dict | None = None) -> list[dict]:
+    """
+    比較兩次結果
+
+    Args:
+        baseline: 基準結果
+        current: 本次結果
+        threshold: 預設的退步門檻（百分比）
+        stage_thresholds: 個別階段的退步門檻 {階段: 百分比}
+
+    Returns:
+        list[dict]: 每個階段的比較結果，包含 stage、baseline、current、change（百分比，正數表示退步）、regressed
+    """
+    stage_thresholds = stage_thresholds or {}
+    rows = []
+    for name, current_stage in current['stages'].items():
+        baseline_stage = baseline['stages'].get(name)
+        if baseline_stage is None:
+            continue
+
+        base = baseline_stage['value']
+        value = current_stage['value']
+        if base:
+            change = (value - base) / abs(base) * 100
+        else:
+            change = 0.0 if value == base else float("inf")
+        if current_stage.get('higher_is_better'):
+            change = -change
+
+        limit = stage_thresholds.get(name, threshold)
+        rows.append({
+            "stage": name,
+            "baseline": base,
+            "current": value,
+            "change": change,
+            "threshold": limit,
+            "regressed": change > limit,
+        })
+    return rows
+
+
+def _format_value(name: str, value: float) -> str:
+    unit = STAGES.get(name, {}).get("unit")
+    if unit == "bytes":
+        return format_bytes(value)
+    if unit == "s":
+        return f"{value:.3f} 秒"
+    return f"{value:.1f} {unit}"
+
+
+def _print_comparison(rows: list[dict]) -> bool:
+    """
+    輸出比較結果
+
+    Returns:
+        bool: 是否沒有任何階段退步
+    """
+    click.echo("=" * 72)
+    click.echo(f"{'階段':<18}{'基準':>14}{'本次':>14}{'變化':>10}{'門檻':>8}")
+    for row in rows:
+        mark = "❌" if row['regressed'] else "✅"
+        click.echo(
+            f"{row['stage']:<18}{_format_value(row['stage'], row['baseline']):>14}"
+            f"{_format_value(row['stage'], row['current']):>14}{row['change']:>+9.1f}%{row['threshold']:>7.0f}% {mark}"
+        )
+
+    regressed = [row['stage'] for row in rows if row['regressed']]
+    if regressed:
+        click.echo(f"❌ 效能退步: {', '.join(regressed)}")
+    else:
+        click.echo("✅ 沒有階段超過退步門檻")
+    return not regressed
+
+
+def _parse_stage_thresholds(values: tuple) -> dict:
+    """解析 --stage-threshold name=percent"""
+    thresholds = {}
+    for value in values:
+        name, _, percent = value.partition("=")
+        if name not in STAGES or not percent:
+            raise click.BadParameter(f"格式應為 階段=百分比（可用階段: {', '.join(STAGES)}）: {value}")
+        thresholds[name] = float(percent)
+    return thresholds
+
+
+def _load_results(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _threshold_options(command):
+    """為命令加上退步門檻相關的選項"""
+    command = click.option(
+        '--stage-threshold', multiple=True, help='個別階段的退步門檻，格式為 階段=百分比（可重複指定）'
+    )(command)
+    command = click.option('--threshold', default=10.0, show_default=True, type=float, help='退步門檻（百分比）')(command)
+    return command
+
+
+@click.group()
+def main():
+    """iThome Bot 端到端效能測試"""
+
+
+@main.command()
+@click.option('--browser', type=click.Choice(BROWSER_NAMES), help='瀏覽器引擎（預設從 ITHOME_BROWSER 讀取）')
+@click.option('--headless/--headed', default=True, show_default=True, help='是否使用無頭模式')
+@click.option('--rounds', default=3, show_default=True, type=click.IntRange(min=1), help='計時階段的重複次數（取中位數）')
+@click.option('--batch-articles', default=20, show_default=True, type=click.IntRange(min=1), help='批次階段的文章篇數')
+@click.option('--concurrency', default=1, show_default=True, type=click.IntRange(min=1), help='批次階段同時處理的文章數量')
+@click.option('--memory-updates', default=100, show_default=True, type=click.IntRange(min=1), help='記憶體階段連續更新的次數')
+@click.option('--latency', default=0.0, show_default=True, type=float, help='替身伺服器每個回應的延遲（秒）')
+@click.option('--fast-fill', is_flag=True, help='在一次頁面呼叫中設定並驗證標題與內容')
+@click.option('--description-file', type=click.Path(exists=True), help='文章內容檔案（預設使用測試用文章）')
+@click.option('--json', 'json_file', type=click.Path(), help='將結果寫入 JSON 檔案')
+@click.option('--baseline', type=click.Path(exists=True), help='與基準結果比較，退步超過門檻時以非零狀態結束')
+@_threshold_options
+def run(
+    browser: str, headless: bool, rounds: int, batch_articles: int, concurrency: int, memory_updates: int,
+    latency: float, fast_fill: bool, description_file: str, json_file: str, baseline: str, threshold: float, stage_threshold: tuple
+):
+    """執行所有階段的量測"""
+    stage_thresholds = _parse_stage_thresholds(stage_threshold)
+    if description_file is None:
+        description_file = PROJECT_ROOT / "tests/fixtures/day01-python-environment-setup.md"
+    with open(description_file, 'r', encoding='utf-8') as f:
+        description = f.read()
+
+    options = browser_options(browser=browser, headless=headless)
+    click.echo(f"🚀 效能測試（{options['browser']}）...")
+    results = asyncio.run(run_suite(
+        options, description, rounds, batch_articles, concurrency, memory_updates, latency, fast_fill
+    ))
+
+    if json_file:
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        click.echo(f"💾 結果已寫入 {json_file}")
+
+    if baseline:
+        rows = compare_results(_load_results(baseline), results, threshold, stage_thresholds)
+        sys.exit(0 if _print_comparison(rows) else 1)
+
+
+@main.command()
+@click.argument('baseline_file', type=click.Path(exists=True))
+@click.argument('current_file', type=click.Path(exists=True))
+@_threshold_options
+def compare(baseline_file: str, current_file: str, threshold: float, stage_threshold: tuple):
+    """比較兩次量測結果，任何階段退步超過門檻時以非零狀態結束"""
+    rows = compare_results(
+        _load_results(baseline_file), _load_results(current_file), threshold, _parse_stage_thresholds(stage_threshold)
+    )
+    sys.exit(0 if _print_comparison(rows) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,14 @@ from .client import Client
 from .authenticator import Authenticator
 from .article_updater import ArticleUpdater
 from .recaptcha import ReCaptcha
+from .timing import Span, add_span_listener, remove_span_listener
 
 __all__ = [
     "Client",
     "Authenticator",
     "ArticleUpdater",
     "ReCaptcha",
+    "Span",
+    "add_span_listener",
+    "remove_span_listener",
 ]
\ No newline at end of file
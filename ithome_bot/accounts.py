@@ -0,0 +1,171 @@
+"""
+多帳號排程模組
+
+多個帳號共用同一個瀏覽器行程，每個帳號使用獨立的 BrowserContext 與登入狀態檔案，
+文章依 account 欄位分配到對應帳號的 context，各帳號同時處理。
+"""
+import asyncio
+import os
+from pathlib import Path
+
+from playwright.async_api import Browser
+
+from .article_state import ArticleState
+from .batch import BatchRunner, load_data_file
+from .client import Client
+from .request_filter import RequestFilter
+
+
+def load_accounts(accounts_file: str) -> list[dict]:
+    """
+    讀取帳號清單（YAML 或 JSON）
+
+    清單可以是帳號列表，或包含 accounts 欄位的物件，每個帳號包含:
+        - account: iThome 帳號
+        - password: 密碼，或 password_env: 存放密碼的環境變數名稱
+        - name: 帳號名稱（可選，預設同 account，文章以此指定帳號）
+        - cookies_file: 登入狀態檔案（可選，相對於清單檔案，預設為 cookies-<name>.txt）
+
+    Args:
+        accounts_file: 帳號清單檔案路徑
+
+    Returns:
+        list[dict]: 帳號列表，包含 name、account、password、cookies_file
+
+    Raises:
+        ValueError: 清單格式錯誤、名稱重複或缺少密碼
+    """
+    accounts_path = Path(accounts_file)
+    data = load_data_file(accounts_path)
+
+    if isinstance(data, dict):
+        data = data.get('accounts')
+    if not isinstance(data, list) or not data:
+        raise ValueError("帳號清單格式錯誤：需要帳號列表或包含 accounts 欄位的物件")
+
+    accounts = []
+    names = set()
+    for index, entry in enumerate(data, start=1):
+        if not isinstance(entry, dict) or not entry.get('account'):
+            raise ValueError(f"第 {index} 個帳號：缺少 account")
+
+        name = str(entry.get('name') or entry['account'])
+        if name in names:
+            raise ValueError(f"第 {index} 個帳號：名稱 {name} 重複")
+        names.add(name)
+
+        password = entry.get('password')
+        if not password and entry.get('password_env'):
+            password = os.getenv(entry['password_env'])
+        if not password:
+            raise ValueError(f"第 {index} 個帳號（{name}）：缺少 password 或 password_env 環境變數未設定")
+
+        accounts.append({
+            "name": name,
+            "account": str(entry['account']),
+            "password": str(password),
+            "cookies_file": str(accounts_path.parent / entry.get('cookies_file', f"cookies-{name}.txt")),
+        })
+    return accounts
+
+
+class AccountScheduler:
+    """多帳號排程器：在同一個瀏覽器中為每個帳號建立獨立的 BrowserContext"""
+
+    def __init__(
+        self,
+        browser: Browser,
+        accounts: list[dict],
+        state: ArticleState | None = None,
+        concurrency: int = 1,
+        request_filter: RequestFilter | None = None,
+        client_options: dict | None = None
+    ):
+        """
+        初始化
+
+        Args:
+            browser: 共用的 Playwright Browser
+            accounts: 帳號列表（load_accounts 的回傳值），第一個帳號為預設帳號
+            state: 文章推送狀態（可選）
+            concurrency: 每個帳號同時處理的文章數量
+            request_filter: 網路請求過濾器（可選，安裝到每個帳號的 context）
+            client_options: 建立 Client 時的其他參數（例如 escalation、artifacts、fast_fill）
+        """
+        self.browser = browser
+        self.accounts = {account['name']: account for account in accounts}
+        self.default_account = accounts[0]['name']
+        self.state = state
+        self.concurrency = concurrency
+        self.request_filter = request_filter
+        self.client_options = client_options or {}
+
+    def route(self, articles: list[dict]) -> dict[str, list[int]]:
+        """
+        依文章的 account 欄位分組（未指定時使用預設帳號）
+
+        Args:
+            articles: 文章資料列表
+
+        Returns:
+            dict: {帳號名稱: [文章索引]}（包含不存在的帳號名稱）
+        """
+        groups = {}
+        for index, article_data in enumerate(articles):
+            groups.setdefault(article_data.get('account') or self.default_account, []).append(index)
+        return groups
+
+    async def run(self, articles: list[dict], force: bool = False) -> list[dict]:
+        """
+        各帳號同時更新或建立文章
+
+        單一帳號登入失敗或單篇文章失敗不會影響其他帳號與文章
+
+        Args:
+            articles: 文章資料列表（account 欄位指定帳號名稱）
+            force: 是否忽略推送狀態，強制更新
+
+        Returns:
+            list[dict]: 每篇文章的執行結果（與輸入順序相同，格式同 BatchRunner，另含 account）
+        """
+        groups = self.route(articles)
+        results = [None] * len(articles)
+
+        async def run_group(name: str, indexes: list[int]) -> None:
+            group = [articles[index] for index in indexes]
+            if name not in self.accounts:
+                group_results = [BatchRunner._result(article, None, f"找不到帳號 {name}", 0.0) for article in group]
+            else:
+                try:
+                    group_results = await self._run_account(self.accounts[name], group, force)
+                except Exception as e:
+                    # 例如登入時導航逾時：只讓這個帳號的文章失敗
+                    group_results = [BatchRunner._result(article, None, str(e), 0.0) for article in group]
+
+            for index, result in zip(indexes, group_results):
+                results[index] = {**result, "account": name}
+
+        await asyncio.gather(*(run_group(name, indexes) for name, indexes in groups.items()))
+        return results
+
+    async def _run_account(self, account: dict, articles: list[dict], force: bool) -> list[dict]:
+        """在帳號專屬的 BrowserContext 中登入並處理文章"""
+        context = await self.browser.new_context()
+        try:
+            page = await context.new_page()
+            client = Client(page, account['cookies_file'], self.state, **self.client_options)
+            if self.request_filter:
+                await client.install_request_filter(self.request_filter)
+
+            await client.load_cookies()
+            if not await client.login(account['account'], account['password']):
+                return [BatchRunner._result(article, None, f"帳號 {account['name']} 登入失敗", 0.0) for article in articles]
+            await client.save_cookies()
+
+            results = await BatchRunner(client, self.concurrency).run(articles, force)
+
+            # 登入狀態有變更時才寫入檔案
+            await client.save_cookies()
+            return results
+        finally:
+            await context.close()
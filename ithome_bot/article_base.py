@@ -1,27 +1,112 @@
 """
 文章操作基類模組
 """
+import asyncio
 import re
+import sys
 from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+
 from playwright.async_api import Page
 
+from .article_state import ArticleState
+from .authenticator import ITHELP_URL
+from .editor import MAX_CHANGED_RATIO, MAX_EDIT_DISTANCE, SET_EDITOR_CONTENT, UPDATE_EDITOR
+from .escalation import HeadedEscalation
 from .recaptcha import ReCaptcha
+from .recovery import RetryPolicy, SubmitVerifier, VerificationUnknown
+from .timing import span, timed
+from .waiting import wait_for_condition, wait_for_locator
+
+# 判斷編輯器內容長度是否符合預期（長度以 UTF-16 code unit 計算，與 JavaScript 一致）
+EDITOR_LENGTH_MATCHES = """
+    (expectedLength) => {
+        const textarea = document.querySelector('textarea[name="description"]');
+        if (!textarea) {
+            return false;
+        }
+        const simplemde = window.jQuery ? $(textarea).data('simplemde') : null;
+        const value = simplemde ? simplemde.value() : textarea.value;
+        return value.length === expectedLength;
+    }
+"""
+
+# 在一次呼叫中設定標題與內容，並回傳頁面上實際的長度與 FNV-1a 雜湊值（以 UTF-16 code unit 計算）
+FILL_FORM = """
+    ([subject, description, incremental, maxEditDistance, maxChangedRatio]) => {
+""" + SET_EDITOR_CONTENT + """
+        const input = document.querySelector('input[name="subject"]');
+        const textarea = document.querySelector('textarea[name="description"]');
+        if (!input || !textarea) {
+            return null;
+        }
+
+        const fingerprint = (text) => {
+            let hash = 0x811c9dc5;
+            for (let i = 0; i < text.length; i++) {
+                hash = Math.imul(hash ^ text.charCodeAt(i), 0x01000193) >>> 0;
+            }
+            return {length: text.length, hash: hash};
+        };
+
+        // null 表示不設定該欄位
+        if (subject !== null) {
+            input.focus();
+            input.value = subject;
+            input.dispatchEvent(new Event('input', {bubbles: true}));
+            input.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+
+        if (description !== null) {
+            setEditorContent(textarea, description, incremental, maxEditDistance, maxChangedRatio);
+        }
+        const simplemde = window.jQuery ? $(textarea).data('simplemde') : null;
+
+        return {
+            subject: fingerprint(input.value),
+            description: fingerprint(simplemde ? simplemde.value() : textarea.value),
+        };
+    }
+"""
 
 
 class ArticleBase(ABC):
     """文章操作基類（抽象類別）"""
 
-    def __init__(self, page: Page):
+    def __init__(
+        self,
+        page: Page,
+        state: ArticleState | None = None,
+        escalation: HeadedEscalation | None = None,
+        base_url: str = ITHELP_URL,
+        fast_fill: bool = False,
+        incremental_editor: bool = False,
+        retry: RetryPolicy | None = None
+    ):
         """
         初始化文章操作基類
 
         Args:
             page: Playwright 頁面物件
+            state: 文章推送狀態（可選）
+            escalation: 需要人工處理 reCAPTCHA 時改用有畫面瀏覽器（可選，未提供時在目前頁面等待）
+            base_url: iThome 鐵人賽網站的網址（可改為本機替身伺服器）
+            fast_fill: 是否在一次呼叫中設定並驗證標題與內容（失敗時改用逐步設定）
+            incremental_editor: 是否只以 CodeMirror 的 replaceRange 更新變更的行（差異過大時整份取代）
+            retry: 提交結果不明時的確認與重試設定（預設確認後最多重試 2 次）
         """
         self.page = page
+        self.state = state
+        self.escalation = escalation
+        self.base_url = base_url.rstrip('/')
+        self.fast_fill = fast_fill
+        self.incremental_editor = incremental_editor
+        self.retry = retry or RetryPolicy()
+        self.verifier = SubmitVerifier(page, self.base_url)
         # 共用的 locators
         self.subject_input = page.locator('input[name="subject"]')
 
+    @timed()
     async def _set_subject(self, subject: str, clear_first: bool = False) -> None:
         """
         設定文章標題（共用方法）
@@ -49,6 +134,7 @@ class ArticleBase(ABC):
 
         # 已設定文章標題: {subject}
 
+    @timed()
     async def _set_description(self, description: str, clear_first: bool = False) -> None:
         """
         設定文章內容（共用方法）
@@ -62,53 +148,208 @@ class ArticleBase(ABC):
         # 模擬人類行為：在標題和內容之間的延遲
         # await self.page.wait_for_timeout(random.randint(800, 2000))
 
-        # SimpleMDE 編輯器需要特殊處理
-        if clear_first:
+        # SimpleMDE 編輯器需要特殊處理（差異更新需要保留目前的內容，不先清空）
+        if clear_first and not self.incremental_editor:
             await self._update_simplemde_content('')
-            await self.page.wait_for_timeout(300)
+            # 等待編輯器清空
+            await self._wait_for_condition(EDITOR_LENGTH_MATCHES, 0, timeout=1000)
 
         # 設定新內容
         await self._update_simplemde_content(description)
 
-        # 等待內容設定完成
-        await self.page.wait_for_timeout(1000)
+        # 等待編輯器內容長度與設定的內容一致（編輯器以 \n 儲存換行）
+        await self._wait_for_condition(
+            EDITOR_LENGTH_MATCHES, self._js_length(self._normalize_newlines(description)), timeout=3000
+        )
         # 已設定文章內容
     
-    async def _update_simplemde_content(self, content: str) -> None:
+    async def _fill(self, subject: str | None, description: str | None, clear_first: bool = False) -> None:
+        """
+        設定文章標題與內容（共用方法）
+
+        啟用 fast_fill 時先嘗試一次完成設定與驗證，失敗時改用逐步設定
+
+        Args:
+            subject: 文章標題（None 表示不設定）
+            description: 文章內容（None 表示不設定）
+            clear_first: 逐步設定時是否先清空內容
+        """
+        if self.fast_fill and await self._fill_form(subject, description):
+            return
+
+        if subject is not None:
+            await self._set_subject(subject, clear_first)
+        if description is not None:
+            await self._set_description(description, clear_first)
+
+    @timed()
+    async def _fill_form(self, subject: str | None, description: str | None) -> bool:
+        """
+        在一次頁面呼叫中設定標題與內容，並以頁面回傳的長度與雜湊值驗證
+
+        Args:
+            subject: 文章標題（None 表示不設定也不驗證）
+            description: 文章內容（None 表示不設定也不驗證）
+
+        Returns:
+            bool: 頁面上的標題與內容是否與預期一致
+        """
+        await self.subject_input.wait_for(state="visible", timeout=5000)
+        result = await self.page.evaluate(
+            FILL_FORM, [subject, description, self.incremental_editor, MAX_EDIT_DISTANCE, MAX_CHANGED_RATIO]
+        )
+        if not result:
+            return False
+
+        # 表單欄位會將換行統一為 \n
+        if subject is not None and result['subject'] != self._fingerprint(subject):
+            return False
+        if description is not None and result['description'] != self._fingerprint(self._normalize_newlines(description)):
+            return False
+        return True
+
+    @staticmethod
+    def _fingerprint(text: str) -> dict:
+        """
+        計算與 FILL_FORM 相同的長度與 FNV-1a 雜湊值（以 UTF-16 code unit 計算）
+
+        Args:
+            text: 字串
+
+        Returns:
+            dict: 包含 length 與 hash
+        """
+        encoding = 'utf-16-le' if sys.byteorder == 'little' else 'utf-16-be'
+        units = memoryview(text.encode(encoding)).cast('H')
+        value = 0x811c9dc5
+        for unit in units:
+            value = ((value ^ unit) * 0x01000193) & 0xffffffff
+        return {"length": len(units), "hash": value}
+
+    async def _wait_for_condition(self, expression: str, arg=None, timeout: int = 3000) -> bool:
+        """
+        等待頁面條件成立，逾時時直接繼續（共用方法）
+
+        Args:
+            expression: 回傳 truthy 值表示條件成立的 JavaScript 函式
+            arg: 傳給 expression 的參數
+            timeout: 等待條件的超時時間（毫秒）
+
+        Returns:
+            bool: 條件是否在超時前成立
+        """
+        return await wait_for_condition(self.page, expression, arg, timeout)
+
+    async def _wait_for_locator(self, locator, state: str = "visible", timeout: int = 3000) -> bool:
+        """
+        等待元素達到指定狀態，逾時時直接繼續（共用方法）
+
+        Args:
+            locator: 要等待的元素
+            state: 元素狀態（attached、detached、visible、hidden）
+            timeout: 等待狀態的超時時間（毫秒）
+
+        Returns:
+            bool: 元素是否在超時前達到指定狀態
+        """
+        return await wait_for_locator(self.page, locator, state, timeout)
+
+    @staticmethod
+    def _normalize_newlines(text: str) -> str:
+        """
+        將換行符號統一為 \\n（與編輯器儲存的內容相同）
+
+        Args:
+            text: 字串
+
+        Returns:
+            str: 換行為 \\n 的字串
+        """
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+
+    @staticmethod
+    def _js_length(text: str) -> int:
+        """
+        計算字串在 JavaScript 中的長度（UTF-16 code unit 數量）
+
+        Args:
+            text: 字串
+
+        Returns:
+            int: JavaScript 的 string.length
+        """
+        return len(text.encode('utf-16-le')) // 2
+
+    async def _read_form(self) -> dict:
+        """
+        讀取編輯頁面目前的標題與內容（共用方法）
+
+        Returns:
+            dict: 包含 subject 與 description 的字典
+        """
+        await self.subject_input.wait_for(state="visible", timeout=5000)
+
+        return await self.page.evaluate("""
+            () => {
+                const subject = document.querySelector('input[name="subject"]');
+                const textarea = document.querySelector('textarea[name="description"]');
+                const simplemde = textarea && window.jQuery ? $(textarea).data('simplemde') : null;
+
+                return {
+                    subject: subject ? subject.value : '',
+                    description: simplemde ? simplemde.value() : (textarea ? textarea.value : ''),
+                };
+            }
+        """)
+
+    @staticmethod
+    def _same_content(current: str, expected: str) -> bool:
+        """
+        比較編輯器內容與預期內容（忽略換行符號差異）
+
+        Args:
+            current: 頁面上目前的內容
+            expected: 預期的內容
+
+        Returns:
+            bool: 內容是否相同
+        """
+        return current.replace('\r\n', '\n') == expected.replace('\r\n', '\n')
+
+    async def _update_simplemde_content(self, content: str) -> dict:
         """
         更新 SimpleMDE 編輯器內容
+
+        優先使用 SimpleMDE API（會自動同步到 textarea），SimpleMDE 不存在時直接設定 textarea；
+        啟用 incremental_editor 時只更新變更的行
         
         Args:
             content: 要設定的內容（空字串表示清空）
+
+        Returns:
+            dict: 包含 mode（textarea、full、unchanged 或 incremental）與 hunks（更新的區塊數）
         """
-        await self.page.evaluate("""
-            (content) => {
-                const textarea = document.querySelector('textarea[name="description"]');
-                const simplemde = $(textarea).data('simplemde');
-                
-                // 優先使用 SimpleMDE API，它會自動同步到 textarea
-                if (simplemde) {
-                    simplemde.value(content);
-                } else {
-                    // 如果 SimpleMDE 不存在，直接設定 textarea
-                    textarea.value = content;
-                }
-            }
-        """, content)
+        return await self.page.evaluate(
+            UPDATE_EDITOR, [content, self.incremental_editor, MAX_EDIT_DISTANCE, MAX_CHANGED_RATIO]
+        )
 
+    @timed()
     async def _handle_recaptcha(self) -> bool:
         """
         處理 reCAPTCHA（共用方法）
 
         Returns:
-            bool: 是否成功處理
+            bool: 是否成功處理（需要改用有畫面瀏覽器處理時回傳 False）
         """
         recaptcha = ReCaptcha(self.page)
         recaptcha_handled = await recaptcha.handle_recaptcha()
 
         if not recaptcha_handled:
+            # 無頭模式無法手動處理，交給 escalation 改用有畫面的瀏覽器
+            if self.escalation:
+                return False
+
             # 自動處理 reCAPTCHA 失敗，切換到手動模式
-            # 固定顯示瀏覽器，可以手動處理
             await recaptcha.wait_for_manual_recaptcha()
 
         return True
@@ -127,18 +368,103 @@ class ArticleBase(ABC):
 
         # 處理 reCAPTCHA
         if not await self._handle_recaptcha():
-            return None
+            if self.escalation is None:
+                return None
+            # 需要人工操作：在有畫面的瀏覽器完成提交並取回結果
+            return await self.escalation.submit(self)
 
         # 執行具體的提交動作（由子類實作）
-        await self._perform_submit_action()
+        with span(f"{type(self).__name__}._perform_submit_action"):
+            await self._perform_submit_action()
 
         # 等待頁面跳轉（由子類實作）
-        if await self._wait_for_submit_redirect():
+        with span(f"{type(self).__name__}._wait_for_submit_redirect"):
+            redirected = await self._wait_for_submit_redirect()
+
+        if redirected:
             # 從 URL 中提取 article_id
             return self._extract_article_id_from_url()
         
         return None
     
+    async def _with_recovery(
+        self,
+        attempt: Callable[[], Awaitable[str | None]],
+        verify: Callable[[], Awaitable[str | None]]
+    ) -> str | None:
+        """
+        模板方法：提交失敗或結果不明時，先確認線上狀態再以指數退避重試
+
+        verify 有三種結果：回傳 article_id（已生效）、回傳 None（確認未生效，可以重試）、
+        拋出例外（無法確認，重試可能重複提交，停止並回報失敗）
+
+        Args:
+            attempt: 執行一次完整的提交流程，成功時回傳 article_id
+            verify: 確認提交是否已經生效，已生效時回傳 article_id
+
+        Returns:
+            str | None: 成功時回傳 article_id，重試後仍失敗時回傳 None
+
+        Raises:
+            VerificationUnknown: 無法確認提交是否已經生效
+            Exception: 最後一次嘗試拋出的例外（確認未成功時）
+        """
+        error = None
+        for retry in range(self.retry.retries + 1):
+            try:
+                result = await attempt()
+                error = None
+            except Exception as e:
+                result = None
+                error = e
+            if result:
+                return result
+
+            # 結果不明：等待後確認線上的實際狀態（提交可能已經生效）
+            await asyncio.sleep(self.retry.delay(retry))
+            # 無法確認時不重試（建立文章可能已經生效）
+            try:
+                verified = await verify()
+            except Exception as e:
+                raise VerificationUnknown(f"提交結果不明且無法確認線上狀態，為避免重複提交不再重試: {e}") from e
+            if verified:
+                return verified
+
+            # 登入狀態已失效時重試也不會成功
+            if self.verifier.logged_out:
+                break
+
+        if error is not None:
+            raise error
+        return None
+
+    def _for_page(self, page: Page) -> "ArticleBase":
+        """
+        建立操作另一個 Page 的相同類型實例（不含 escalation）
+
+        Args:
+            page: Playwright 頁面物件
+
+        Returns:
+            ArticleBase: 新的實例
+        """
+        return type(self)(
+            page, base_url=self.base_url, fast_fill=self.fast_fill, incremental_editor=self.incremental_editor,
+            retry=self.retry
+        )
+
+    def _record_state(self, article_id: str | None, subject: str, description: str) -> None:
+        """
+        提交成功後記錄推送狀態（共用方法）
+
+        Args:
+            article_id: 提交結果的文章 ID（None 表示失敗，不記錄）
+            subject: 文章標題
+            description: 文章內容
+        """
+        if self.state and article_id:
+            self.state.record(article_id, subject, description)
+
     @abstractmethod
     async def _perform_submit_action(self) -> None:
         """
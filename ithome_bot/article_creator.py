@@ -4,25 +4,50 @@
 from playwright.async_api import Page
 
 from .article_base import ArticleBase
+from .article_state import ArticleState
+from .authenticator import ITHELP_URL
+from .escalation import HeadedEscalation
+from .recovery import RetryPolicy
+from .series import SeriesResolver
+from .timing import timed
 
 
 class ArticleCreator(ArticleBase):
     """文章建立器"""
 
-    def __init__(self, page: Page):
+    def __init__(
+        self,
+        page: Page,
+        state: ArticleState | None = None,
+        escalation: HeadedEscalation | None = None,
+        base_url: str = ITHELP_URL,
+        fast_fill: bool = False,
+        incremental_editor: bool = False,
+        retry: RetryPolicy | None = None,
+        series: SeriesResolver | None = None
+    ):
         """
         初始化文章建立器
 
         Args:
             page: Playwright 頁面物件
+            state: 文章推送狀態（可選，建立成功後記錄內容雜湊值）
+            escalation: 需要人工處理 reCAPTCHA 時改用有畫面瀏覽器（可選）
+            base_url: iThome 鐵人賽網站的網址（可改為本機替身伺服器）
+            fast_fill: 是否在一次呼叫中設定並驗證標題與內容
+            incremental_editor: 是否只更新內容中變更的行
+            retry: 提交結果不明時的確認與重試設定（可選，重試前一定會先確認文章是否已建立）
+            series: 系列建立網址的解析器（可選，預設只快取在記憶體中）
         """
-        super().__init__(page)
+        super().__init__(page, state, escalation, base_url, fast_fill, incremental_editor, retry)
+        self.series = series or SeriesResolver()
         # 初始化特有的 locators
         self.ironman_button = page.locator('.menu__ironman-btn')
         self.series_modal = page.locator('#ir-select-series__common')
         self.dropdown_toggle = page.locator('.save-group__dropdown-toggle')
         self.publish_button = page.locator('#createSubmitBtn')
 
+    @timed()
     async def create(self, article_data: dict) -> str | None:
         """
         建立新文章（鐵人賽）
@@ -40,7 +65,22 @@ class ArticleCreator(ArticleBase):
         category_id = article_data['category_id']
         subject = article_data['subject']
         description = article_data['description']
-        
+
+        # 提交結果不明時在系列文章列表中尋找相同標題的文章，找不到才重試（不會重複發表）
+        result = await self._with_recovery(
+            lambda: self._create_once(category_id, subject, description),
+            lambda: self.verifier.find_created(category_id, subject)
+        )
+        self._record_state(result, subject, description)
+        return result
+
+    async def _create_once(self, category_id: str, subject: str, description: str) -> str | None:
+        """
+        導航到建立頁面並發表一次文章
+
+        Returns:
+            str | None: 成功時回傳 article_id，失敗或結果不明時回傳 None
+        """
         # 導航到建立頁面
         await self._navigate_to_create_page(category_id)
 
@@ -48,24 +88,42 @@ class ArticleCreator(ArticleBase):
         await self.page.wait_for_load_state("domcontentloaded")
 
         # 設定標題和內容（使用基類方法）
-        await self._set_subject(subject)
-        await self._set_description(description)
+        await self._fill(subject, description)
 
         # 提交文章
         return await self._submit()
 
+    @timed()
     async def _navigate_to_create_page(self, category_id: str) -> None:
-        """導航到文章建立頁面"""
+        """導航到文章建立頁面（優先使用快取的建立網址，失效時改用鐵人發文選單）"""
+        create_url = await self.series.resolve(self.page.context.request, self.base_url, category_id)
+        if create_url:
+            response = await self.page.goto(create_url)
+            if response is None or response.ok:
+                # 已導航到文章建立頁面
+                return
+            # 網址已失效（例如 404），移除快取後回到首頁改用選單
+            self.series.invalidate(self.base_url, category_id)
+            await self.page.goto(f"{self.base_url}/")
+
         # 開啟鐵人發文選單
         await self._open_ironman_menu()
         
         # 選擇指定系列
         await self._select_series_from_modal(category_id)
-        
+
+        # 以實際的建立網址更新快取
+        await self.page.wait_for_url(f"**{self.series.create_url_pattern(category_id)}*", timeout=15000)
+        self.series.remember(self.base_url, category_id, self.page.url)
         # 已導航到文章建立頁面
     
     async def _open_ironman_menu(self) -> None:
         """開啟鐵人發文選單"""
+        # 登入時可能沒有載入頁面，需要先導航到 ithelp
+        if not self.page.url.startswith(self.base_url):
+            await self.page.goto(f"{self.base_url}/")
+            await self.page.wait_for_load_state("domcontentloaded")
+
         await self.ironman_button.wait_for(state="visible", timeout=5000)
         await self.ironman_button.click()
         
@@ -74,7 +132,7 @@ class ArticleCreator(ArticleBase):
     
     async def _select_series_from_modal(self, category_id: str) -> None:
         """從 modal 中選擇指定系列"""
-        series_link = self.page.locator(f'a[href*="/2025ironman/create/{category_id}"]')
+        series_link = self.page.locator(f'a[href*="{self.series.create_url_pattern(category_id)}"]')
         await series_link.wait_for(state="visible", timeout=5000)
         await series_link.click()
 
@@ -94,8 +152,8 @@ class ArticleCreator(ArticleBase):
         """點擊下拉選單觸發按鈕"""
         await self.dropdown_toggle.wait_for(state="visible", timeout=5000)
         await self.dropdown_toggle.click()
-        # 等待下拉選單展開
-        await self.page.wait_for_timeout(500)
+        # 等待下拉選單展開（發表按鈕出現）
+        await self._wait_for_locator(self.publish_button, "visible", timeout=2000)
         # 已展開下拉選單
 
     async def _click_submit_button(self) -> None:
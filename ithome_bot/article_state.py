@@ -0,0 +1,81 @@
+"""
+文章推送狀態模組
+"""
+import hashlib
+import json
+from pathlib import Path
+
+
+class ArticleState:
+    """文章推送狀態：以 article_id 記錄最後一次成功推送內容的雜湊值"""
+
+    def __init__(self, state_file: str = ".ithome_state.json"):
+        """
+        初始化
+
+        Args:
+            state_file: 狀態檔案路徑（預設為當前目錄的 .ithome_state.json）
+        """
+        self.state_file = Path(state_file)
+        self._hashes = None
+
+    @staticmethod
+    def content_hash(subject: str, description: str) -> str:
+        """
+        計算文章標題與內容的雜湊值
+
+        Args:
+            subject: 文章標題
+            description: 文章內容
+
+        Returns:
+            str: SHA-256 雜湊值（十六進位）
+        """
+        payload = json.dumps([subject, description], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def is_unchanged(self, article_data: dict) -> bool:
+        """
+        檢查文章內容是否與最後一次成功推送的內容相同
+
+        Args:
+            article_data: 文章資料字典（需包含 article_id、subject、description）
+
+        Returns:
+            bool: 內容未變更時回傳 True（沒有 article_id 或沒有紀錄時回傳 False）
+        """
+        article_id = article_data.get('article_id')
+        if not article_id:
+            return False
+
+        stored = self._load().get(str(article_id))
+        return stored == self.content_hash(article_data['subject'], article_data['description'])
+
+    def record(self, article_id: str, subject: str, description: str) -> None:
+        """
+        記錄成功推送的內容並寫入狀態檔案
+
+        Args:
+            article_id: 文章 ID
+            subject: 文章標題
+            description: 文章內容
+        """
+        hashes = self._load()
+        hashes[str(article_id)] = self.content_hash(subject, description)
+
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump(hashes, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+    def _load(self) -> dict:
+        """載入狀態檔案（只在第一次使用時讀取）"""
+        if self._hashes is None:
+            self._hashes = {}
+            if self.state_file.exists():
+                try:
+                    with open(self.state_file, 'r', encoding='utf-8') as f:
+                        self._hashes = json.load(f)
+                except (OSError, ValueError):
+                    # 狀態檔案損毀時視為沒有紀錄
+                    self._hashes = {}
+        return self._hashes
@@ -1,28 +1,51 @@
 """
 文章管理模組
 """
+from urllib.parse import urlparse
+
 from playwright.async_api import Page
 
 from .article_base import ArticleBase
+from .article_state import ArticleState
+from .authenticator import ITHELP_URL
+from .escalation import HeadedEscalation
+from .recovery import RetryPolicy
+from .timing import timed
 
 
 class ArticleUpdater(ArticleBase):
     """文章更新器"""
 
-    def __init__(self, page: Page):
+    def __init__(
+        self,
+        page: Page,
+        state: ArticleState | None = None,
+        escalation: HeadedEscalation | None = None,
+        base_url: str = ITHELP_URL,
+        fast_fill: bool = False,
+        incremental_editor: bool = False,
+        retry: RetryPolicy | None = None
+    ):
         """
         初始化文章管理器
 
         Args:
             page: Playwright 頁面物件
+            state: 文章推送狀態（可選，提供時會略過內容未變更的文章）
+            escalation: 需要人工處理 reCAPTCHA 時改用有畫面瀏覽器（可選）
+            base_url: iThome 鐵人賽網站的網址（可改為本機替身伺服器）
+            fast_fill: 是否在一次呼叫中設定並驗證標題與內容
+            incremental_editor: 是否只更新內容中變更的行
+            retry: 提交結果不明時的確認與重試設定（可選）
         """
-        super().__init__(page)
+        super().__init__(page, state, escalation, base_url, fast_fill, incremental_editor, retry)
         # 初始化特有的 locators
         self.update_button = page.locator('#updateSubmitBtn')
         # 儲存當前編輯的文章 ID
         self._current_article_id = None
 
-    async def update(self, article_data: dict) -> str | None:
+    @timed()
+    async def update(self, article_data: dict, force: bool = False) -> str | None:
         """
         更新文章內容
 
@@ -31,6 +54,7 @@ class ArticleUpdater(ArticleBase):
                 - article_id: 文章 ID
                 - subject: 文章標題
                 - description: 文章內容
+            force: 是否忽略推送狀態，強制更新
 
         Returns:
             str | None: 成功時回傳 article_id，失敗時回傳 None
@@ -40,6 +64,86 @@ class ArticleUpdater(ArticleBase):
         subject = article_data['subject']
         description = article_data['description']
         
+        # 內容與最後一次成功推送相同時，直接略過
+        if not force and self.state and self.state.is_unchanged(article_data):
+            return article_id
+
+        # 提交結果不明時比較線上的內容雜湊值，未生效才重試
+        result = await self._with_recovery(
+            lambda: self._update_once(article_id, subject, description),
+            lambda: self._verify(article_id, subject, description)
+        )
+        self._record_state(result, subject, description)
+        return result
+
+    @timed()
+    async def edit(self, article_data: dict) -> bool:
+        """
+        在編輯頁面上設定標題與內容但不提交（頁面保持開啟，重複呼叫時不重新載入）
+
+        Args:
+            article_data: 文章資料字典，包含 article_id、subject、description
+
+        Returns:
+            bool: 編輯器中的內容是否有變更
+        """
+        article_id = article_data['article_id']
+        if not self._on_edit_page(article_id):
+            self._current_article_id = article_id
+            await self._navigate_to_edit_page(article_id)
+            await self.page.wait_for_load_state("domcontentloaded")
+
+        current = await self._read_form()
+        subject_changed = not self._same_content(current['subject'], article_data['subject'])
+        description_changed = not self._same_content(current['description'], article_data['description'])
+        if subject_changed:
+            await self._set_subject(article_data['subject'], clear_first=True)
+        if description_changed:
+            await self._set_description(article_data['description'], clear_first=True)
+        return subject_changed or description_changed
+
+    @timed()
+    async def submit_edited(self, article_data: dict) -> str | None:
+        """
+        提交 edit() 設定好的內容，完成後回到編輯頁面
+
+        結果不明時與 update() 相同地確認線上狀態，未生效才重新載入編輯頁面並重試
+
+        Args:
+            article_data: 文章資料字典（與最後一次 edit() 相同）
+
+        Returns:
+            str | None: 成功時回傳 article_id，失敗時回傳 None
+        """
+        article_id = article_data['article_id']
+        subject = article_data['subject']
+        description = article_data['description']
+        attempts = 0
+
+        async def attempt() -> str | None:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1 and self._on_edit_page(article_id):
+                self._current_article_id = article_id
+                return await self._submit()
+            return await self._update_once(article_id, subject, description)
+
+        try:
+            result = await self._with_recovery(attempt, lambda: self._verify(article_id, subject, description))
+            self._record_state(result, subject, description)
+            return result
+        finally:
+            # 回到編輯頁面，下一次 edit() 時不需要重新載入
+            if not self._on_edit_page(article_id):
+                await self._navigate_to_edit_page(article_id)
+
+    async def _update_once(self, article_id: str, subject: str, description: str) -> str | None:
+        """
+        導航到編輯頁面並提交一次更新
+
+        Returns:
+            str | None: 成功時回傳 article_id，失敗或結果不明時回傳 None
+        """
         # 儲存當前文章 ID
         self._current_article_id = article_id
         
@@ -49,16 +153,39 @@ class ArticleUpdater(ArticleBase):
         # 等待頁面載入
         await self.page.wait_for_load_state("domcontentloaded")
 
-        # 更新標題和內容（使用基類方法）
-        await self._set_subject(subject, clear_first=True)
-        await self._set_description(description, clear_first=True)
+        # 讀取編輯器目前的內容，只更新有變更的欄位
+        current = await self._read_form()
+        subject_changed = not self._same_content(current['subject'], subject)
+        description_changed = not self._same_content(current['description'], description)
+
+        if not subject_changed and not description_changed:
+            # 線上內容已經相同，不需要提交
+            return article_id
+
+        # 更新有變更的標題或內容（使用基類方法）
+        await self._fill(
+            subject if subject_changed else None,
+            description if description_changed else None,
+            clear_first=True
+        )
 
         # 提交更新
         return await self._submit()
 
+    async def _verify(self, article_id: str, subject: str, description: str) -> str | None:
+        """確認線上的內容是否已經是預期的內容，已生效時回傳 article_id"""
+        if await self.verifier.verify_update(article_id, subject, description):
+            return article_id
+        return None
+
+    def _on_edit_page(self, article_id: str) -> bool:
+        """頁面目前是否在該文章的編輯頁面"""
+        return urlparse(self.page.url).path.rstrip('/') == f"/articles/{article_id}/edit"
+
+    @timed()
     async def _navigate_to_edit_page(self, article_id: str) -> None:
         """導航到文章編輯頁面"""
-        edit_url = f"https://ithelp.ithome.com.tw/articles/{article_id}/edit"
+        edit_url = f"{self.base_url}/articles/{article_id}/edit"
         await self.page.goto(edit_url)
         # 已導航到文章編輯頁面: {edit_url}
 
@@ -84,6 +211,15 @@ class ArticleUpdater(ArticleBase):
         await self.update_button.click()
         # 已點擊更新按鈕
     
+    def _for_page(self, page: Page) -> "ArticleUpdater":
+        """建立操作另一個 Page 的文章更新器（保留目前編輯的文章 ID）"""
+        updater = ArticleUpdater(
+            page, base_url=self.base_url, fast_fill=self.fast_fill, incremental_editor=self.incremental_editor,
+            retry=self.retry
+        )
+        updater._current_article_id = self._current_article_id
+        return updater
+
     def _extract_article_id_from_url(self) -> str | None:
         """
         從當前 URL 中提取文章 ID
@@ -0,0 +1,129 @@
+"""
+執行記錄模組
+
+需要分析緩慢的執行時，為每篇文章的工作記錄 Playwright trace 與 HAR。
+每個工作在獨立的 BrowserContext 中執行（HAR 只能在建立 context 時啟用），
+結束後將 cookies 帶回原本的 context，並依數量與總大小輪替舊的記錄檔。
+
+檢視記錄:
+    playwright show-trace artifacts/10376177-20250101-120000-123.trace.zip
+"""
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from playwright.async_api import Page
+
+from .request_filter import RequestFilter
+
+# 記錄檔的副檔名（輪替時只處理這些檔案）
+ARTIFACT_SUFFIXES = (".trace.zip", ".har")
+
+
+class ArtifactRecorder:
+    """以獨立的 BrowserContext 執行工作並記錄 trace 與 HAR"""
+
+    def __init__(
+        self,
+        directory: str = "artifacts",
+        trace: bool = False,
+        har: bool = False,
+        max_files: int = 20,
+        max_bytes: int = 500 * 1024 * 1024
+    ):
+        """
+        初始化
+
+        Args:
+            directory: 記錄檔目錄
+            trace: 是否記錄 Playwright trace（包含截圖與 DOM 快照）
+            har: 是否記錄 HAR
+            max_files: 最多保留的記錄檔數量
+            max_bytes: 記錄檔總大小上限（位元組）
+        """
+        self.directory = Path(directory)
+        self.trace = trace
+        self.har = har
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+
+    async def record(
+        self,
+        page: Page,
+        name: str,
+        job: Callable[[Page], Awaitable],
+        request_filter: RequestFilter | None = None
+    ):
+        """
+        在新的 BrowserContext 中執行工作並記錄
+
+        Args:
+            page: 目前使用的 Page（新的 context 會沿用其登入狀態）
+            name: 記錄檔名稱（例如 article_id）
+            job: 接收新 Page 並執行工作的函數
+            request_filter: 網路請求過濾器（可選，安裝到新的 context）
+
+        Returns:
+            job 的回傳值
+        """
+        source = page.context
+        if source.browser is None:
+            # persistent context 無法另外建立 context，直接執行
+            return await job(page)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        base = self.directory / f"{name}-{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{int(now * 1000) % 1000:03d}"
+
+        context_options = {"storage_state": await source.storage_state()}
+        if self.har:
+            context_options['record_har_path'] = f"{base}.har"
+
+        context = await source.browser.new_context(**context_options)
+        try:
+            if request_filter:
+                await request_filter.install(context)
+            if self.trace:
+                await context.tracing.start(screenshots=True, snapshots=True)
+
+            try:
+                return await job(await context.new_page())
+            finally:
+                if self.trace:
+                    await context.tracing.stop(path=f"{base}.trace.zip")
+
+                # 將工作期間更新的 cookies 帶回原本的 context
+                await source.add_cookies(await context.cookies())
+        finally:
+            # 關閉 context 時才會寫入 HAR
+            await context.close()
+            self.rotate()
+
+    def rotate(self) -> list[Path]:
+        """
+        刪除超過數量或總大小上限的舊記錄檔（至少保留最新的一個）
+
+        Returns:
+            list[Path]: 已刪除的檔案
+        """
+        if not self.directory.exists():
+            return []
+
+        files = [
+            path for path in self.directory.iterdir()
+            if path.is_file() and path.name.endswith(ARTIFACT_SUFFIXES)
+        ]
+        files.sort(key=lambda path: path.stat().st_mtime, reverse=True)
+
+        kept = 0
+        total = 0
+        removed = []
+        for path in files:
+            size = path.stat().st_size
+            if kept and (kept >= self.max_files or total + size > self.max_bytes):
+                path.unlink(missing_ok=True)
+                removed.append(path)
+                continue
+            kept += 1
+            total += size
+        return removed
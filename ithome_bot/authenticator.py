@@ -1,20 +1,32 @@
 """
 iThome 登入功能
 """
+import re
+import time
+
 from playwright.async_api import Page
 
+from .timing import timed
+
+ITHELP_URL = "https://ithelp.ithome.com.tw"
+MEMBER_LOGIN_URL = "https://member.ithome.com.tw/login"
+
 
 class Authenticator:
     """認證器類別"""
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, base_url: str = ITHELP_URL, login_url: str = MEMBER_LOGIN_URL):
         """
         初始化
 
         Args:
             page: Playwright 的 Page 物件
+            base_url: iThome 鐵人賽網站的網址（可改為本機替身伺服器）
+            login_url: 會員登入頁面的網址
         """
         self.page = page
+        self.base_url = base_url.rstrip('/')
+        self.login_url = login_url
 
         # 登入相關 locators
         self.account_input = page.locator('#account')
@@ -27,33 +39,76 @@ class Authenticator:
         self.user_dropdown = page.locator('a#dLabel')
         self.my_page_link = page.locator('text=我的主頁')
 
-    async def login(self, account: str, password: str) -> bool:
+    @timed()
+    async def login(self, account: str, password: str, navigate_to_profile: bool = False) -> bool:
         """
         執行登入
-        先嘗試透過 ithelp_login，如果失敗則使用帳密登入
-        最後都會導航到使用者主頁
+        先以 cookies 快速檢查登入狀態，失敗時嘗試透過 ithelp_login，
+        如果仍然失敗則使用帳密登入
 
         Args:
             account: 使用者帳號
             password: 使用者密碼
+            navigate_to_profile: 登入後是否導航到使用者主頁
 
         Returns:
             bool: 登入是否成功
         """
-        # 先嘗試透過 ithelp 登入
-        login_success = await self._ithelp_login()
+        # 先用 cookies 快速檢查登入狀態（不載入頁面）
+        login_success = await self._probe_session()
+
+        # 快速檢查失敗時，透過 ithelp 登入
+        if not login_success:
+            login_success = await self._ithelp_login()
 
         # 如果 ithelp 登入失敗，則使用帳密登入
         if not login_success:
             # 填寫表單並送出（包含導航到登入頁面、等待跳轉和執行 ithelp_login）
             login_success = await self._submit_login(account, password)
 
-        # 最後導航到使用者主頁
-        if login_success:
+        # 導航到使用者主頁
+        if login_success and navigate_to_profile:
             await self._navigate_to_user_profile()
 
         return login_success
 
+    async def _probe_session(self) -> bool:
+        """
+        快速檢查登入狀態
+
+        先檢查 cookies 是否存在且未過期，再以 context 的 request API
+        （共用瀏覽器的 cookies）取得首頁 HTML，確認是否出現使用者下拉選單
+
+        Returns:
+            bool: 登入狀態是否有效
+        """
+        if not await self._has_valid_cookies():
+            return False
+
+        try:
+            response = await self.page.context.request.get(f"{self.base_url}/")
+            if not response.ok:
+                return False
+            html = await response.text()
+        except Exception:
+            # 檢查失敗時改用瀏覽器登入流程
+            return False
+
+        return re.search(r'id=["\']dLabel["\']', html) is not None
+
+    async def _has_valid_cookies(self) -> bool:
+        """
+        檢查 context 中是否有 ithelp 的未過期 cookies
+
+        Returns:
+            bool: 是否有可用的 cookies
+        """
+        cookies = await self.page.context.cookies(self.base_url)
+        now = time.time()
+        # expires 為 -1 表示 session cookie
+        return any(cookie.get('expires', -1) == -1 or cookie['expires'] > now for cookie in cookies)
+
+    @timed()
     async def _submit_login(self, account: str, password: str) -> bool:
         """
         導航到登入頁面、填寫登入表單並送出
@@ -66,7 +121,7 @@ class Authenticator:
             bool: 登入是否成功
         """
         # 導航到登入頁面
-        await self.page.goto("https://member.ithome.com.tw/login")
+        await self.page.goto(self.login_url)
 
         # 等待頁面載入完畢
         await self.page.wait_for_load_state("domcontentloaded")
@@ -91,6 +146,7 @@ class Authenticator:
         # 登入成功後再次執行 ithelp_login
         return await self._ithelp_login()
 
+    @timed()
     async def _ithelp_login(self) -> bool:
         """
         導航到 ithelp.ithome.com.tw 並進行登入
@@ -100,7 +156,7 @@ class Authenticator:
             bool: 登入是否成功（如果 URL 是登入頁面則返回 False）
         """
         # 導航到 ithelp.ithome.com.tw
-        await self.page.goto("https://ithelp.ithome.com.tw/")
+        await self.page.goto(f"{self.base_url}/")
         # 等待頁面載入
         await self.page.wait_for_load_state("domcontentloaded")
 
@@ -118,7 +174,7 @@ class Authenticator:
 
         # 檢查 URL 是否仍在登入頁面
         current_url = self.page.url
-        if "https://member.ithome.com.tw/login" in current_url:
+        if self.login_url in current_url:
             return False
 
         # 再次檢查是否已經登入
@@ -127,14 +183,21 @@ class Authenticator:
 
         return False
 
+    @timed()
     async def _navigate_to_user_profile(self) -> None:
         """
         導航到使用者主頁
 
         執行流程：
-        1. 點擊使用者下拉選單
-        2. 點擊我的主頁
+        1. 不在 ithelp 頁面時先導航到 ithelp 首頁
+        2. 點擊使用者下拉選單
+        3. 點擊我的主頁
         """
+        # 快速檢查登入時不會載入頁面，需要先導航到 ithelp
+        if not self.page.url.startswith(self.base_url):
+            await self.page.goto(f"{self.base_url}/")
+            await self.page.wait_for_load_state("domcontentloaded")
+
         # 點擊使用者下拉選單
         await self.user_dropdown.click()
         # 已點擊使用者下拉選單
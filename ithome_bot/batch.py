@@ -0,0 +1,198 @@
+"""
+批次處理模組
+"""
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from .client import Client
+
+
+def load_data_file(path: str | Path):
+    """
+    讀取 YAML（副檔名為 .yaml 或 .yml）或 JSON 檔案
+
+    Args:
+        path: 檔案路徑
+
+    Returns:
+        檔案內容解析後的資料
+
+    Raises:
+        ValueError: 讀取 YAML 但未安裝 PyYAML，或 JSON 格式錯誤
+    """
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if path.suffix.lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("讀取 YAML 清單需要安裝 PyYAML（pip install pyyaml）")
+        return yaml.safe_load(content)
+    return json.loads(content)
+
+
+def load_manifest(manifest_file: str) -> list[dict]:
+    """
+    讀取批次清單（YAML 或 JSON）
+
+    清單可以是文章列表，或包含 articles 欄位的物件，每篇文章包含:
+        - article_id: 文章 ID（更新文章）或 category_id: 系列 ID（建立文章）
+        - subject: 文章標題
+        - description_file: 文章內容檔案路徑（相對於清單檔案）或 description: 文章內容
+        - account: 帳號名稱（可選，搭配多帳號清單使用）
+
+    Args:
+        manifest_file: 清單檔案路徑
+
+    Returns:
+        list[dict]: 文章資料列表（已讀取文章內容）
+
+    Raises:
+        ValueError: 清單格式錯誤
+    """
+    manifest_path = Path(manifest_file)
+    data = load_data_file(manifest_path)
+
+    if isinstance(data, dict):
+        data = data.get('articles')
+    if not isinstance(data, list):
+        raise ValueError("清單格式錯誤：需要文章列表或包含 articles 欄位的物件")
+
+    return [_parse_entry(entry, manifest_path.parent, index) for index, entry in enumerate(data, start=1)]
+
+
+def _parse_entry(entry: dict, base_dir: Path, index: int) -> dict:
+    """
+    解析清單中的單篇文章
+
+    Args:
+        entry: 清單項目
+        base_dir: 清單檔案所在目錄
+        index: 項目序號（從 1 開始，用於錯誤訊息）
+
+    Returns:
+        dict: 文章資料
+    """
+    if not isinstance(entry, dict):
+        raise ValueError(f"第 {index} 篇：項目必須是物件")
+
+    if 'article_id' in entry:
+        article_data = {"article_id": str(entry['article_id'])}
+    elif 'category_id' in entry:
+        article_data = {"category_id": str(entry['category_id'])}
+    else:
+        raise ValueError(f"第 {index} 篇：需要 article_id（更新）或 category_id（建立）")
+
+    if not entry.get('subject'):
+        raise ValueError(f"第 {index} 篇：缺少 subject")
+    article_data['subject'] = str(entry['subject'])
+
+    if 'description' in entry:
+        article_data['description'] = str(entry['description'])
+    elif 'description_file' in entry:
+        description_file = base_dir / entry['description_file']
+        if not description_file.exists():
+            raise ValueError(f"第 {index} 篇：找不到檔案 {description_file}")
+        with open(description_file, 'r', encoding='utf-8') as f:
+            article_data['description'] = f.read()
+        article_data['description_file'] = str(description_file)
+    else:
+        raise ValueError(f"第 {index} 篇：需要 description_file 或 description")
+
+    if entry.get('account'):
+        article_data['account'] = str(entry['account'])
+
+    return article_data
+
+
+class BatchRunner:
+    """批次執行器：在同一個已登入的 Client 上處理多篇文章"""
+
+    def __init__(self, client: Client, concurrency: int = 1):
+        """
+        初始化批次執行器
+
+        Args:
+            client: 已登入的 Client 實例
+            concurrency: 同時處理的文章數量（大於 1 時，每篇文章在同一個
+                BrowserContext 中開啟獨立的 Page，共用登入狀態）
+        """
+        self.client = client
+        self.concurrency = max(1, concurrency)
+
+    async def run(self, articles: list[dict], force: bool = False) -> list[dict]:
+        """
+        更新或建立文章
+
+        單篇失敗不會中斷其他文章
+
+        Args:
+            articles: 文章資料列表（含 article_id 為更新，含 category_id 為建立）
+            force: 是否忽略推送狀態，強制更新
+
+        Returns:
+            list[dict]: 每篇文章的執行結果（與輸入順序相同），包含:
+                - action: "update" 或 "create"
+                - subject: 文章標題
+                - article_id: 更新的文章 ID，或建立成功時的文章 ID
+                - success: 是否成功
+                - error: 發生例外時的錯誤訊息
+                - elapsed: 耗時（秒）
+                - description_file: 文章內容檔案路徑（文章內容由檔案讀取時）
+        """
+        if self.concurrency == 1:
+            results = []
+            for article_data in articles:
+                results.append(await self._run_one(self.client, article_data, force))
+            return results
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        return await asyncio.gather(
+            *(self._run_on_new_page(semaphore, article_data, force) for article_data in articles)
+        )
+
+    async def _run_on_new_page(self, semaphore: asyncio.Semaphore, article_data: dict, force: bool) -> dict:
+        """在同一個 BrowserContext 的新 Page 上處理單篇文章"""
+        async with semaphore:
+            try:
+                page = await self.client.page.context.new_page()
+            except Exception as e:
+                return self._result(article_data, None, str(e), 0.0)
+
+            try:
+                return await self._run_one(self.client.for_page(page), article_data, force)
+            finally:
+                await page.close()
+
+    async def _run_one(self, client: Client, article_data: dict, force: bool) -> dict:
+        """處理單篇文章並記錄耗時"""
+        started = time.perf_counter()
+        article_id = None
+        error = None
+
+        try:
+            if 'article_id' in article_data:
+                article_id = await client.update_article(article_data, force)
+            else:
+                article_id = await client.create_article(article_data)
+        except Exception as e:
+            error = str(e)
+
+        return self._result(article_data, article_id, error, time.perf_counter() - started)
+
+    @staticmethod
+    def _result(article_data: dict, article_id: str | None, error: str | None, elapsed: float) -> dict:
+        """建立單篇文章的執行結果"""
+        return {
+            "action": "update" if 'article_id' in article_data else "create",
+            "subject": article_data['subject'],
+            "article_id": article_id or article_data.get('article_id'),
+            "success": article_id is not None,
+            "error": error,
+            "elapsed": elapsed,
+            "description_file": article_data.get('description_file'),
+        }
@@ -0,0 +1,90 @@
+"""
+瀏覽器啟動模組
+
+統一處理瀏覽器引擎與啟動選項，可透過參數或環境變數設定:
+    - ITHOME_BROWSER: 瀏覽器引擎（chromium、firefox、webkit）
+    - ITHOME_HEADLESS: 是否使用無頭模式（1/true/yes 或 0/false/no；未設定時由呼叫端決定，預設顯示瀏覽器視窗）
+    - ITHOME_SLOW_MO: 每個操作之間的延遲（毫秒）
+    - ITHOME_BROWSER_ARGS: 額外的瀏覽器啟動參數（以空白分隔）
+"""
+import os
+import shlex
+
+from playwright.async_api import Browser, Playwright
+
+BROWSER_NAMES = ("chromium", "firefox", "webkit")
+DEFAULT_BROWSER = "webkit"
+
+
+def browser_options(
+    browser: str | None = None,
+    headless: bool | None = None,
+    slow_mo: float | None = None,
+    args: list | tuple | None = None,
+    default_headless: bool = False
+) -> dict:
+    """
+    合併參數與環境變數，取得瀏覽器啟動選項
+
+    參數為 None 時改用環境變數，環境變數也未設定時使用預設值
+
+    Args:
+        browser: 瀏覽器引擎
+        headless: 是否使用無頭模式
+        slow_mo: 每個操作之間的延遲（毫秒）
+        args: 額外的瀏覽器啟動參數
+        default_headless: 參數與環境變數都未指定時是否使用無頭模式
+            （只有能在需要人工處理 reCAPTCHA 時改用有畫面瀏覽器的呼叫端，例如 CLI，才應設為 True）
+
+    Returns:
+        dict: 瀏覽器啟動選項，包含 browser、headless、slow_mo、args
+
+    Raises:
+        ValueError: 瀏覽器引擎不支援
+    """
+    if browser is None:
+        browser = os.getenv('ITHOME_BROWSER', DEFAULT_BROWSER)
+    browser = browser.lower()
+    if browser not in BROWSER_NAMES:
+        raise ValueError(f"不支援的瀏覽器引擎: {browser}（可用: {', '.join(BROWSER_NAMES)}）")
+
+    if headless is None:
+        value = os.getenv('ITHOME_HEADLESS', '').lower()
+        headless = value in ('1', 'true', 'yes') if value else default_headless
+
+    if slow_mo is None and os.getenv('ITHOME_SLOW_MO'):
+        slow_mo = float(os.getenv('ITHOME_SLOW_MO'))
+
+    if not args:
+        args = shlex.split(os.getenv('ITHOME_BROWSER_ARGS', ''))
+
+    return {
+        "browser": browser,
+        "headless": headless,
+        "slow_mo": slow_mo,
+        "args": list(args),
+    }
+
+
+async def launch_browser(playwright: Playwright, options: dict | None = None) -> Browser:
+    """
+    依啟動選項啟動瀏覽器
+
+    Args:
+        playwright: Playwright 實例
+        options: browser_options() 回傳的啟動選項（未提供時從環境變數讀取）
+
+    Returns:
+        Browser: 已啟動的瀏覽器
+    """
+    if options is None:
+        options = browser_options()
+
+    launch_kwargs = {"headless": options['headless']}
+    if options.get('slow_mo'):
+        launch_kwargs['slow_mo'] = options['slow_mo']
+    if options.get('args'):
+        launch_kwargs['args'] = options['args']
+
+    browser_type = getattr(playwright, options['browser'])
+    return await browser_type.launch(**launch_kwargs)
@@ -3,8 +3,11 @@
 iThome Bot CLI - 命令列介面
 """
 import asyncio
+import json
 import os
+import signal
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -13,8 +16,500 @@ from playwright.async_api import async_playwright
 
 # 從同一個 package 載入模組
 from .client import Client
-from .authenticator import Authenticator
+from .authenticator import ITHELP_URL, Authenticator
 from .article_updater import ArticleUpdater
+from .article_state import ArticleState
+from .artifacts import ArtifactRecorder
+from .accounts import AccountScheduler, load_accounts
+from .batch import BatchRunner, load_manifest
+from .browser import BROWSER_NAMES, browser_options, launch_browser
+from .escalation import HeadedEscalation
+from . import timing
+from .http_updater import HttpArticleUpdater
+from .images import UPLOAD_FIELD, UPLOAD_PATH, ImageUploader
+from .daemon import DEFAULT_SOCKET_PATH, Daemon, submit_job
+from .recovery import RetryPolicy
+from .request_filter import DEFAULT_ALLOWED_URLS, DEFAULT_BLOCKED_DOMAINS, RequestFilter
+from .series import DEFAULT_CONTEST_PATH, SeriesResolver
+from .series_index import SeriesIndex, day_from_filename
+from .sync import SyncIndex, load_article_file, parse_front_matter, set_front_matter_field
+from .watch import DEBOUNCE, FileWatcher, WatchSession
+from .session_store import SessionStore
+
+
+def _load_dotenv() -> None:
+    """載入 .env 檔案（如果存在）"""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+
+def _resolve_credentials(account: Optional[str], password: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+    """
+    取得帳密（未提供時從環境變數讀取）
+
+    Returns:
+        tuple: (account, password)
+    """
+    if not account:
+        account = os.getenv('ITHOME_ACCOUNT')
+    if not password:
+        password = os.getenv('ITHOME_PASSWORD')
+    return account, password
+
+
+def _request_filter_options(command):
+    """為命令加上網路請求過濾相關的選項"""
+    command = click.option('--allow-url', multiple=True, help='一律放行的 URL 片段（可重複指定）')(command)
+    command = click.option('--block-domain', multiple=True, help='額外攔截的網域（可重複指定）')(command)
+    command = click.option(
+        '--block-requests/--no-block-requests', default=True, show_default=True,
+        help='攔截圖片、字型、廣告與追蹤請求'
+    )(command)
+    return command
+
+
+def _browser_options(command):
+    """為命令加上瀏覽器引擎與啟動選項（未指定時從環境變數讀取）"""
+    command = click.option('--browser-arg', multiple=True, help='額外的瀏覽器啟動參數（可重複指定）')(command)
+    command = click.option('--slow-mo', type=float, help='每個操作之間的延遲（毫秒）')(command)
+    command = click.option('--headless/--headed', default=None, help='是否使用無頭模式（預設從 ITHOME_HEADLESS 讀取，否則為無頭模式）')(command)
+    command = click.option(
+        '--browser', type=click.Choice(BROWSER_NAMES), help='瀏覽器引擎（預設從 ITHOME_BROWSER 讀取，否則為 webkit）'
+    )(command)
+    return command
+
+
+def _artifact_options(command):
+    """為命令加上 trace 與 HAR 記錄相關的選項"""
+    command = click.option('--artifacts-max-files', default=20, show_default=True, type=click.IntRange(min=1), help='最多保留的記錄檔數量')(command)
+    command = click.option('--artifacts-dir', default='artifacts', show_default=True, help='trace 與 HAR 的輸出目錄')(command)
+    command = click.option('--har', is_flag=True, help='為每篇文章記錄 HAR')(command)
+    command = click.option('--trace', is_flag=True, help='為每篇文章記錄 Playwright trace')(command)
+    return command
+
+
+def _series_options(command):
+    """為命令加上鐵人賽系列相關的選項"""
+    command = click.option(
+        '--series-cache', default='.ithome_series.json', show_default=True,
+        help='系列建立網址的快取檔案（有效期限 24 小時）'
+    )(command)
+    command = click.option(
+        '--contest-path', envvar='ITHOME_CONTEST_PATH', default=DEFAULT_CONTEST_PATH, show_default=True,
+        help='鐵人賽路徑（預設從環境變數 ITHOME_CONTEST_PATH 讀取）'
+    )(command)
+    return command
+
+
+def _image_options(command):
+    """為命令加上本機圖片上傳相關的選項"""
+    command = click.option(
+        '--image-cache', default='.ithome_images.json', show_default=True,
+        help='已上傳圖片的快取檔案（以圖片內容的雜湊值記錄網址）'
+    )(command)
+    command = click.option(
+        '--image-upload-field', default=UPLOAD_FIELD, show_default=True,
+        help='上傳表單中圖片檔案的欄位名稱'
+    )(command)
+    command = click.option(
+        '--image-upload-path', default=UPLOAD_PATH, show_default=True,
+        help='編輯器圖片上傳的路徑（預設值尚未對照實際網站確認）'
+    )(command)
+    command = click.option(
+        '--upload-images/--no-upload-images', default=False, show_default=True,
+        help='上傳內容中引用的本機圖片並改寫為網址（需自行確認上傳路徑與欄位名稱）'
+    )(command)
+    return command
+
+
+def _index_options(command):
+    """為命令加上以本機系列索引指定文章的選項"""
+    command = click.option('--index-file', default='.ithome_index.json', show_default=True, help='系列文章索引檔案（由 ithome-bot index 建立）')(command)
+    command = click.option('--series', 'series_id', help='系列 ID（索引中有多個系列時需指定）')(command)
+    command = click.option('--day', type=click.IntRange(min=1), help='以第幾天指定文章（省略 ARTICLE_ID 時使用，預設從檔案名稱取得）')(command)
+    return command
+
+
+def _base_url_option(command):
+    """為命令加上網站網址的選項（series 索引、推送與圖片上傳使用相同的網址）"""
+    return click.option(
+        '--base-url', envvar='ITHOME_BASE_URL', default=ITHELP_URL, show_default=True,
+        help='iThome 鐵人賽網站的網址（預設從環境變數 ITHOME_BASE_URL 讀取，可改為本機替身伺服器）'
+    )(command)
+
+
+def _push_options(command):
+    """為 update、batch、sync 加上推送文章共用的選項（由 PushOptions.from_cli 合併）"""
+    command = _image_options(command)
+    command = click.option('--retries', default=2, show_default=True, type=click.IntRange(min=0), help='提交結果不明且確認未生效時的重試次數')(command)
+    command = click.option('--incremental-editor', is_flag=True, help='只以差異更新編輯器中變更的行（適合長篇文章）')(command)
+    command = click.option('--fast-fill', is_flag=True, help='在一次頁面呼叫中設定並驗證標題與內容')(command)
+    command = click.option('--timings', 'timings_file', type=click.Path(dir_okay=False), help='將各步驟耗時寫入 JSON 檔案')(command)
+    command = click.option('--http', 'http_first', is_flag=True, help='先嘗試不啟動瀏覽器的 HTTP 更新，失敗時改用瀏覽器')(command)
+    command = _artifact_options(command)
+    command = _browser_options(command)
+    command = _request_filter_options(command)
+    command = _base_url_option(command)
+    return command
+
+
+def _resolve_target(args: tuple, day: Optional[int], series_id: Optional[str], index_file: str) -> tuple[str, str, str]:
+    """
+    解析 [ARTICLE_ID] SUBJECT DESCRIPTION_FILE 參數，省略 ARTICLE_ID 時從本機索引以天數找出文章 ID
+
+    Args:
+        args: 命令列參數
+        day: 第幾天（未提供時從檔案名稱取得）
+        series_id: 系列 ID（索引中有多個系列時需指定）
+        index_file: 系列文章索引檔案路徑
+
+    Returns:
+        tuple: (article_id, subject, description_file)
+
+    Raises:
+        click.UsageError: 參數數量錯誤或索引中找不到文章
+    """
+    if len(args) == 3:
+        if day is not None:
+            raise click.UsageError("指定 ARTICLE_ID 時不能同時使用 --day")
+        return args
+    if len(args) != 2:
+        raise click.UsageError("參數應為 [ARTICLE_ID] SUBJECT DESCRIPTION_FILE")
+
+    subject, description_file = args
+    if day is None:
+        day = day_from_filename(description_file)
+        if day is None:
+            raise click.UsageError(f"無法從檔案名稱 {description_file} 取得天數，請指定 ARTICLE_ID 或 --day")
+
+    try:
+        article_id = SeriesIndex(index_file).find(day, series_id)
+    except ValueError as e:
+        raise click.UsageError(str(e))
+    if article_id is None:
+        raise click.UsageError(f"索引中找不到第 {day} 天的文章，請先執行 ithome-bot index")
+
+    click.echo(f"🔎 第 {day} 天的文章 ID: {article_id}")
+    return article_id, subject, description_file
+
+
+def _resolve_create_target(args: tuple, day: Optional[int], series_id: Optional[str], index_file: str) -> tuple[str, str, str]:
+    """
+    解析建立文章的 [CATEGORY_ID] SUBJECT DESCRIPTION_FILE 參數，省略 CATEGORY_ID 時使用 --series 或索引中唯一的系列
+
+    指定天數（--day 或檔案名稱）且索引中已有該天的文章時拒絕建立，避免重複發表
+
+    Returns:
+        tuple: (category_id, subject, description_file)
+
+    Raises:
+        click.UsageError: 參數數量錯誤、無法決定系列或該天已有文章
+    """
+    if len(args) == 3:
+        category_id, subject, description_file = args
+    elif len(args) == 2:
+        subject, description_file = args
+        category_id = series_id
+        if category_id is None:
+            indexed = SeriesIndex(index_file).series()
+            if len(indexed) != 1:
+                raise click.UsageError("請指定 CATEGORY_ID 或 --series（索引中沒有或有多個系列）")
+            category_id = indexed[0]
+    else:
+        raise click.UsageError("參數應為 [CATEGORY_ID] SUBJECT DESCRIPTION_FILE")
+
+    day = day if day is not None else day_from_filename(description_file)
+    existing = SeriesIndex(index_file).find(day, category_id) if day is not None else None
+    if existing:
+        raise click.UsageError(f"索引中第 {day} 天已有文章 {existing}，請改用更新")
+    return category_id, subject, description_file
+
+
+def _build_artifacts(trace: bool, har: bool, artifacts_dir: str, artifacts_max_files: int) -> Optional[ArtifactRecorder]:
+    """
+    依命令列選項建立 trace 與 HAR 記錄器
+
+    Returns:
+        ArtifactRecorder | None: 沒有啟用任何記錄時回傳 None
+    """
+    if not trace and not har:
+        return None
+    return ArtifactRecorder(artifacts_dir, trace=trace, har=har, max_files=artifacts_max_files)
+
+
+def _build_images(
+    upload_images: bool, image_cache: str, base_url: str = ITHELP_URL,
+    image_upload_path: str = UPLOAD_PATH, image_upload_field: str = UPLOAD_FIELD
+) -> Optional[ImageUploader]:
+    """依選項建立本機圖片上傳器（停用時回傳 None）"""
+    if not upload_images:
+        return None
+    return ImageUploader(image_cache, base_url, upload_path=image_upload_path, upload_field=image_upload_field)
+
+
+async def _rewrite_cached_images(articles: list[dict], images: Optional[ImageUploader]) -> None:
+    """
+    以已上傳過的圖片網址改寫文章內容（不需要網路）
+
+    推送狀態記錄的是改寫後的內容，先改寫才能正確略過圖片與內容都未變更的文章
+
+    Args:
+        articles: 文章資料列表（有 description_file 時改寫 description）
+        images: 本機圖片上傳器（可選）
+    """
+    if images is None:
+        return
+    for article_data in articles:
+        if article_data.get('description_file'):
+            article_data['description'] = await images.rewrite(
+                article_data['description'], Path(article_data['description_file']).parent
+            )
+
+
+def _launch_options(browser: Optional[str], headless: Optional[bool], slow_mo: Optional[float], browser_arg: tuple) -> dict:
+    """
+    依命令列選項與環境變數建立瀏覽器啟動選項
+
+    Raises:
+        click.UsageError: 環境變數設定的瀏覽器引擎不支援
+    """
+    try:
+        # CLI 會建立 HeadedEscalation，預設使用無頭模式
+        return browser_options(browser, headless, slow_mo, browser_arg, default_headless=True)
+    except ValueError as e:
+        raise click.UsageError(str(e))
+
+
+def _escalation(playwright, launch_options: dict) -> Optional[HeadedEscalation]:
+    """
+    無頭模式時建立 HeadedEscalation，需要人工處理 reCAPTCHA 時才開啟瀏覽器視窗
+
+    Returns:
+        HeadedEscalation | None: 有畫面模式時回傳 None（直接在目前視窗處理）
+    """
+    if not launch_options['headless']:
+        return None
+    return HeadedEscalation(playwright, launch_options, _notify_escalation)
+
+
+def _notify_escalation(url: str) -> None:
+    """提示使用者即將開啟瀏覽器視窗處理 reCAPTCHA"""
+    click.echo(f"🖐️ 需要人工處理 reCAPTCHA，正在開啟瀏覽器視窗: {url}")
+
+
+def _build_request_filter(block_requests: bool, block_domain: tuple, allow_url: tuple) -> Optional[RequestFilter]:
+    """
+    依命令列選項建立網路請求過濾器
+
+    Returns:
+        RequestFilter | None: 停用過濾時回傳 None
+    """
+    if not block_requests:
+        return None
+    return RequestFilter(
+        blocked_domains=DEFAULT_BLOCKED_DOMAINS + block_domain,
+        allowed_urls=DEFAULT_ALLOWED_URLS + allow_url
+    )
+
+
+class PushOptions:
+    """推送文章共用的選項（update、batch、sync 共用）"""
+
+    def __init__(
+        self,
+        request_filter: Optional[RequestFilter] = None,
+        launch_options: Optional[dict] = None,
+        http_first: bool = False,
+        artifacts: Optional[ArtifactRecorder] = None,
+        fast_fill: bool = False,
+        incremental_editor: bool = False,
+        retries: int = 2,
+        series: Optional[SeriesResolver] = None,
+        images: Optional[ImageUploader] = None,
+        base_url: str = ITHELP_URL
+    ):
+        """
+        初始化
+
+        Args:
+            request_filter: 網路請求過濾器（可選）
+            launch_options: 瀏覽器啟動選項（可選，預設從環境變數讀取）
+            http_first: 是否先嘗試不啟動瀏覽器的 HTTP 更新
+            artifacts: 為每篇文章記錄 trace 與 HAR（可選）
+            fast_fill: 是否在一次頁面呼叫中設定並驗證標題與內容
+            incremental_editor: 是否只更新內容中變更的行
+            retries: 提交結果不明且確認未生效時的重試次數
+            series: 系列建立網址的解析器（可選）
+            images: 本機圖片上傳器（可選，提供時上傳內容中引用的本機圖片）
+            base_url: iThome 鐵人賽網站的網址（可改為本機替身伺服器）
+        """
+        self.request_filter = request_filter
+        self.launch_options = launch_options
+        self.http_first = http_first
+        self.artifacts = artifacts
+        self.fast_fill = fast_fill
+        self.incremental_editor = incremental_editor
+        self.retries = retries
+        self.series = series
+        self.images = images
+        self.base_url = base_url
+
+    @classmethod
+    def from_cli(
+        cls,
+        block_requests: bool, block_domain: tuple, allow_url: tuple,
+        browser: Optional[str], headless: Optional[bool], slow_mo: Optional[float], browser_arg: tuple,
+        trace: bool, har: bool, artifacts_dir: str, artifacts_max_files: int,
+        http_first: bool, fast_fill: bool, incremental_editor: bool, retries: int,
+        upload_images: bool, image_cache: str, image_upload_path: str, image_upload_field: str, base_url: str,
+        contest_path: Optional[str] = None, series_cache: Optional[str] = None
+    ) -> "PushOptions":
+        """依 _push_options（與 _series_options）的命令列選項建立"""
+        return cls(
+            request_filter=_build_request_filter(block_requests, block_domain, allow_url),
+            launch_options=_launch_options(browser, headless, slow_mo, browser_arg),
+            http_first=http_first,
+            artifacts=_build_artifacts(trace, har, artifacts_dir, artifacts_max_files),
+            fast_fill=fast_fill,
+            incremental_editor=incremental_editor,
+            retries=retries,
+            series=SeriesResolver(contest_path, series_cache) if contest_path else None,
+            images=_build_images(upload_images, image_cache, base_url, image_upload_path, image_upload_field),
+            base_url=base_url
+        )
+
+    def client_options(self, escalation: Optional[HeadedEscalation]) -> dict:
+        """
+        建立 Client 的參數
+
+        Args:
+            escalation: 需要人工處理 reCAPTCHA 時改用有畫面瀏覽器（可選）
+
+        Returns:
+            dict: 傳給 Client 的關鍵字參數
+        """
+        return {
+            "escalation": escalation,
+            "artifacts": self.artifacts,
+            "fast_fill": self.fast_fill,
+            "incremental_editor": self.incremental_editor,
+            "retry": RetryPolicy(self.retries),
+            "series": self.series,
+            "images": self.images,
+            "base_url": self.base_url,
+        }
+
+
+async def _login(client: Client, account: str, password: str) -> bool:
+    """
+    載入 cookies、執行登入並儲存 cookies
+
+    Returns:
+        bool: 登入是否成功
+    """
+    # 載入 cookies
+    click.echo("🔑 載入 cookies...")
+    await client.load_cookies()
+
+    # 執行登入
+    click.echo("🔐 執行登入...")
+    if not await client.login(account, password):
+        click.echo("❌ 登入失敗")
+        return False
+    click.echo("✅ 登入成功")
+
+    # 儲存 cookies
+    click.echo("💾 儲存 cookies...")
+    await client.save_cookies()
+    click.echo("✅ Cookies 已儲存")
+    return True
+
+
+def _run(coroutine, timings_file: Optional[str] = None):
+    """
+    執行 async 流程，指定 timings_file 時記錄各步驟耗時
+
+    Args:
+        coroutine: 要執行的 coroutine
+        timings_file: 耗時記錄的 JSON 輸出路徑（可選）
+
+    Returns:
+        coroutine 的回傳值
+    """
+    if not timings_file:
+        return asyncio.run(coroutine)
+
+    root = None
+    try:
+        with timing.collect("ithome-bot") as root:
+            return asyncio.run(coroutine)
+    finally:
+        if root is not None:
+            with open(timings_file, 'w', encoding='utf-8') as f:
+                json.dump(root.to_dict(), f, ensure_ascii=False, indent=2)
+            click.echo(f"⏱️ {root.summary()}")
+            click.echo(f"💾 耗時記錄已寫入 {timings_file}")
+
+
+async def _update_over_http(
+    articles: list[dict],
+    state: ArticleState,
+    cookies_file: str = "cookies.txt",
+    images: Optional[ImageUploader] = None,
+    base_url: str = ITHELP_URL
+) -> tuple[list[dict], list[dict]]:
+    """
+    以 HTTP 更新文章（不啟動瀏覽器）
+
+    Args:
+        articles: 文章資料列表（只處理含 article_id 的更新）
+        state: 文章推送狀態
+        cookies_file: 登入狀態檔案路徑
+        images: 本機圖片上傳器（可選，有尚未上傳的圖片的文章改用瀏覽器）
+        base_url: iThome 鐵人賽網站的網址
+
+    Returns:
+        tuple: (需要改用瀏覽器處理的文章, 以 HTTP 更新成功的結果)
+    """
+    updater = HttpArticleUpdater.from_cookies_file(cookies_file, state=state, base_url=base_url)
+    if updater is None:
+        click.echo("⚠️ 沒有可用的 cookies，改用瀏覽器")
+        return articles, []
+
+    remaining = []
+    results = []
+    for article_data in articles:
+        if 'article_id' not in article_data:
+            remaining.append(article_data)
+            continue
+        if images and article_data.get('description_file') and images.pending(
+            article_data['description'], Path(article_data['description_file']).parent
+        ):
+            # 圖片需要在已登入的瀏覽器中上傳
+            remaining.append(article_data)
+            continue
+
+        started = time.perf_counter()
+        article_id = await updater.update(article_data)
+        if article_id is None:
+            remaining.append(article_data)
+            continue
+
+        results.append({
+            "action": "update",
+            "subject": article_data['subject'],
+            "article_id": article_id,
+            "success": True,
+            "error": None,
+            "elapsed": time.perf_counter() - started,
+            "description_file": article_data.get('description_file'),
+        })
+
+    click.echo(f"⚡ HTTP 更新成功 {len(results)} 篇，{len(remaining)} 篇改用瀏覽器")
+    return remaining, results
 
 
 async def update_article_with_bot(
@@ -22,7 +517,10 @@ async def update_article_with_bot(
     subject: str,
     description_file: str,
     account: Optional[str] = None,
-    password: Optional[str] = None
+    password: Optional[str] = None,
+    force: bool = False,
+    state_file: str = ".ithome_state.json",
+    options: Optional[PushOptions] = None
 ) -> bool:
     """
     使用 Client 更新文章的核心函數
@@ -33,6 +531,9 @@ async def update_article_with_bot(
         description_file: 文章內容檔案路徑
         account: iThome 帳號（可選，預設從環境變數讀取）
         password: iThome 密碼（可選，預設從環境變數讀取）
+        force: 是否忽略推送狀態，強制更新
+        state_file: 推送狀態檔案路徑
+        options: 推送文章共用的選項（可選）
     
     Returns:
         bool: 是否更新成功
@@ -47,77 +548,717 @@ async def update_article_with_bot(
     with open(file_path, 'r', encoding='utf-8') as f:
         description = f.read()
     click.echo(f"📖 已讀取文章內容檔案: {description_file}，長度: {len(description)} 字元")
+
+    article_data = {
+        "article_id": article_id,
+        "subject": subject,
+        "description": description,
+        "description_file": description_file
+    }
+    options = options or PushOptions()
+    images = options.images
+
+    # 內容與最後一次成功推送相同時，不啟動瀏覽器
+    await _rewrite_cached_images([article_data], images)
+    state = ArticleState(state_file)
+    if not force and state.is_unchanged(article_data):
+        click.echo(f"⏭️ 內容未變更，略過更新 (文章 ID: {article_id})")
+        return True
+
+    # 先嘗試 HTTP 更新，無法確認成功時改用瀏覽器
+    if options.http_first:
+        click.echo("⚡ 嘗試以 HTTP 更新...")
+        pending, _ = await _update_over_http([article_data], state, images=images, base_url=options.base_url)
+        if not pending:
+            click.echo(f"✅ 文章更新成功! (文章 ID: {article_id})")
+            return True
     
     # 取得帳密
-    if not account:
-        account = os.getenv('ITHOME_ACCOUNT')
-    if not password:
-        password = os.getenv('ITHOME_PASSWORD')
-    
+    account, password = _resolve_credentials(account, password)
     if not account or not password:
         click.echo("❌ 錯誤: 請提供帳號密碼或設定環境變數 ITHOME_ACCOUNT 和 ITHOME_PASSWORD")
         return False
     
     # 啟動瀏覽器和執行更新
     click.echo("🚀 正在初始化瀏覽器...")
+    launch_options = options.launch_options or browser_options(default_headless=True)
+    request_filter = options.request_filter
     playwright = await async_playwright().start()
-    browser = await playwright.webkit.launch(headless=False)
+    browser = await launch_browser(playwright, launch_options)
     page = await browser.new_page()
     
     try:
         # 建立 Client 實例
-        client = Client(page)
+        client = Client(page, state=state, **options.client_options(_escalation(playwright, launch_options)))
+        if request_filter:
+            await client.install_request_filter(request_filter)
         
-        # 載入 cookies
-        click.echo("🔑 載入 cookies...")
-        await client.load_cookies()
-        
-        # 執行登入
-        click.echo("🔐 執行登入...")
-        if not await client.login(account, password):
-            click.echo("❌ 登入失敗")
+        # 登入
+        if not await _login(client, account, password):
             return False
-        click.echo("✅ 登入成功")
-        
-        # 儲存 cookies
-        click.echo("💾 儲存 cookies...")
-        await client.save_cookies()
-        click.echo("✅ Cookies 已儲存")
         
         # 更新文章
         click.echo("🔄 更新文章中...")
-        article_data = {
-            "article_id": article_id,
-            "subject": subject,
-            "description": description
-        }
-        
-        result = await client.update_article(article_data)
+        result = await client.update_article(article_data, force)
         
         if result:
             click.echo(f"✅ 文章更新成功! (文章 ID: {result})")
         else:
             click.echo("❌ 文章更新失敗")
+        if images and images.upload_count:
+            click.echo(f"🖼️ 已上傳 {images.upload_count} 張圖片")
         
         return result is not None
         
     finally:
         await browser.close()
         await playwright.stop()
+        if request_filter:
+            click.echo(f"🛡️ {request_filter.summary()}")
         click.echo("🏁 程式執行完成")
 
 
-@click.command()
-@click.argument('article_id')
-@click.argument('subject')
-@click.argument('description_file')
+async def _push_articles(
+    pending: list[dict],
+    state: ArticleState,
+    account: Optional[str],
+    password: Optional[str],
+    force: bool,
+    concurrency: int,
+    options: PushOptions,
+    accounts: Optional[list[dict]] = None
+) -> Optional[list[dict]]:
+    """
+    更新/建立文章：先嘗試 HTTP 更新（可選），其餘文章在同一個瀏覽器中處理
+
+    Args:
+        pending: 要推送的文章資料列表
+        state: 文章推送狀態
+        account: iThome 帳號（可選，預設從環境變數讀取）
+        password: iThome 密碼（可選，預設從環境變數讀取）
+        force: 是否忽略推送狀態，強制更新
+        concurrency: 同時處理的文章數量（多帳號時為每個帳號）
+        options: 推送文章共用的選項
+        accounts: 多帳號清單（可選）
+
+    Returns:
+        list[dict] | None: 每篇文章的執行結果（見 BatchRunner.run），缺少帳密或登入失敗時回傳 None
+    """
+    images = options.images
+    request_filter = options.request_filter
+    results = []
+    if options.http_first and accounts:
+        # 每個帳號使用自己的登入狀態檔案
+        remaining = []
+        for name, cookies_file in ((account['name'], account['cookies_file']) for account in accounts):
+            group = [article for article in pending if (article.get('account') or accounts[0]['name']) == name]
+            if group:
+                group_remaining, group_results = await _update_over_http(group, state, cookies_file, images, options.base_url)
+                remaining += group_remaining
+                results += [{**result, "account": name} for result in group_results]
+        known = {account['name'] for account in accounts}
+        pending = remaining + [article for article in pending if article.get('account') and article['account'] not in known]
+    elif options.http_first:
+        pending, results = await _update_over_http(pending, state, images=images, base_url=options.base_url)
+
+    if pending:
+        # 取得帳密（多帳號時使用帳號清單中的帳密）
+        if not accounts:
+            account, password = _resolve_credentials(account, password)
+            if not account or not password:
+                click.echo("❌ 錯誤: 請提供帳號密碼或設定環境變數 ITHOME_ACCOUNT 和 ITHOME_PASSWORD")
+                return None
+
+        # 啟動瀏覽器（所有帳號共用同一個瀏覽器行程）
+        click.echo("🚀 正在初始化瀏覽器...")
+        launch_options = options.launch_options or browser_options(default_headless=True)
+        playwright = await async_playwright().start()
+        browser = await launch_browser(playwright, launch_options)
+        client_options = options.client_options(_escalation(playwright, launch_options))
+
+        try:
+            if accounts:
+                # 每個帳號使用獨立的 BrowserContext 與登入狀態，同時處理
+                click.echo(f"🔄 {len(accounts)} 個帳號批次處理中...")
+                scheduler = AccountScheduler(browser, accounts, state, concurrency, request_filter, client_options)
+                results += await scheduler.run(pending, force)
+            else:
+                # 所有文章共用同一個 BrowserContext 與登入狀態
+                context = await browser.new_context()
+                page = await context.new_page()
+                client = Client(page, state=state, **client_options)
+                if request_filter:
+                    await client.install_request_filter(request_filter)
+
+                # 登入（整個批次只登入一次）
+                if not await _login(client, account, password):
+                    return None
+
+                click.echo("🔄 批次處理中...")
+                results += await BatchRunner(client, concurrency).run(pending, force)
+        finally:
+            await browser.close()
+            await playwright.stop()
+        if images and images.upload_count:
+            click.echo(f"🖼️ 已上傳 {images.upload_count} 張圖片")
+
+    return results
+
+
+def _read_accounts(accounts_file: str) -> Optional[list[dict]]:
+    """
+    讀取多帳號清單
+
+    Returns:
+        list[dict] | None: 帳號列表，無法讀取時輸出錯誤並回傳 None
+    """
+    try:
+        accounts = load_accounts(accounts_file)
+    except (OSError, ValueError) as e:
+        click.echo(f"❌ 錯誤: 無法讀取帳號清單 {accounts_file}: {e}")
+        return None
+    click.echo(f"👥 已讀取帳號清單: {accounts_file}，共 {len(accounts)} 個帳號")
+    return accounts
+
+
+def _report_results(results: list[dict], skipped: int, started: float, request_filter: Optional[RequestFilter]) -> bool:
+    """
+    輸出每篇文章的結果與統計
+
+    Returns:
+        bool: 是否全部成功
+    """
+    # 輸出每篇文章的結果
+    click.echo("=" * 50)
+    for result in results:
+        target = f"{result['article_id']} " if result['article_id'] else ""
+        if result.get('account'):
+            target = f"({result['account']}) {target}"
+        if result['success']:
+            click.echo(f"✅ [{result['action']}] {target}{result['subject']} ({result['elapsed']:.2f} 秒)")
+        else:
+            reason = f": {result['error']}" if result['error'] else ""
+            click.echo(f"❌ [{result['action']}] {target}{result['subject']} ({result['elapsed']:.2f} 秒){reason}")
+
+    succeeded = sum(1 for result in results if result['success'])
+    elapsed = time.perf_counter() - started
+    click.echo("=" * 50)
+    click.echo(f"📊 成功 {succeeded}/{len(results)} 篇，略過 {skipped} 篇")
+    click.echo(f"⏱️ 總耗時: {elapsed:.2f} 秒（平均 {elapsed / len(results):.2f} 秒/篇）")
+    if request_filter:
+        click.echo(f"🛡️ {request_filter.summary()}")
+    click.echo("🏁 程式執行完成")
+
+    return succeeded == len(results)
+
+
+async def run_batch_with_bot(
+    manifest_file: str,
+    account: Optional[str] = None,
+    password: Optional[str] = None,
+    force: bool = False,
+    state_file: str = ".ithome_state.json",
+    concurrency: int = 1,
+    accounts_file: Optional[str] = None,
+    options: Optional[PushOptions] = None
+) -> bool:
+    """
+    批次更新/建立文章：整個批次只啟動一次瀏覽器、登入一次
+
+    指定 accounts_file 時，各帳號在同一個瀏覽器中使用獨立的 BrowserContext 同時處理
+
+    Args:
+        manifest_file: 批次清單檔案路徑（YAML 或 JSON）
+        account: iThome 帳號（可選，預設從環境變數讀取）
+        password: iThome 密碼（可選，預設從環境變數讀取）
+        force: 是否忽略推送狀態，強制更新
+        state_file: 推送狀態檔案路徑
+        concurrency: 同時處理的文章數量
+        accounts_file: 多帳號清單檔案路徑（可選，文章以 account 欄位指定帳號）
+        options: 推送文章共用的選項（可選）
+
+    Returns:
+        bool: 是否全部成功
+    """
+    started = time.perf_counter()
+    options = options or PushOptions()
+
+    # 讀取帳號清單
+    accounts = None
+    if accounts_file:
+        accounts = _read_accounts(accounts_file)
+        if accounts is None:
+            return False
+
+    # 讀取清單
+    try:
+        articles = load_manifest(manifest_file)
+    except (OSError, ValueError) as e:
+        click.echo(f"❌ 錯誤: 無法讀取清單 {manifest_file}: {e}")
+        return False
+    click.echo(f"📖 已讀取清單: {manifest_file}，共 {len(articles)} 篇文章")
+
+    # 過濾內容未變更的文章（全部未變更時不啟動瀏覽器）
+    await _rewrite_cached_images(articles, options.images)
+    state = ArticleState(state_file)
+    pending = [article for article in articles if force or not state.is_unchanged(article)]
+    skipped = len(articles) - len(pending)
+    if skipped:
+        click.echo(f"⏭️ {skipped} 篇文章內容未變更，略過")
+
+    if not pending:
+        click.echo(f"⏱️ 總耗時: {time.perf_counter() - started:.2f} 秒")
+        return True
+
+    results = await _push_articles(pending, state, account, password, force, concurrency, options, accounts)
+    if results is None:
+        return False
+
+    return _report_results(results, skipped, started, options.request_filter)
+
+
+async def sync_with_bot(
+    directory: str,
+    account: Optional[str] = None,
+    password: Optional[str] = None,
+    force: bool = False,
+    state_file: str = ".ithome_state.json",
+    sync_index_file: Optional[str] = None,
+    default_series: Optional[str] = None,
+    index_file: str = ".ithome_index.json",
+    concurrency: int = 1,
+    accounts_file: Optional[str] = None,
+    options: Optional[PushOptions] = None
+) -> bool:
+    """
+    同步目錄中的 Markdown 檔案：只更新/建立上次同步成功後變更的檔案
+
+    front matter 以 account 指定帳號的檔案需要 accounts_file，未提供時不推送並回報失敗
+
+    Args:
+        directory: 文章目錄（檔案以 front matter 指定 article_id / subject / series）
+        account: iThome 帳號（可選，預設從環境變數讀取）
+        password: iThome 密碼（可選，預設從環境變數讀取）
+        force: 是否忽略同步索引與推送狀態，重新推送所有檔案
+        state_file: 推送狀態檔案路徑
+        sync_index_file: 同步索引檔案路徑（可選，預設為目錄中的 .ithome_sync.json）
+        default_series: front matter 沒有 series 時建立文章使用的系列 ID（可選）
+        index_file: 系列文章索引檔案路徑（沒有 article_id 時以天數尋找已發表的文章）
+        concurrency: 同時處理的文章數量
+        accounts_file: 多帳號清單檔案路徑（可選，檔案以 front matter 的 account 指定帳號）
+        options: 推送文章共用的選項（可選）
+
+    Returns:
+        bool: 是否全部成功
+    """
+    started = time.perf_counter()
+    options = options or PushOptions()
+
+    accounts = None
+    if accounts_file:
+        accounts = _read_accounts(accounts_file)
+        if accounts is None:
+            return False
+
+    sync_index = SyncIndex(sync_index_file or str(Path(directory) / ".ithome_sync.json"))
+
+    # 只讀取修改時間或大小變更的檔案
+    changed = sync_index.scan(directory, force=force)
+    click.echo(f"📂 {directory}: {len(changed)} 個檔案有變更")
+
+    series_index = SeriesIndex(index_file)
+    articles = []
+    failed = 0
+    for path in changed:
+        try:
+            article_data = load_article_file(path, default_series, series_index)
+        except (OSError, ValueError) as e:
+            click.echo(f"❌ {path}: {e}")
+            failed += 1
+            continue
+        if article_data is None:
+            # 沒有 front matter 的檔案不是文章，記錄後不再讀取
+            sync_index.mark(path)
+            continue
+        if article_data.get('account') and not accounts:
+            # 不能以預設帳號推送指定其他帳號的文章
+            click.echo(f"❌ {path}: front matter 指定了帳號 {article_data['account']}，請以 --accounts 提供帳號清單")
+            failed += 1
+            continue
+        articles.append(article_data)
+
+    # 內容與最後一次成功推送相同的文章（例如只修改了 front matter 的其他欄位）不需要推送
+    await _rewrite_cached_images(articles, options.images)
+    state = ArticleState(state_file)
+    pending = []
+    for article_data in articles:
+        if not force and 'article_id' in article_data and state.is_unchanged(article_data):
+            sync_index.mark(Path(article_data['description_file']))
+        else:
+            pending.append(article_data)
+    skipped = len(articles) - len(pending)
+
+    results = []
+    if pending:
+        results = await _push_articles(pending, state, account, password, force, concurrency, options, accounts)
+        if results is None:
+            results = []
+            failed += len(pending)
+
+    # front matter 沒有 article_id 的文章（新建立或從系列文章索引找到）寫回 article_id，成功的檔案記錄到同步索引
+    for result in results:
+        if not result['success']:
+            continue
+        path = Path(result['description_file'])
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            content = f.read()
+        if (parse_front_matter(content)[0] or {}).get('article_id'):
+            sync_index.mark(path)
+            continue
+
+        content = set_front_matter_field(content, "article_id", result['article_id'])
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        sync_index.mark(path, content.encode('utf-8'))
+        click.echo(f"📝 已將文章 ID {result['article_id']} 寫入 {path}")
+    sync_index.save()
+
+    if not results:
+        click.echo(f"⏭️ 沒有需要推送的文章（略過 {skipped} 篇）")
+        click.echo(f"⏱️ 總耗時: {time.perf_counter() - started:.2f} 秒")
+        return failed == 0
+    return _report_results(results, skipped, started, options.request_filter) and failed == 0
+
+
+async def watch_with_bot(
+    description_file: str,
+    article_id: str,
+    subject: str,
+    account: Optional[str] = None,
+    password: Optional[str] = None,
+    state_file: str = ".ithome_state.json",
+    request_filter: Optional[RequestFilter] = None,
+    launch_options: Optional[dict] = None,
+    submit_interval: Optional[float] = None,
+    debounce: float = DEBOUNCE,
+    polling: bool = False,
+    retries: int = 2,
+    images: Optional[ImageUploader] = None,
+    base_url: str = ITHELP_URL
+) -> bool:
+    """
+    監看文章檔案：保持編輯頁面開啟，存檔後更新編輯器內容，在要求時或依間隔提交
+
+    Args:
+        description_file: 文章內容檔案路徑
+        article_id: 文章 ID
+        subject: 文章標題（檔案的 front matter 有 subject 時以 front matter 為準）
+        account: iThome 帳號（可選，預設從環境變數讀取）
+        password: iThome 密碼（可選，預設從環境變數讀取）
+        state_file: 推送狀態檔案路徑
+        request_filter: 網路請求過濾器（可選）
+        launch_options: 瀏覽器啟動選項（可選，預設從環境變數讀取）
+        submit_interval: 自動提交的間隔（秒，0 表示每次存檔後立即提交，None 表示只在按下 Enter 時提交）
+        debounce: 最後一次存檔後等待的時間（秒）
+        polling: 是否一律定期檢查檔案（不使用 watchdog）
+        retries: 提交結果不明且確認未生效時的重試次數
+        images: 本機圖片上傳器（可選，提供時上傳內容中引用的本機圖片）
+        base_url: iThome 鐵人賽網站的網址（可改為本機替身伺服器）
+
+    Returns:
+        bool: 是否正常結束
+    """
+    account, password = _resolve_credentials(account, password)
+    if not account or not password:
+        click.echo("❌ 錯誤: 請提供帳號密碼或設定環境變數 ITHOME_ACCOUNT 和 ITHOME_PASSWORD")
+        return False
+
+    click.echo("🚀 正在初始化瀏覽器...")
+    launch_options = launch_options or browser_options(default_headless=True)
+    playwright = await async_playwright().start()
+    browser = await launch_browser(playwright, launch_options)
+    page = await browser.new_page()
+    session = None
+    loop = asyncio.get_running_loop()
+
+    def read_line():
+        # 按下 Enter 時提交，stdin 關閉時停止讀取
+        if sys.stdin.readline():
+            session.request_submit()
+        else:
+            loop.remove_reader(sys.stdin.fileno())
+
+    try:
+        # 監看模式會重複更新同一篇文章，一律只更新編輯器中變更的行
+        client = Client(
+            page, state=ArticleState(state_file), escalation=_escalation(playwright, launch_options),
+            incremental_editor=True, retry=RetryPolicy(retries), base_url=base_url
+        )
+        if request_filter:
+            await client.install_request_filter(request_filter)
+        if not await _login(client, account, password):
+            return False
+
+        watcher = FileWatcher(description_file, debounce, polling=polling)
+        session = WatchSession(client.article_updater(), article_id, subject, watcher, submit_interval, images)
+        loop.add_signal_handler(signal.SIGUSR1, session.request_submit)
+        if sys.stdin.isatty():
+            loop.add_reader(sys.stdin.fileno(), read_line)
+
+        click.echo(f"👀 監看中: {description_file}（{'定期檢查檔案' if watcher.polling else '檔案系統事件'}）")
+        if submit_interval == 0:
+            click.echo("📤 每次存檔後自動提交")
+        elif submit_interval:
+            click.echo(f"📤 每 {submit_interval:g} 秒自動提交未提交的變更，或按 Enter 立即提交")
+        else:
+            click.echo(f"📤 按 Enter（或 kill -USR1 {os.getpid()}）提交，按 Ctrl+C 結束")
+
+        uploaded = 0
+        async for event in session.run():
+            if event['event'] == "edited":
+                click.echo(f"✏️ 已更新編輯器內容（{event['length']} 字元，{event['elapsed']:.2f} 秒）")
+                if images and images.upload_count > uploaded:
+                    click.echo(f"🖼️ 已上傳 {images.upload_count - uploaded} 張圖片")
+                    uploaded = images.upload_count
+            elif event['event'] == "submitted":
+                if event['success']:
+                    click.echo(f"✅ 已提交! (文章 ID: {event['article_id']}，{event['elapsed']:.2f} 秒)")
+                else:
+                    click.echo(f"❌ 提交失敗 ({event['elapsed']:.2f} 秒)")
+            elif event['event'] == "error":
+                click.echo(f"❌ {'更新編輯器' if event['action'] == 'edit' else '提交'}失敗: {event['error']}")
+    finally:
+        loop.remove_signal_handler(signal.SIGUSR1)
+        if sys.stdin.isatty():
+            loop.remove_reader(sys.stdin.fileno())
+        if session is not None and session.pending is not None:
+            click.echo("⚠️ 編輯器中有尚未提交的變更")
+        await browser.close()
+        await playwright.stop()
+        if request_filter:
+            click.echo(f"🛡️ {request_filter.summary()}")
+        click.echo("🏁 監看已停止")
+
+    return True
+
+
+async def serve_with_bot(
+    socket_path: str,
+    account: Optional[str] = None,
+    password: Optional[str] = None,
+    state_file: str = ".ithome_state.json",
+    concurrency: int = 1,
+    request_filter: Optional[RequestFilter] = None,
+    launch_options: Optional[dict] = None,
+    artifacts: Optional[ArtifactRecorder] = None,
+    series: Optional[SeriesResolver] = None,
+    base_url: str = ITHELP_URL
+) -> bool:
+    """
+    啟動常駐服務，保持已登入的瀏覽器並處理 socket 送來的工作
+
+    Args:
+        socket_path: Unix domain socket 路徑
+        account: iThome 帳號（可選，預設從環境變數讀取）
+        password: iThome 密碼（可選，預設從環境變數讀取）
+        state_file: 推送狀態檔案路徑
+        concurrency: 同時處理的工作數量
+        request_filter: 網路請求過濾器（可選）
+        launch_options: 瀏覽器啟動選項（可選，預設從環境變數讀取）
+        artifacts: 為每篇文章記錄 trace 與 HAR（可選）
+        series: 系列建立網址的解析器（可選）
+        base_url: iThome 鐵人賽網站的網址（可改為本機替身伺服器）
+
+    Returns:
+        bool: 是否正常結束
+    """
+    account, password = _resolve_credentials(account, password)
+    if not account or not password:
+        click.echo("❌ 錯誤: 請提供帳號密碼或設定環境變數 ITHOME_ACCOUNT 和 ITHOME_PASSWORD")
+        return False
+
+    click.echo("🚀 正在初始化瀏覽器...")
+    daemon = Daemon(
+        account, password, socket_path,
+        state=ArticleState(state_file),
+        concurrency=concurrency,
+        request_filter=request_filter,
+        launch_options=launch_options,
+        artifacts=artifacts,
+        series=series,
+        on_escalate=_notify_escalation,
+        base_url=base_url
+    )
+
+    try:
+        click.echo("🔐 執行登入...")
+        if not await daemon.start():
+            click.echo("❌ 登入失敗")
+            return False
+        click.echo("✅ 登入成功")
+
+        click.echo(f"👂 等待工作中: {socket_path}（按 Ctrl+C 結束）")
+        await daemon.serve_forever()
+    finally:
+        await daemon.close()
+        if request_filter:
+            click.echo(f"🛡️ {request_filter.summary()}")
+        click.echo("🏁 服務已停止")
+
+    return True
+
+
+async def submit_with_bot(job: dict, socket_path: str) -> bool:
+    """
+    將工作送到常駐服務並輸出結果
+
+    Args:
+        job: 工作內容
+        socket_path: Unix domain socket 路徑
+
+    Returns:
+        bool: 工作是否成功
+    """
+    try:
+        async for event in submit_job(job, socket_path):
+            if event['event'] == "accepted":
+                click.echo(f"📨 工作已送出 (#{event['job']})")
+            elif event['event'] == "started":
+                click.echo("🔄 處理中...")
+            elif event['event'] == "result":
+                if event['success']:
+                    click.echo(f"✅ 完成! (文章 ID: {event['article_id']}，{event['elapsed']:.2f} 秒)")
+                else:
+                    reason = f": {event['error']}" if event['error'] else ""
+                    click.echo(f"❌ 失敗 ({event['elapsed']:.2f} 秒){reason}")
+                return event['success']
+            elif event['event'] == "error":
+                click.echo(f"❌ {event['error']}")
+                return False
+    except (FileNotFoundError, ConnectionRefusedError):
+        click.echo(f"❌ 錯誤: 無法連線到常駐服務 {socket_path}，請先執行 ithome-bot serve")
+        return False
+
+    click.echo("❌ 常駐服務未回傳結果")
+    return False
+
+
+async def index_series_with_bot(
+    category_ids: tuple,
+    index_file: str = ".ithome_index.json",
+    cookies_file: str = "cookies.txt",
+    user: Optional[str] = None,
+    full: bool = False,
+    concurrency: int = 4,
+    series: Optional[SeriesResolver] = None,
+    base_url: str = ITHELP_URL
+) -> bool:
+    """
+    讀取系列文章列表並更新本機索引（使用 HTTP 請求，不啟動瀏覽器）
+
+    Args:
+        category_ids: 系列 ID（未提供時更新索引中的系列，索引為空時從鐵人發文選單取得）
+        index_file: 系列文章索引檔案路徑
+        cookies_file: 登入狀態檔案路徑（取得使用者路徑與系列時使用）
+        user: 使用者路徑（/users/{user}，可選）
+        full: 是否重新讀取所有分頁
+        concurrency: 同時讀取的分頁數量
+        series: 系列建立網址的解析器（未提供系列 ID 時用來取得系列）
+        base_url: iThome 鐵人賽網站的網址（可改為本機替身伺服器）
+
+    Returns:
+        bool: 是否全部成功
+    """
+    index = SeriesIndex(index_file)
+    playwright = await async_playwright().start()
+    request = await playwright.request.new_context(storage_state=SessionStore(cookies_file).load())
+
+    try:
+        category_ids = list(category_ids) or index.series()
+        if not category_ids:
+            click.echo("🔎 從鐵人發文選單取得系列...")
+            category_ids = list(await (series or SeriesResolver()).discover(request, base_url))
+            if not category_ids:
+                click.echo("❌ 錯誤: 找不到任何系列，請先登入或指定系列 ID")
+                return False
+
+        success = True
+        for category_id in category_ids:
+            try:
+                result = await index.refresh(
+                    request, category_id, user, base_url=base_url, full=full, concurrency=concurrency
+                )
+            except RuntimeError as e:
+                click.echo(f"❌ 系列 {category_id}: {e}")
+                success = False
+                continue
+            click.echo(
+                f"✅ 系列 {category_id}: 讀取 {result['pages']} 頁，"
+                f"新增 {result['added']} 篇，標題變更 {result['changed']} 篇，"
+                f"共 {len(index.articles(category_id))} 篇"
+            )
+    finally:
+        await request.dispose()
+        await playwright.stop()
+
+    click.echo(f"💾 索引已寫入 {index_file}")
+    return success
+
+
+class DefaultCommandGroup(click.Group):
+    """
+    支援預設子命令的命令群組
+
+    第一個參數不是已知子命令時，自動改用預設子命令，
+    讓 `ithome-bot ARTICLE_ID SUBJECT FILE` 的舊用法維持可用
+    """
+
+    def __init__(self, *args, default_command: str = "update", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default_command = default_command
+
+    def parse_args(self, ctx, args):
+        if args and args[0] not in self.commands and args[0] not in ctx.help_option_names:
+            args.insert(0, self.default_command)
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup)
+def main():
+    """
+    iThome 鐵人賽文章更新工具
+
+    \b
+    使用範例:
+      ithome-bot 10376177 "Day 01 標題" article.md
+      ithome-bot index
+      ithome-bot "Day 07 標題" day07.md
+      ithome-bot batch manifest.yaml
+      ithome-bot sync articles/
+      ithome-bot watch day07.md
+      ithome-bot serve
+      ithome-bot submit 10376177 "Day 01 標題" article.md
+    """
+    # 載入 .env 檔案（如果存在）
+    _load_dotenv()
+
+
+@main.command()
+@click.argument('args', nargs=-1, required=True, metavar='[ARTICLE_ID] SUBJECT DESCRIPTION_FILE')
 @click.option('--account', envvar='ITHOME_ACCOUNT', help='iThome 帳號（預設從環境變數 ITHOME_ACCOUNT 讀取）')
 @click.option('--password', envvar='ITHOME_PASSWORD', help='iThome 密碼（預設從環境變數 ITHOME_PASSWORD 讀取）')
-def main(article_id: str, subject: str, description_file: str, account: str, password: str):
+@click.option('--force', is_flag=True, help='忽略推送狀態，即使內容未變更也強制更新')
+@click.option('--state-file', default='.ithome_state.json', show_default=True, help='推送狀態檔案路徑')
+@_index_options
+@_push_options
+def update(
+    args: tuple, account: str, password: str, force: bool, state_file: str,
+    day: int, series_id: str, index_file: str, timings_file: str, **options
+):
     """
-    iThome 鐵人賽文章更新工具
+    更新單篇文章（預設子命令）
     
-    ARTICLE_ID: 文章 ID
+    ARTICLE_ID: 文章 ID（省略時以 --day 或檔案名稱中的天數從 ithome-bot index 建立的索引取得）
     
     SUBJECT: 文章標題
     
@@ -127,14 +1268,11 @@ def main(article_id: str, subject: str, description_file: str, account: str, pas
     使用範例:
       ithome-bot 10376177 "Day 01 標題" article.md
       ithome-bot 10376177 "Day 01 標題" article.md --account myaccount --password mypass
+      ithome-bot "Day 07 標題" day07.md
+      ithome-bot --day 7 "Day 07 標題" article.md
     """
-    # 載入 .env 檔案（如果存在）
-    try:
-        from dotenv import load_dotenv
-        load_dotenv()
-    except ImportError:
-        pass
-    
+    article_id, subject, description_file = _resolve_target(args, day, series_id, index_file)
+
     click.echo("🤖 iThome 鐵人賽文章更新工具")
     click.echo("=" * 50)
     click.echo(f"📄 文章 ID: {article_id}")
@@ -143,16 +1281,287 @@ def main(article_id: str, subject: str, description_file: str, account: str, pas
     click.echo("=" * 50)
     
     # 執行更新
-    success = asyncio.run(update_article_with_bot(
+    success = _run(update_article_with_bot(
         article_id,
         subject,
         description_file,
         account,
-        password
-    ))
+        password,
+        force,
+        state_file,
+        PushOptions.from_cli(**options)
+    ), timings_file)
     
     sys.exit(0 if success else 1)
 
 
+@main.command()
+@click.argument('manifest_file')
+@click.option('--account', envvar='ITHOME_ACCOUNT', help='iThome 帳號（預設從環境變數 ITHOME_ACCOUNT 讀取）')
+@click.option('--password', envvar='ITHOME_PASSWORD', help='iThome 密碼（預設從環境變數 ITHOME_PASSWORD 讀取）')
+@click.option('--force', is_flag=True, help='忽略推送狀態，即使內容未變更也強制更新')
+@click.option('--state-file', default='.ithome_state.json', show_default=True, help='推送狀態檔案路徑')
+@click.option('--concurrency', default=1, show_default=True, type=click.IntRange(min=1), help='同時處理的文章數量（多帳號時為每個帳號）')
+@click.option('--accounts', 'accounts_file', type=click.Path(exists=True, dir_okay=False), help='多帳號清單檔案（YAML 或 JSON），各帳號在同一個瀏覽器中同時處理')
+@_push_options
+@_series_options
+def batch(
+    manifest_file: str, account: str, password: str, force: bool, state_file: str, concurrency: int, accounts_file: str,
+    timings_file: str, **options
+):
+    """
+    批次更新/建立文章（只啟動一次瀏覽器、登入一次）
+
+    MANIFEST_FILE: 批次清單檔案路徑（YAML 或 JSON）
+
+    \b
+    清單範例（YAML）:
+      articles:
+        - article_id: 10376177
+          subject: "Day 01 標題"
+          description_file: day01.md
+        - category_id: 8446
+          subject: "Day 02 標題"
+          description_file: day02.md
+    """
+    click.echo("🤖 iThome 鐵人賽文章批次處理工具")
+    click.echo("=" * 50)
+
+    success = _run(run_batch_with_bot(
+        manifest_file, account, password, force, state_file, concurrency, accounts_file,
+        PushOptions.from_cli(**options)
+    ), timings_file)
+
+    sys.exit(0 if success else 1)
+
+
+@main.command()
+@click.argument('directory', type=click.Path(exists=True, file_okay=False))
+@click.option('--account', envvar='ITHOME_ACCOUNT', help='iThome 帳號（預設從環境變數 ITHOME_ACCOUNT 讀取）')
+@click.option('--password', envvar='ITHOME_PASSWORD', help='iThome 密碼（預設從環境變數 ITHOME_PASSWORD 讀取）')
+@click.option('--force', is_flag=True, help='忽略同步索引與推送狀態，重新推送所有檔案')
+@click.option('--state-file', default='.ithome_state.json', show_default=True, help='推送狀態檔案路徑')
+@click.option('--sync-index', 'sync_index_file', help='同步索引檔案路徑（預設為目錄中的 .ithome_sync.json）')
+@click.option('--series', 'series_id', help='front matter 沒有 series 時建立文章使用的系列 ID')
+@click.option('--index-file', default='.ithome_index.json', show_default=True, help='系列文章索引檔案（沒有 article_id 時以天數尋找已發表的文章）')
+@click.option('--concurrency', default=1, show_default=True, type=click.IntRange(min=1), help='同時處理的文章數量（多帳號時為每個帳號）')
+@click.option('--accounts', 'accounts_file', type=click.Path(exists=True, dir_okay=False), help='多帳號清單檔案（YAML 或 JSON），檔案以 front matter 的 account 指定帳號')
+@_push_options
+@_series_options
+def sync(
+    directory: str, account: str, password: str, force: bool, state_file: str, sync_index_file: str,
+    series_id: str, index_file: str, concurrency: int, accounts_file: str, timings_file: str, **options
+):
+    """
+    同步目錄中的 Markdown 文章（只推送上次同步後變更的檔案）
+
+    DIRECTORY: 文章目錄，每個檔案以 front matter 指定 article_id、subject 與 series；
+    沒有 article_id 的文章會建立並將新的文章 ID 寫回 front matter
+
+    \b
+    檔案範例:
+      ---
+      article_id: 10376177
+      subject: "[Day 07] pytest fixture"
+      ---
+      文章內容...
+    """
+    click.echo("🤖 iThome 鐵人賽文章目錄同步工具")
+    click.echo("=" * 50)
+
+    success = _run(sync_with_bot(
+        directory, account, password, force, state_file, sync_index_file, series_id, index_file, concurrency,
+        accounts_file, PushOptions.from_cli(**options)
+    ), timings_file)
+
+    sys.exit(0 if success else 1)
+
+
+@main.command()
+@click.argument('description_file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--article-id', help='文章 ID（預設從 front matter 的 article_id，或以 --day / 檔案名稱從索引取得）')
+@click.option('--subject', help='文章標題（預設從 front matter 的 subject 取得）')
+@click.option('--account', envvar='ITHOME_ACCOUNT', help='iThome 帳號（預設從環境變數 ITHOME_ACCOUNT 讀取）')
+@click.option('--password', envvar='ITHOME_PASSWORD', help='iThome 密碼（預設從環境變數 ITHOME_PASSWORD 讀取）')
+@click.option('--state-file', default='.ithome_state.json', show_default=True, help='推送狀態檔案路徑')
+@click.option('--submit-interval', type=click.FloatRange(min=0), help='自動提交未提交變更的間隔秒數（0 表示每次存檔後提交，預設只在按下 Enter 時提交）')
+@click.option('--debounce', default=DEBOUNCE, show_default=True, type=click.FloatRange(min=0), help='最後一次存檔後等待的秒數（期間的存檔合併為一次）')
+@click.option('--polling', is_flag=True, help='定期檢查檔案而不使用檔案系統事件')
+@click.option('--retries', default=2, show_default=True, type=click.IntRange(min=0), help='提交結果不明且確認未生效時的重試次數')
+@_index_options
+@_base_url_option
+@_request_filter_options
+@_browser_options
+@_image_options
+def watch(
+    description_file: str, article_id: str, subject: str, account: str, password: str, state_file: str,
+    submit_interval: float, debounce: float, polling: bool, retries: int, day: int, series_id: str, index_file: str,
+    base_url: str, block_requests: bool, block_domain: tuple, allow_url: tuple,
+    browser: str, headless: bool, slow_mo: float, browser_arg: tuple,
+    upload_images: bool, image_cache: str, image_upload_path: str, image_upload_field: str
+):
+    """
+    監看文章檔案，存檔後約一秒內更新已開啟的編輯頁面，在要求時或依間隔提交
+
+    DESCRIPTION_FILE: 文章內容檔案路徑
+
+    \b
+    使用範例:
+      ithome-bot watch day07.md --article-id 10376177 --subject "Day 07 標題"
+      ithome-bot watch day07.md --submit-interval 300
+    """
+    # 未指定時從 front matter 或系列文章索引取得
+    with open(description_file, 'r', encoding='utf-8') as f:
+        try:
+            front_matter = parse_front_matter(f.read())[0] or {}
+        except ValueError:
+            front_matter = {}
+    subject = subject or front_matter.get('subject') or front_matter.get('title')
+    if not subject:
+        raise click.UsageError("請指定 --subject 或在 front matter 中設定 subject")
+    article_id = article_id or (str(front_matter['article_id']) if front_matter.get('article_id') else None)
+    if not article_id:
+        article_id = _resolve_target((str(subject), description_file), day, series_id, index_file)[0]
+
+    click.echo("🤖 iThome 鐵人賽文章監看模式")
+    click.echo("=" * 50)
+    click.echo(f"📄 文章 ID: {article_id}")
+    click.echo(f"📁 內容檔案: {description_file}")
+    click.echo("=" * 50)
+
+    try:
+        success = asyncio.run(watch_with_bot(
+            description_file, article_id, str(subject), account, password, state_file,
+            _build_request_filter(block_requests, block_domain, allow_url),
+            _launch_options(browser, headless, slow_mo, browser_arg),
+            submit_interval, debounce, polling, retries,
+            _build_images(upload_images, image_cache, base_url, image_upload_path, image_upload_field), base_url
+        ))
+    except KeyboardInterrupt:
+        success = True
+
+    sys.exit(0 if success else 1)
+
+
+@main.command()
+@click.option('--socket', 'socket_path', default=DEFAULT_SOCKET_PATH, show_default=True, help='Unix domain socket 路徑')
+@click.option('--account', envvar='ITHOME_ACCOUNT', help='iThome 帳號（預設從環境變數 ITHOME_ACCOUNT 讀取）')
+@click.option('--password', envvar='ITHOME_PASSWORD', help='iThome 密碼（預設從環境變數 ITHOME_PASSWORD 讀取）')
+@click.option('--state-file', default='.ithome_state.json', show_default=True, help='推送狀態檔案路徑')
+@click.option('--concurrency', default=1, show_default=True, type=click.IntRange(min=1), help='同時處理的工作數量')
+@_base_url_option
+@_request_filter_options
+@_browser_options
+@_artifact_options
+@_series_options
+def serve(
+    socket_path: str, account: str, password: str, state_file: str, concurrency: int,
+    base_url: str, block_requests: bool, block_domain: tuple, allow_url: tuple,
+    browser: str, headless: bool, slow_mo: float, browser_arg: tuple,
+    trace: bool, har: bool, artifacts_dir: str, artifacts_max_files: int, contest_path: str, series_cache: str
+):
+    """
+    啟動常駐服務，保持已登入的瀏覽器等待 submit 送來的工作
+    """
+    click.echo("🤖 iThome 鐵人賽文章常駐服務")
+    click.echo("=" * 50)
+
+    try:
+        success = asyncio.run(serve_with_bot(
+            socket_path, account, password, state_file, concurrency,
+            _build_request_filter(block_requests, block_domain, allow_url),
+            _launch_options(browser, headless, slow_mo, browser_arg),
+            _build_artifacts(trace, har, artifacts_dir, artifacts_max_files),
+            SeriesResolver(contest_path, series_cache),
+            base_url
+        ))
+    except KeyboardInterrupt:
+        success = True
+
+    sys.exit(0 if success else 1)
+
+
+@main.command()
+@click.argument('args', nargs=-1, required=True, metavar='[ARTICLE_ID] SUBJECT DESCRIPTION_FILE')
+@click.option('--create', is_flag=True, help='建立新文章（此時 ARTICLE_ID 為系列 ID）')
+@click.option('--force', is_flag=True, help='忽略推送狀態，即使內容未變更也強制更新')
+@click.option('--socket', 'socket_path', default=DEFAULT_SOCKET_PATH, show_default=True, help='Unix domain socket 路徑')
+@_index_options
+def submit(args: tuple, create: bool, force: bool, socket_path: str, day: int, series_id: str, index_file: str):
+    """
+    將文章更新/建立工作送到常駐服務（需先執行 ithome-bot serve）
+
+    ARTICLE_ID: 文章 ID（使用 --create 時為系列 ID；省略時從 ithome-bot index 建立的索引取得）
+
+    SUBJECT: 文章標題
+
+    DESCRIPTION_FILE: 文章內容檔案路徑
+
+    \b
+    使用範例:
+      ithome-bot submit 10376177 "Day 01 標題" article.md
+      ithome-bot submit "Day 07 標題" day07.md
+      ithome-bot submit --create 8446 "Day 02 標題" article.md
+      ithome-bot submit --create "Day 08 標題" day08.md
+    """
+    if create:
+        article_id, subject, description_file = _resolve_create_target(args, day, series_id, index_file)
+    else:
+        article_id, subject, description_file = _resolve_target(args, day, series_id, index_file)
+
+    file_path = Path(description_file)
+    if not file_path.exists():
+        click.echo(f"❌ 錯誤: 找不到檔案 {file_path}")
+        sys.exit(1)
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        description = f.read()
+
+    if create:
+        job = {"action": "create", "category_id": article_id}
+    else:
+        job = {"action": "update", "article_id": article_id, "force": force}
+    job.update({"subject": subject, "description": description})
+
+    success = asyncio.run(submit_with_bot(job, socket_path))
+
+    sys.exit(0 if success else 1)
+
+
+@main.command()
+@click.argument('category_ids', nargs=-1)
+@click.option('--index-file', default='.ithome_index.json', show_default=True, help='系列文章索引檔案路徑')
+@click.option('--cookies-file', default='cookies.txt', show_default=True, help='登入狀態檔案路徑（取得使用者路徑與系列時使用）')
+@click.option('--user', help='使用者路徑（/users/{user}，預設從登入狀態取得）')
+@click.option('--full', is_flag=True, help='重新讀取所有分頁（預設只讀取上次同步的最後一頁之後的分頁）')
+@click.option('--concurrency', default=4, show_default=True, type=click.IntRange(min=1), help='同時讀取的分頁數量')
+@click.option('--timings', 'timings_file', type=click.Path(dir_okay=False), help='將各步驟耗時寫入 JSON 檔案')
+@_base_url_option
+@_series_options
+def index(
+    category_ids: tuple, index_file: str, cookies_file: str, user: str, full: bool, concurrency: int,
+    timings_file: str, base_url: str, contest_path: str, series_cache: str
+):
+    """
+    建立/更新本機的系列文章索引（文章 ID、標題、第幾天），讓 update 與 submit 以天數指定文章
+
+    CATEGORY_IDS: 系列 ID（可省略，預設為索引中的系列或鐵人發文選單中的系列）
+
+    \b
+    使用範例:
+      ithome-bot index 8446
+      ithome-bot index --full
+    """
+    click.echo("🤖 iThome 鐵人賽系列文章索引")
+    click.echo("=" * 50)
+
+    success = _run(index_series_with_bot(
+        category_ids, index_file, cookies_file, user, full, concurrency,
+        SeriesResolver(contest_path, series_cache), base_url
+    ), timings_file)
+
+    sys.exit(0 if success else 1)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,45 +2,138 @@
 iThome 鐵人賽登入自動化
 使用 Class 架構
 """
-import base64
-import json
 from pathlib import Path
 
 from playwright.async_api import Page
 
-from .authenticator import Authenticator
+from .article_state import ArticleState
+from .artifacts import ArtifactRecorder
+from .authenticator import ITHELP_URL, MEMBER_LOGIN_URL, Authenticator
 from .article_updater import ArticleUpdater
 from .article_creator import ArticleCreator
+from .escalation import HeadedEscalation
+from .images import ImageUploader
+from .recovery import RetryPolicy
+from .request_filter import RequestFilter
+from .series import SeriesResolver
+from .session_store import SessionStore
+
+
+def read_cookies_file(cookies_file: str | Path) -> list[dict]:
+    """
+    讀取登入狀態檔案中的 cookies（支援 storage_state JSON 與舊版 Base64 格式）
+
+    Args:
+        cookies_file: 登入狀態檔案路徑
+
+    Returns:
+        list[dict]: cookies 列表（檔案不存在或格式錯誤時回傳空列表）
+    """
+    state = SessionStore(cookies_file).load()
+    return state['cookies'] if state else []
 
 
 class Client:
     """客戶端操作類別"""
 
-    def __init__(self, page: Page, cookies_file: str = "cookies.txt"):
+    def __init__(
+        self,
+        page: Page,
+        cookies_file: str = "cookies.txt",
+        state: ArticleState | None = None,
+        escalation: HeadedEscalation | None = None,
+        artifacts: ArtifactRecorder | None = None,
+        base_url: str = ITHELP_URL,
+        login_url: str = MEMBER_LOGIN_URL,
+        fast_fill: bool = False,
+        incremental_editor: bool = False,
+        retry: RetryPolicy | None = None,
+        series: SeriesResolver | None = None,
+        images: ImageUploader | None = None
+    ):
         """
         初始化
 
         Args:
             page: Playwright 的 Page 物件
-            cookies_file: 儲存 cookies 的檔案路徑（預設為當前目錄的 cookies.txt）
+            cookies_file: 儲存登入狀態的檔案路徑（預設為當前目錄的 cookies.txt）
+            state: 文章推送狀態（可選，提供時會略過內容未變更的文章）
+            escalation: 無頭模式下需要人工處理 reCAPTCHA 時改用有畫面瀏覽器（可選）
+            artifacts: 為每篇文章記錄 trace 與 HAR（可選，未提供時不記錄）
+            base_url: iThome 鐵人賽網站的網址（可改為本機替身伺服器）
+            login_url: 會員登入頁面的網址
+            fast_fill: 是否在一次頁面呼叫中設定並驗證文章標題與內容
+            incremental_editor: 是否只更新文章內容中變更的行（長篇文章較快）
+            retry: 提交結果不明時的確認與重試設定（可選，預設確認後最多重試 2 次）
+            series: 系列建立網址的解析器（可選，建立文章時直接導航到建立頁面）
+            images: 本機圖片上傳器（可選，提供時先上傳內容檔案中引用的本機圖片並改寫為網址）
         """
         self.page = page
         self.cookies_file = Path(cookies_file)
+        self.session = SessionStore(self.cookies_file)
+        self.state = state
+        self.escalation = escalation
+        self.artifacts = artifacts
+        self.base_url = base_url
+        self.login_url = login_url
+        self.fast_fill = fast_fill
+        self.incremental_editor = incremental_editor
+        self.retry = retry
+        self.series = series or SeriesResolver()
+        self.images = images
+        self.request_filter = None
+        # 最近一次工作結束時的頁面 URL（啟用 artifacts 時工作在另一個 Page 執行）
+        self.last_url = None
+
+    def for_page(self, page: Page) -> "Client":
+        """
+        建立使用另一個 Page 的 Client（共用相同的設定）
+
+        同一個 BrowserContext 中的 Page 共用 cookies，
+        可用來在多個 Page 上同時操作文章
+
+        Args:
+            page: Playwright 的 Page 物件
+
+        Returns:
+            Client: 新的 Client 實例
+        """
+        client = Client(
+            page, str(self.cookies_file), self.state, self.escalation, self.artifacts, self.base_url, self.login_url,
+            self.fast_fill, self.incremental_editor, self.retry, self.series, self.images
+        )
+        client.request_filter = self.request_filter
+        return client
 
-    async def login(self, account: str, password: str) -> bool:
+    async def install_request_filter(self, request_filter: RequestFilter | None = None) -> RequestFilter:
+        """
+        在 BrowserContext 上安裝網路請求過濾器（同一個 context 的所有 Page 共用）
+
+        Args:
+            request_filter: 請求過濾器（未提供時使用預設規則）
+
+        Returns:
+            RequestFilter: 已安裝的請求過濾器（可用來讀取統計）
+        """
+        self.request_filter = request_filter or RequestFilter()
+        await self.request_filter.install(self.page.context)
+        return self.request_filter
+
+    async def login(self, account: str, password: str, navigate_to_profile: bool = False) -> bool:
         """
         登入 iThome
 
         Args:
             account: 使用者帳號
             password: 使用者密碼
+            navigate_to_profile: 登入後是否導航到使用者主頁
 
         Returns:
             bool: 登入是否成功
         """
         # 使用 Authenticator class 執行登入
-        auth = Authenticator(self.page)
-        login_success = await auth.login(account, password)
+        auth = Authenticator(self.page, self.base_url, self.login_url)
+        login_success = await auth.login(account, password, navigate_to_profile)
 
         return login_success
 
@@ -53,15 +146,23 @@ class Client:
                 - category_id: 分類 ID（例如鐵人賽的分類）
                 - subject: 文章標題
                 - description: 文章內容
+                - description_file: 文章內容檔案路徑（可選，用來解析本機圖片的相對路徑）
 
         Returns:
             str | None: 成功時回傳 article_id，失敗時回傳 None
         """
+        article_data = await self._upload_images(article_data)
+
         # 使用 ArticleCreator class 處理文章建立
-        creator = ArticleCreator(self.page)
-        return await creator.create(article_data)
+        async def create(page: Page) -> str | None:
+            return await ArticleCreator(
+                page, self.state, self.escalation, self.base_url, self.fast_fill, self.incremental_editor, self.retry,
+                self.series
+            ).create(article_data)
+
+        return await self._run_job(f"create-{article_data['category_id']}", create)
 
-    async def update_article(self, article_data: dict) -> str | None:
+    async def update_article(self, article_data: dict, force: bool = False) -> str | None:
         """
         更新文章內容
 
@@ -70,62 +171,96 @@ class Client:
                 - article_id: 文章 ID
                 - subject: 文章標題
                 - description: 文章內容
+                - description_file: 文章內容檔案路徑（可選，用來解析本機圖片的相對路徑）
+            force: 是否忽略推送狀態，強制更新
 
         Returns:
             str | None: 成功時回傳 article_id，失敗時回傳 None
         """
+        article_data = await self._upload_images(article_data)
+
         # 使用 ArticleUpdater class 處理文章更新
-        updater = ArticleUpdater(self.page)
-        return await updater.update(article_data)
+        async def update(page: Page) -> str | None:
+            return await ArticleUpdater(
+                page, self.state, self.escalation, self.base_url, self.fast_fill, self.incremental_editor, self.retry
+            ).update(article_data, force)
 
-    async def save_cookies(self) -> None:
-        """
-        儲存當前的 cookies 到檔案（Base64 編碼格式）
+        # 內容未變更時不需要記錄
+        if not force and self.state and self.state.is_unchanged(article_data):
+            return await update(self.page)
+
+        return await self._run_job(str(article_data['article_id']), update)
+
+    def article_updater(self) -> ArticleUpdater:
         """
+        建立操作目前 Page 的文章更新器（例如保持編輯頁面開啟的監看模式）
 
-        # 取得所有 cookies
-        cookies = await self.page.context.cookies()
+        Returns:
+            ArticleUpdater: 使用相同設定的文章更新器
+        """
+        return ArticleUpdater(
+            self.page, self.state, self.escalation, self.base_url, self.fast_fill, self.incremental_editor, self.retry
+        )
 
-        # 確保目錄存在
-        self.cookies_file.parent.mkdir(parents=True, exist_ok=True)
+    async def _upload_images(self, article_data: dict) -> dict:
+        """
+        上傳內容中引用的本機圖片（已上傳過的圖片不會重新上傳）
 
-        # 將 cookies 轉換為 JSON 字串，然後進行 Base64 編碼
-        cookies_json = json.dumps(cookies, ensure_ascii=False)
-        cookies_encoded = base64.b64encode(cookies_json.encode('utf-8')).decode('ascii')
+        Args:
+            article_data: 文章資料字典
 
-        # 儲存到檔案
-        with open(self.cookies_file, 'w', encoding='utf-8') as f:
-            f.write(cookies_encoded)
+        Returns:
+            dict: 本機圖片引用已改為網址的文章資料（未設定 images 或沒有 description_file 時回傳原本的資料）
 
-        # Cookies 已儲存
+        Raises:
+            RuntimeError: 上傳失敗
+        """
+        if self.images is None or not article_data.get('description_file'):
+            return article_data
+        description = await self.images.rewrite(
+            article_data['description'], Path(article_data['description_file']).parent, self.page.context.request
+        )
+        return {**article_data, "description": description}
 
-    async def load_cookies(self) -> bool:
+    async def _run_job(self, name: str, job) -> str | None:
         """
-        從檔案載入 cookies（Base64 編碼格式）
+        執行單篇文章的工作（啟用 artifacts 時在獨立的 context 中記錄 trace 與 HAR）
+
+        Args:
+            name: 記錄檔名稱
+            job: 接收 Page 並執行工作的函數
 
         Returns:
-            bool: 是否成功載入 cookies
+            str | None: 工作的回傳值
         """
-        if not self.cookies_file.exists():
-            # 找不到 cookies 檔案
-            return False
+        async def run(page: Page) -> str | None:
+            try:
+                return await job(page)
+            finally:
+                self.last_url = page.url
 
-        try:
-            with open(self.cookies_file, 'r', encoding='utf-8') as f:
-                cookies_encoded = f.read().strip()
+        if self.artifacts is None:
+            return await run(self.page)
+        return await self.artifacts.record(self.page, name, run, self.request_filter)
 
-            # Base64 解碼並轉換為 JSON
-            cookies_json = base64.b64decode(cookies_encoded).decode('utf-8')
-            cookies = json.loads(cookies_json)
+    async def save_cookies(self) -> bool:
+        """
+        儲存當前的登入狀態（cookies 與 localStorage）到檔案
 
-            if self.page and cookies:
-                await self.page.context.add_cookies(cookies)
-                # 已載入 cookies
-                return True
-        except Exception:
-            # 載入 cookies 失敗
-            pass
+        以檔案鎖與原子寫入保護，登入狀態與檔案內容相同時不會重新寫入
 
-        return False
+        Returns:
+            bool: 是否寫入檔案
+        """
+        return await self.session.capture(self.page.context)
 
+    async def load_cookies(self) -> bool:
+        """
+        從檔案載入登入狀態（也接受舊版 Base64 cookies 格式）
 
+        Returns:
+            bool: 是否成功載入
+        """
+        if not self.page:
+            return False
+        return await self.session.restore(self.page.context)
@@ -0,0 +1,282 @@
+"""
+常駐服務模組
+
+保持一個已登入的瀏覽器常駐，透過 Unix domain socket 接收文章更新/建立工作，
+省去每次執行時啟動 Playwright、瀏覽器與登入的時間
+
+通訊協定為逐行 JSON：
+    - 用戶端送出一行工作，例如:
+        {"action": "update", "article_id": "...", "subject": "...", "description": "...", "force": false}
+        {"action": "create", "category_id": "...", "subject": "...", "description": "..."}
+    - 服務端依序回傳事件，最後一行為 result 或 error:
+        {"event": "accepted", "job": 1}
+        {"event": "started", "job": 1}
+        {"event": "result", "job": 1, "article_id": "...", "success": true, "elapsed": 1.23}
+"""
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import AsyncIterator, Callable
+
+from playwright.async_api import async_playwright
+
+from .article_state import ArticleState
+from .artifacts import ArtifactRecorder
+from .authenticator import ITHELP_URL
+from .browser import browser_options, launch_browser
+from .client import Client
+from .escalation import HeadedEscalation
+from .request_filter import RequestFilter
+from .series import SeriesResolver
+
+DEFAULT_SOCKET_PATH = str(Path.home() / ".ithome-bot.sock")
+
+# 單行 JSON 的長度上限（文章內容可能有數百 KB）
+STREAM_LIMIT = 16 * 1024 * 1024
+
+
+class Daemon:
+    """常駐服務：保持已登入的 BrowserContext，處理透過 socket 送來的工作"""
+
+    def __init__(
+        self,
+        account: str,
+        password: str,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        cookies_file: str = "cookies.txt",
+        state: ArticleState | None = None,
+        concurrency: int = 1,
+        request_filter: RequestFilter | None = None,
+        launch_options: dict | None = None,
+        artifacts: ArtifactRecorder | None = None,
+        series: SeriesResolver | None = None,
+        on_escalate: Callable[[str], None] | None = None,
+        base_url: str = ITHELP_URL
+    ):
+        """
+        初始化
+
+        Args:
+            account: 使用者帳號
+            password: 使用者密碼
+            socket_path: Unix domain socket 路徑
+            cookies_file: 儲存 cookies 的檔案路徑
+            state: 文章推送狀態（可選）
+            concurrency: 同時處理的工作數量
+            request_filter: 網路請求過濾器（可選）
+            launch_options: 瀏覽器啟動選項（可選，預設從環境變數讀取，未設定時使用無頭模式）
+            artifacts: 為每篇文章記錄 trace 與 HAR（可選）
+            series: 系列建立網址的解析器（可選）
+            on_escalate: 需要人工處理 reCAPTCHA、開啟瀏覽器視窗前呼叫（可選，參數為頁面 URL）
+            base_url: iThome 鐵人賽網站的網址（可改為本機替身伺服器）
+        """
+        self.account = account
+        self.password = password
+        self.socket_path = Path(socket_path)
+        self.cookies_file = cookies_file
+        self.state = state
+        self.request_filter = request_filter
+        # 無頭模式下會建立 HeadedEscalation，預設使用無頭模式
+        self.launch_options = launch_options or browser_options(default_headless=True)
+        self.artifacts = artifacts
+        self.series = series
+        self.on_escalate = on_escalate
+        self.base_url = base_url
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._login_lock = asyncio.Lock()
+        self._job_count = 0
+
+        self._playwright = None
+        self._browser = None
+        self.client = None
+
+    async def start(self) -> bool:
+        """
+        啟動瀏覽器並登入
+
+        Returns:
+            bool: 登入是否成功
+        """
+        self._playwright = await async_playwright().start()
+        self._browser = await launch_browser(self._playwright, self.launch_options)
+        context = await self._browser.new_context()
+        page = await context.new_page()
+
+        # 無頭模式下需要人工處理 reCAPTCHA 時才開啟瀏覽器視窗
+        escalation = None
+        if self.launch_options['headless']:
+            escalation = HeadedEscalation(self._playwright, self.launch_options, self.on_escalate)
+        self.client = Client(
+            page, self.cookies_file, self.state, escalation, self.artifacts, base_url=self.base_url, series=self.series
+        )
+        if self.request_filter:
+            await self.client.install_request_filter(self.request_filter)
+        await self.client.load_cookies()
+        return await self._login()
+
+    async def serve_forever(self) -> None:
+        """開始監聽 socket 並處理工作（直到被取消）"""
+        # 移除上次異常結束時殘留的 socket 檔案
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+        server = await asyncio.start_unix_server(
+            self._handle_connection, path=str(self.socket_path), limit=STREAM_LIMIT
+        )
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+
+    async def close(self) -> None:
+        """關閉瀏覽器與 Playwright"""
+        if self._browser:
+            await self._browser.close()
+        if self._playwright:
+            await self._playwright.stop()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """處理單一連線：讀取一行工作並回傳事件"""
+        self._job_count += 1
+        job_id = self._job_count
+
+        try:
+            try:
+                job = json.loads(await reader.readline())
+                self._validate_job(job)
+            except ValueError as e:
+                await self._send(writer, {"event": "error", "job": job_id, "error": f"工作格式錯誤: {e}"})
+                return
+
+            await self._send(writer, {"event": "accepted", "job": job_id})
+
+            async with self._semaphore:
+                await self._send(writer, {"event": "started", "job": job_id})
+                started = time.perf_counter()
+                try:
+                    article_id = await self._run_job(job)
+                    error = None
+                except Exception as e:
+                    article_id = None
+                    error = str(e)
+
+            await self._send(writer, {
+                "event": "result",
+                "job": job_id,
+                "article_id": article_id,
+                "success": article_id is not None,
+                "error": error,
+                "elapsed": time.perf_counter() - started,
+            })
+        except ConnectionError:
+            # 用戶端已中斷連線
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _validate_job(job: dict) -> None:
+        """
+        檢查工作格式
+
+        Raises:
+            ValueError: 工作格式錯誤
+        """
+        if not isinstance(job, dict):
+            raise ValueError("工作必須是物件")
+
+        action = job.get('action')
+        if action == "update":
+            required = ('article_id', 'subject', 'description')
+        elif action == "create":
+            required = ('category_id', 'subject', 'description')
+        else:
+            raise ValueError("action 必須是 update 或 create")
+
+        missing = [key for key in required if key not in job]
+        if missing:
+            raise ValueError(f"缺少欄位 {', '.join(missing)}")
+
+    async def _run_job(self, job: dict) -> str | None:
+        """
+        在新的 Page 上執行工作
+
+        工作因登入狀態失效而失敗時，重新登入後再試一次
+
+        Returns:
+            str | None: 成功時回傳 article_id，失敗時回傳 None
+        """
+        for attempt in range(2):
+            page = await self.client.page.context.new_page()
+            try:
+                client = self.client.for_page(page)
+                try:
+                    if job['action'] == "update":
+                        result = await client.update_article(job, job.get('force', False))
+                    else:
+                        result = await client.create_article(job)
+                except Exception:
+                    if attempt == 0 and self._is_login_page(client.last_url or page.url):
+                        await self._login()
+                        continue
+                    raise
+
+                if result is None and attempt == 0 and self._is_login_page(client.last_url or page.url):
+                    await self._login()
+                    continue
+
+                # cookies 有變更時才寫入檔案
+                await self.client.save_cookies()
+                return result
+            finally:
+                await page.close()
+
+        return None
+
+    async def _login(self) -> bool:
+        """
+        執行登入並儲存 cookies（同時只允許一個登入流程）
+
+        Returns:
+            bool: 登入是否成功
+        """
+        async with self._login_lock:
+            if not await self.client.login(self.account, self.password):
+                return False
+            await self.client.save_cookies()
+            return True
+
+    def _is_login_page(self, url: str) -> bool:
+        """檢查是否被導向登入頁面（登入狀態失效）"""
+        return self.client.login_url in url
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, event: dict) -> None:
+        """送出一行 JSON 事件"""
+        writer.write((json.dumps(event, ensure_ascii=False) + "\n").encode('utf-8'))
+        await writer.drain()
+
+
+async def submit_job(job: dict, socket_path: str = DEFAULT_SOCKET_PATH) -> AsyncIterator[dict]:
+    """
+    將工作送到常駐服務，並逐一取得回傳的事件
+
+    Args:
+        job: 工作內容（格式同 Daemon 的通訊協定）
+        socket_path: Unix domain socket 路徑
+
+    Yields:
+        dict: 服務端回傳的事件
+    """
+    reader, writer = await asyncio.open_unix_connection(socket_path, limit=STREAM_LIMIT)
+    try:
+        writer.write((json.dumps(job, ensure_ascii=False) + "\n").encode('utf-8'))
+        await writer.drain()
+
+        while line := await reader.readline():
+            yield json.loads(line)
+    finally:
+        writer.close()
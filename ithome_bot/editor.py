@@ -0,0 +1,160 @@
+"""
+編輯器內容更新模組
+
+以 simplemde.value() 整份取代內容時，CodeMirror 會重新分析與繪製整份文件，
+長篇文章（數百 KB）在 WebKit 上特別慢。差異更新模式在頁面中比對目前內容與新內容的行差異
+（Myers 演算法），只在 CodeMirror 的 operation 中以 replaceRange 更新變更的範圍；
+差異過大、沒有 CodeMirror 或更新後內容不一致時改為整份取代。
+"""
+
+# Myers 演算法的最大編輯距離（行數），超過時改為整份取代
+MAX_EDIT_DISTANCE = 500
+
+# 變更的行數超過新舊文件總行數的比例時改為整份取代
+MAX_CHANGED_RATIO = 0.5
+
+# 設定編輯器內容的 JavaScript 函式（回傳 {mode, hunks}，mode 為 textarea、full、unchanged 或 incremental）
+SET_EDITOR_CONTENT = """
+    function diffLines(a, b, maxEditDistance) {
+        // 先排除相同的開頭與結尾
+        let start = 0;
+        while (start < a.length && start < b.length && a[start] === b[start]) {
+            start++;
+        }
+        let endA = a.length;
+        let endB = b.length;
+        while (endA > start && endB > start && a[endA - 1] === b[endB - 1]) {
+            endA--;
+            endB--;
+        }
+
+        const n = endA - start;
+        const m = endB - start;
+        if (n === 0 || m === 0) {
+            return [[start, endA, start, endB]];
+        }
+
+        const limit = Math.min(n + m, maxEditDistance);
+        const offset = limit + 1;
+        const v = new Int32Array(2 * limit + 3);
+        const trace = [];
+        let distance = -1;
+        search: for (let d = 0; d <= limit; d++) {
+            trace.push(v.slice());
+            for (let k = -d; k <= d; k += 2) {
+                let x = (k === -d || (k !== d && v[offset + k - 1] < v[offset + k + 1]))
+                    ? v[offset + k + 1]
+                    : v[offset + k - 1] + 1;
+                let y = x - k;
+                while (x < n && y < m && a[start + x] === b[start + y]) {
+                    x++;
+                    y++;
+                }
+                v[offset + k] = x;
+                if (x >= n && y >= m) {
+                    distance = d;
+                    break search;
+                }
+            }
+        }
+        if (distance < 0) {
+            return null;
+        }
+
+        // 回溯找出每個刪除（x + 1）與插入（y + 1）的位置
+        const edits = [];
+        let x = n;
+        let y = m;
+        for (let d = distance; d > 0; d--) {
+            const previous = trace[d];
+            const k = x - y;
+            const inserted = k === -d || (k !== d && previous[offset + k - 1] < previous[offset + k + 1]);
+            const previousK = inserted ? k + 1 : k - 1;
+            const previousX = previous[offset + previousK];
+            edits.push([previousX, previousX - previousK, inserted]);
+            x = previousX;
+            y = previousX - previousK;
+        }
+        edits.reverse();
+
+        // 將相鄰的編輯合併為區塊 [aStart, aEnd, bStart, bEnd]
+        const hunks = [];
+        for (const [editX, editY, inserted] of edits) {
+            let hunk = hunks[hunks.length - 1];
+            if (!hunk || hunk[1] !== start + editX || hunk[3] !== start + editY) {
+                hunk = [start + editX, start + editX, start + editY, start + editY];
+                hunks.push(hunk);
+            }
+            if (inserted) {
+                hunk[3]++;
+            } else {
+                hunk[1]++;
+            }
+        }
+        return hunks;
+    }
+
+    function setEditorContent(textarea, content, incremental, maxEditDistance, maxChangedRatio) {
+        const simplemde = window.jQuery ? $(textarea).data('simplemde') : null;
+        if (!simplemde) {
+            textarea.value = content;
+            return {mode: 'textarea', hunks: 0};
+        }
+
+        const cm = simplemde.codemirror;
+        if (!incremental || !cm || typeof cm.replaceRange !== 'function') {
+            simplemde.value(content);
+            return {mode: 'full', hunks: 0};
+        }
+
+        content = content.replace(/\\r\\n?/g, '\\n');
+        const current = cm.getValue();
+        if (current === content) {
+            return {mode: 'unchanged', hunks: 0};
+        }
+
+        const a = current.split('\\n');
+        const b = content.split('\\n');
+        const hunks = diffLines(a, b, maxEditDistance);
+        const changed = hunks
+            ? hunks.reduce((total, hunk) => total + (hunk[1] - hunk[0]) + (hunk[3] - hunk[2]), 0)
+            : Infinity;
+        if (changed > (a.length + b.length) * maxChangedRatio) {
+            simplemde.value(content);
+            return {mode: 'full', hunks: 0};
+        }
+
+        // 由後往前套用，前面區塊的行號不受影響
+        cm.operation(() => {
+            for (let i = hunks.length - 1; i >= 0; i--) {
+                const [aStart, aEnd, bStart, bEnd] = hunks[i];
+                const lines = b.slice(bStart, bEnd);
+                const last = {line: a.length - 1, ch: a[a.length - 1].length};
+                if (aEnd < a.length) {
+                    const text = lines.map((line) => line + '\\n').join('');
+                    cm.replaceRange(text, {line: aStart, ch: 0}, {line: aEnd, ch: 0});
+                } else if (aStart > 0) {
+                    const text = (lines.length ? '\\n' : '') + lines.join('\\n');
+                    cm.replaceRange(text, {line: aStart - 1, ch: a[aStart - 1].length}, last);
+                } else {
+                    cm.replaceRange(lines.join('\\n'), {line: 0, ch: 0}, last);
+                }
+            }
+        });
+
+        if (cm.getValue() !== content) {
+            simplemde.value(content);
+            return {mode: 'full', hunks: 0};
+        }
+        return {mode: 'incremental', hunks: hunks.length};
+    }
+"""
+
+# 設定內容描述欄位的編輯器（參數為 [content, incremental, maxEditDistance, maxChangedRatio]）
+UPDATE_EDITOR = """
+    ([content, incremental, maxEditDistance, maxChangedRatio]) => {
+""" + SET_EDITOR_CONTENT + """
+        const textarea = document.querySelector('textarea[name="description"]');
+        return setEditorContent(textarea, content, incremental, maxEditDistance, maxChangedRatio);
+    }
+"""
@@ -0,0 +1,67 @@
+"""
+人工操作升級模組
+
+平常以無頭模式執行，只有在 reCAPTCHA 需要人工處理時，
+才將登入狀態與表單內容轉移到有畫面的瀏覽器完成提交
+"""
+from typing import Callable
+
+from playwright.async_api import Playwright
+
+from .browser import launch_browser
+
+
+class HeadedEscalation:
+    """需要人工操作時，改用有畫面的瀏覽器完成提交"""
+
+    def __init__(
+        self,
+        playwright: Playwright,
+        launch_options: dict,
+        on_escalate: Callable[[str], None] | None = None
+    ):
+        """
+        初始化
+
+        Args:
+            playwright: Playwright 實例
+            launch_options: 瀏覽器啟動選項（會改為有畫面模式）
+            on_escalate: 開啟瀏覽器視窗前呼叫，參數為需要人工處理的頁面 URL（可選，例如讓 CLI 提示使用者）
+        """
+        self.playwright = playwright
+        self.launch_options = {**launch_options, "headless": False}
+        self.on_escalate = on_escalate
+
+    async def submit(self, worker) -> str | None:
+        """
+        在有畫面的瀏覽器中開啟相同頁面、填入相同內容並提交
+
+        Args:
+            worker: 無頭模式中的 ArticleBase 實例（ArticleUpdater 或 ArticleCreator）
+
+        Returns:
+            str | None: 成功時回傳 article_id，失敗時回傳 None
+        """
+        # 保存目前的登入狀態與表單內容
+        storage_state = await worker.page.context.storage_state()
+        form = await worker._read_form()
+
+        if self.on_escalate:
+            self.on_escalate(worker.page.url)
+        browser = await launch_browser(self.playwright, self.launch_options)
+        try:
+            context = await browser.new_context(storage_state=storage_state)
+            page = await context.new_page()
+            await page.goto(worker.page.url)
+            await page.wait_for_load_state("domcontentloaded")
+
+            # 在新頁面填入相同內容並提交（沒有 escalation，會等待人工處理 reCAPTCHA）
+            headed = worker._for_page(page)
+            await headed._fill(form['subject'], form['description'], clear_first=True)
+            result = await headed._submit()
+
+            # 將人工操作後的 cookies 帶回原本的 context
+            await worker.page.context.add_cookies(await context.cookies())
+            return result
+        finally:
+            await browser.close()
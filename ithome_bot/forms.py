@@ -0,0 +1,171 @@
+"""
+HTML 表單與文章列表解析模組
+
+HTTP 更新與提交結果確認共用：不轉譯頁面，直接從 HTML 取出編輯表單的欄位與文章連結
+"""
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+# 文章連結（/articles/{article_id}）
+ARTICLE_LINK = re.compile(r'/articles/(\d+)/?$')
+
+# 頁面中的 CSRF token（<meta name="csrf-token"> 或表單的 _token 欄位）
+CSRF_META = re.compile(r'<meta\b[^>]*?name="csrf-token"[^>]*?content="([^"]+)"', re.I)
+CSRF_INPUT = re.compile(r'<input\b[^>]*?name="_token"[^>]*?value="([^"]+)"', re.I)
+
+# 頁首使用者選單中的主頁連結（/users/{user}）
+USER_LINK = re.compile(r'href="[^"]*?/users/([^/"?#]+)')
+
+
+class _EditFormParser(HTMLParser):
+    """解析包含 subject 欄位的文章編輯表單"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.forms = []
+        self._form = None
+        self._textarea = None
+        self._textarea_start = False
+        self._select = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "form":
+            self._form = {"action": attrs.get("action", ""), "method": attrs.get("method", "get").lower(), "fields": []}
+            self.forms.append(self._form)
+            return
+
+        if tag == "option" and self._select is not None:
+            # 沒有 selected 時使用第一個選項
+            if self._select[1] is None or "selected" in attrs:
+                self._select[1] = attrs.get("value", "")
+            return
+
+        if self._form is None or not attrs.get("name"):
+            return
+
+        if tag == "input":
+            input_type = attrs.get("type", "text").lower()
+            if input_type in ("submit", "button", "image", "file", "reset"):
+                return
+            if input_type in ("checkbox", "radio") and "checked" not in attrs:
+                return
+            self._form['fields'].append([attrs['name'], attrs.get("value", "on" if input_type == "checkbox" else "")])
+        elif tag == "textarea":
+            self._textarea = [attrs['name'], ""]
+            self._textarea_start = True
+            self._form['fields'].append(self._textarea)
+        elif tag == "select":
+            self._select = [attrs['name'], None]
+            self._form['fields'].append(self._select)
+
+    def handle_endtag(self, tag):
+        if tag == "form":
+            self._form = None
+        elif tag == "textarea":
+            self._textarea = None
+        elif tag == "select":
+            self._select = None
+
+    def handle_data(self, data):
+        if self._textarea is not None:
+            # 與瀏覽器相同，忽略 <textarea> 開頭的第一個換行
+            if self._textarea_start and data.startswith("\n"):
+                data = data[1:]
+            self._textarea_start = False
+            self._textarea[1] += data
+
+
+class _ArticleLinkParser(HTMLParser):
+    """解析頁面中的文章連結與標題"""
+
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.articles = []
+        self.page_links = set()
+        self._link = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "a":
+            return
+        href = dict(attrs).get("href") or ""
+        url = urljoin(self.base_url, href)
+        match = ARTICLE_LINK.search(url.split("?")[0].split("#")[0])
+        if match:
+            self._link = [match.group(1), ""]
+            self.articles.append(self._link)
+        elif "page=" in href:
+            self.page_links.add(url)
+
+    def handle_endtag(self, tag):
+        if tag == "a":
+            self._link = None
+
+    def handle_data(self, data):
+        if self._link is not None:
+            self._link[1] += data
+
+
+def find_edit_form(html: str) -> dict | None:
+    """
+    找出包含 subject 欄位的編輯表單
+
+    Args:
+        html: 頁面 HTML
+
+    Returns:
+        dict | None: 表單資訊（action、method、fields），找不到時回傳 None
+    """
+    parser = _EditFormParser()
+    parser.feed(html)
+    for form in parser.forms:
+        if any(name == "subject" for name, _ in form['fields']):
+            return form
+    return None
+
+
+def find_article_links(html: str, base_url: str) -> tuple[list[tuple[str, str]], list[str]]:
+    """
+    找出頁面中的文章連結與分頁連結
+
+    Args:
+        html: 頁面 HTML
+        base_url: 頁面網址（用來解析相對連結）
+
+    Returns:
+        tuple: ([(article_id, 標題)], [分頁網址])，標題已去除前後空白
+    """
+    parser = _ArticleLinkParser(base_url)
+    parser.feed(html)
+    articles = [(article_id, " ".join(title.split())) for article_id, title in parser.articles]
+    return articles, sorted(parser.page_links)
+
+
+def find_user(html: str) -> str | None:
+    """
+    從頁首的使用者選單取得使用者路徑
+
+    Args:
+        html: 已登入時的頁面 HTML
+
+    Returns:
+        str | None: /users/{user} 中的 user，未登入時回傳 None
+    """
+    match = USER_LINK.search(html or "")
+    return match.group(1) if match else None
+
+
+def find_csrf_token(html: str) -> str | None:
+    """
+    取得頁面中的 CSRF token
+
+    Args:
+        html: 頁面 HTML
+
+    Returns:
+        str | None: CSRF token，找不到時回傳 None
+    """
+    match = CSRF_META.search(html or "") or CSRF_INPUT.search(html or "")
+    return match.group(1) if match else None
@@ -0,0 +1,210 @@
+"""
+HTTP 文章更新模組
+
+登入狀態有效且編輯表單不需要互動驗證時，不啟動瀏覽器，
+直接以已儲存的 cookies 取得編輯表單並送出更新。
+任何無法確認成功的情況都回傳 None，由呼叫端改用瀏覽器流程
+"""
+import asyncio
+import http.cookiejar
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from .article_state import ArticleState
+from .authenticator import ITHELP_URL
+from .client import read_cookies_file
+from .forms import find_csrf_token, find_edit_form
+from .timing import timed
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15"
+)
+
+# 需要互動驗證的表單特徵
+CHALLENGE_MARKERS = ("g-recaptcha", "data-sitekey", "recaptcha/api.js", "h-captcha")
+
+
+class _NoRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """不自動跟隨跳轉，讓呼叫端檢查 Location"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class HttpArticleUpdater:
+    """不啟動瀏覽器的文章更新器（以已儲存的 cookies 直接送出表單）"""
+
+    def __init__(
+        self,
+        cookies: list[dict],
+        state: ArticleState | None = None,
+        timeout: float = 15,
+        base_url: str = ITHELP_URL
+    ):
+        """
+        初始化
+
+        Args:
+            cookies: cookies 列表（格式同 Playwright 的 context.cookies()）
+            state: 文章推送狀態（可選，更新成功後記錄內容雜湊值）
+            timeout: 每個請求的超時時間（秒）
+            base_url: iThome 鐵人賽網站的網址（可改為本機替身伺服器）
+        """
+        self.state = state
+        self.timeout = timeout
+        self.base_url = base_url.rstrip('/')
+
+        self._cookie_jar = http.cookiejar.CookieJar()
+        for cookie in cookies:
+            self._cookie_jar.set_cookie(self._to_cookiejar_cookie(cookie))
+
+        self._opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(self._cookie_jar),
+            _NoRedirectHandler()
+        )
+
+    @classmethod
+    def from_cookies_file(
+        cls,
+        cookies_file: str = "cookies.txt",
+        state: ArticleState | None = None,
+        base_url: str = ITHELP_URL
+    ) -> "HttpArticleUpdater | None":
+        """
+        從 Client 儲存的 cookies 檔案建立更新器
+
+        Args:
+            cookies_file: cookies 檔案路徑
+            state: 文章推送狀態（可選）
+            base_url: iThome 鐵人賽網站的網址
+
+        Returns:
+            HttpArticleUpdater | None: 沒有可用的 cookies 時回傳 None
+        """
+        cookies = read_cookies_file(cookies_file)
+        if not cookies:
+            return None
+        return cls(cookies, state, base_url=base_url)
+
+    @timed()
+    async def update(self, article_data: dict) -> str | None:
+        """
+        以 HTTP 更新文章內容
+
+        Args:
+            article_data: 文章資料字典，包含:
+                - article_id: 文章 ID
+                - subject: 文章標題
+                - description: 文章內容
+
+        Returns:
+            str | None: 成功時回傳 article_id；需要改用瀏覽器流程時回傳 None
+        """
+        result = await asyncio.to_thread(self._update, article_data)
+        if self.state and result:
+            self.state.record(result, article_data['subject'], article_data['description'])
+        return result
+
+    def _update(self, article_data: dict) -> str | None:
+        """以同步方式執行更新（在背景執行緒中執行）"""
+        article_id = str(article_data['article_id'])
+        edit_url = f"{self.base_url}/articles/{article_id}/edit"
+
+        # 取得編輯頁面（被導向登入頁面等情況都不是 200）
+        status, _, html = self._request(edit_url)
+        if status != 200:
+            return None
+
+        # 需要互動驗證時改用瀏覽器
+        if any(marker in html for marker in CHALLENGE_MARKERS):
+            return None
+
+        form = find_edit_form(html)
+        if form is None or form['method'] != "post":
+            return None
+
+        # 沒有 CSRF token 時送出必定失敗（419），不浪費一次提交
+        token = find_csrf_token(html)
+        if token is None:
+            return None
+
+        # 填入新的標題與內容（其餘欄位如 CSRF token 原樣送出）
+        fields = [
+            (name, article_data['subject'] if name == "subject"
+             else article_data['description'] if name == "description"
+             else value)
+            for name, value in form['fields']
+        ]
+        if "description" not in dict(fields):
+            return None
+        if "_token" not in dict(fields):
+            # token 只在 <meta name="csrf-token"> 中時補上表單欄位
+            fields.append(("_token", token))
+
+        action_url = urllib.parse.urljoin(edit_url, form['action'] or edit_url)
+        status, location, _ = self._request(action_url, data=urllib.parse.urlencode(fields).encode('utf-8'), referer=edit_url)
+
+        # 只有跳轉回文章頁面才視為成功
+        if status in (301, 302, 303) and location:
+            location_path = urllib.parse.urlparse(urllib.parse.urljoin(action_url, location)).path
+            if location_path.rstrip('/') == f"/articles/{article_id}":
+                return article_id
+
+        return None
+
+    def _request(self, url: str, data: bytes | None = None, referer: str | None = None) -> tuple[int, str | None, str]:
+        """
+        送出請求
+
+        Returns:
+            tuple: (狀態碼, Location 標頭, 回應內容)
+        """
+        headers = {"User-Agent": USER_AGENT, "Accept": "text/html,application/xhtml+xml"}
+        if data is not None:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+            headers["Origin"] = self.base_url
+        if referer:
+            headers["Referer"] = referer
+
+        request = urllib.request.Request(url, data=data, headers=headers)
+        try:
+            with self._opener.open(request, timeout=self.timeout) as response:
+                return response.status, response.headers.get("Location"), self._read_text(response)
+        except urllib.error.HTTPError as e:
+            # 3xx（未跟隨的跳轉）與 4xx/5xx 都會以 HTTPError 回傳
+            return e.code, e.headers.get("Location"), ""
+        except (urllib.error.URLError, OSError):
+            return 0, None, ""
+
+    @staticmethod
+    def _read_text(response) -> str:
+        """讀取回應內容並依 charset 解碼"""
+        charset = response.headers.get_content_charset() or "utf-8"
+        return response.read().decode(charset, errors="replace")
+
+    @staticmethod
+    def _to_cookiejar_cookie(cookie: dict) -> http.cookiejar.Cookie:
+        """將 Playwright 格式的 cookie 轉為 http.cookiejar 的 Cookie"""
+        domain = cookie['domain']
+        expires = cookie.get('expires', -1)
+        session = expires is None or expires < 0
+        return http.cookiejar.Cookie(
+            version=0,
+            name=cookie['name'],
+            value=cookie['value'],
+            port=None,
+            port_specified=False,
+            domain=domain,
+            domain_specified=True,
+            domain_initial_dot=domain.startswith('.'),
+            path=cookie.get('path', '/'),
+            path_specified=True,
+            secure=cookie.get('secure', False),
+            expires=None if session else int(expires),
+            discard=session,
+            comment=None,
+            comment_url=None,
+            rest={"HttpOnly": None} if cookie.get('httpOnly') else {},
+        )
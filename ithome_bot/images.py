@@ -0,0 +1,290 @@
+"""
+圖片上傳模組
+
+提交前找出 Markdown 中引用的本機圖片（例如 `![](./img/x.png)`），
+以編輯器的圖片上傳功能上傳，並將引用改為上傳後的網址。
+程式碼區塊與行內程式碼中的圖片語法只是文字，不會上傳也不會改寫。
+以圖片內容的雜湊值記錄上傳後的網址：內容相同的圖片（即使檔名不同）不會重複上傳，
+所有圖片都已上傳過時不需要任何網路請求；需要上傳的圖片同時上傳。
+"""
+import asyncio
+import bisect
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import tempfile
+from pathlib import Path
+from urllib.parse import unquote, urljoin, urlparse
+
+from playwright.async_api import APIRequestContext
+
+from .authenticator import ITHELP_URL
+from .forms import find_csrf_token
+
+# 編輯器圖片上傳的預設路徑與欄位名稱（尚未對照實際網站確認，可由 ImageUploader 的參數覆寫）
+UPLOAD_PATH = "/upload/images"
+UPLOAD_FIELD = "image"
+
+# Markdown 圖片 ![alt](path "title") 與 HTML <img src="path">
+MARKDOWN_IMAGE = re.compile(r'(!\[[^\]]*\]\(\s*)(<[^>\n]+>|[^)\s]+)((?:\s+"[^"\n]*")?\s*\))')
+HTML_IMAGE = re.compile(r'(<img\b[^>]*?\bsrc\s*=\s*["\'])([^"\']+)(["\'])', re.I)
+
+# 圍欄程式碼區塊（``` 或 ~~~，未關閉時到內容結尾）與行內程式碼
+CODE = re.compile(
+    r'^ {0,3}(`{3,}|~{3,})[^\n]*(?:\n.*?^ {0,3}\1[`~]*[ \t]*$|.*\Z)|(`+)(?!`).+?(?<!`)\2(?!`)',
+    re.M | re.S
+)
+
+# 同時上傳的圖片數量
+UPLOAD_CONCURRENCY = 4
+
+
+def _is_local(reference: str) -> bool:
+    """引用是否為本機檔案（不是網址、data URI 或頁內連結）"""
+    return not (urlparse(reference).scheme or reference.startswith(('//', '#')))
+
+
+def _code_spans(description: str) -> list[tuple[int, int]]:
+    """程式碼區塊與行內程式碼的範圍（依位置排序）"""
+    return [match.span() for match in CODE.finditer(description)]
+
+
+def _in_code(position: int, spans: list[tuple[int, int]]) -> bool:
+    """位置是否在程式碼區塊或行內程式碼中"""
+    index = bisect.bisect_right(spans, (position, float('inf'))) - 1
+    return index >= 0 and spans[index][0] <= position < spans[index][1]
+
+
+def local_images(description: str) -> list[str]:
+    """
+    找出內容中引用的本機圖片
+
+    Args:
+        description: Markdown 內容
+
+    Returns:
+        list[str]: 圖片引用（依出現順序，不重複，略過程式碼中的圖片語法）
+    """
+    references = []
+    spans = _code_spans(description)
+    for pattern in (MARKDOWN_IMAGE, HTML_IMAGE):
+        for match in pattern.finditer(description):
+            reference = match.group(2).strip('<>')
+            if _in_code(match.start(), spans):
+                continue
+            if _is_local(reference) and reference not in references:
+                references.append(reference)
+    return references
+
+
+class ImageUploader:
+    """上傳本機圖片並以內容雜湊值快取上傳後的網址"""
+
+    def __init__(
+        self,
+        cache_file: str = ".ithome_images.json",
+        base_url: str = ITHELP_URL,
+        concurrency: int = UPLOAD_CONCURRENCY,
+        upload_path: str = UPLOAD_PATH,
+        upload_field: str = UPLOAD_FIELD
+    ):
+        """
+        初始化
+
+        Args:
+            cache_file: 快取檔案路徑（{內容雜湊值: 網址}）
+            base_url: iThome 鐵人賽網站的網址
+            concurrency: 同時上傳的圖片數量
+            upload_path: 編輯器圖片上傳的路徑
+            upload_field: 上傳表單中圖片檔案的欄位名稱
+        """
+        self.cache_file = Path(cache_file)
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = concurrency
+        self.upload_path = '/' + upload_path.lstrip('/')
+        self.upload_field = upload_field
+        # 本次執行上傳的圖片數量
+        self.upload_count = 0
+        self._cache = None
+        self._uploads = {}
+        self._tokens = {}
+        self._semaphore = None
+
+    async def rewrite(self, description: str, base_dir: str | Path, request: APIRequestContext | None = None) -> str:
+        """
+        將本機圖片的引用改為上傳後的網址
+
+        Args:
+            description: Markdown 內容
+            base_dir: 解析相對路徑的目錄（通常是 Markdown 檔案所在目錄）
+            request: 用來上傳的 APIRequestContext（需已登入，例如 page.context.request）；
+                未提供時只改寫已上傳過的圖片
+
+        Returns:
+            str: 改寫後的內容（找不到的檔案與尚未上傳的圖片保留原本的引用）
+
+        Raises:
+            RuntimeError: 上傳失敗
+        """
+        hashes = {}
+        for reference in local_images(description):
+            path = Path(base_dir) / unquote(reference)
+            if path.is_file():
+                hashes[reference] = (path, self._hash(path.read_bytes()))
+        if not hashes:
+            return description
+
+        cache = self._load()
+        missing = {digest: path for path, digest in hashes.values() if digest not in cache}
+        if missing and request is not None:
+            # 其他文章正在上傳相同的圖片時等待同一個上傳結果
+            uploads = [self._upload_once(request, digest, path) for digest, path in missing.items()]
+            await asyncio.gather(*uploads)
+            self._save()
+
+        urls = {reference: cache[digest] for reference, (_, digest) in hashes.items() if digest in cache}
+        return self._replace(description, urls)
+
+    def pending(self, description: str, base_dir: str | Path) -> list[Path]:
+        """
+        找出尚未上傳的本機圖片
+
+        Args:
+            description: Markdown 內容
+            base_dir: 解析相對路徑的目錄
+
+        Returns:
+            list[Path]: 需要上傳的圖片檔案
+        """
+        cache = self._load()
+        paths = []
+        for reference in local_images(description):
+            path = Path(base_dir) / unquote(reference)
+            if path.is_file() and self._hash(path.read_bytes()) not in cache:
+                paths.append(path)
+        return paths
+
+    async def _upload_once(self, request: APIRequestContext, digest: str, path: Path) -> None:
+        """上傳一張圖片（相同內容同時只上傳一次）"""
+        if digest not in self._uploads:
+            self._uploads[digest] = asyncio.ensure_future(self._upload(request, digest, path))
+        try:
+            await asyncio.shield(self._uploads[digest])
+        finally:
+            # 失敗時下次重新上傳
+            if self._uploads[digest].done() and self._uploads[digest].exception() is not None:
+                self._uploads.pop(digest, None)
+
+    async def _upload(self, request: APIRequestContext, digest: str, path: Path) -> None:
+        """
+        以編輯器的圖片上傳功能上傳圖片，並記錄上傳後的網址
+
+        Raises:
+            RuntimeError: 上傳失敗或回應中沒有網址
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self._semaphore:
+            token = await self._csrf_token(request)
+            mime_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            response = await request.post(
+                f"{self.base_url}{self.upload_path}",
+                multipart={
+                    "_token": token,
+                    self.upload_field: {"name": path.name, "mimeType": mime_type, "buffer": path.read_bytes()},
+                },
+                headers={"X-CSRF-TOKEN": token, "X-Requested-With": "XMLHttpRequest", "Accept": "application/json"},
+            )
+            if not response.ok:
+                raise RuntimeError(f"上傳圖片 {path} 失敗: HTTP {response.status}")
+            try:
+                url = self._find_url(await response.json())
+            except ValueError:
+                url = None
+            if not url:
+                raise RuntimeError(f"上傳圖片 {path} 失敗: 回應中沒有圖片網址")
+
+        self._load()[digest] = urljoin(f"{self.base_url}/", url)
+        self.upload_count += 1
+
+    async def _csrf_token(self, request: APIRequestContext) -> str:
+        """
+        從頁面取得 CSRF token（同一個 APIRequestContext 只讀取一次）
+
+        Raises:
+            RuntimeError: 未登入或頁面中沒有 CSRF token
+        """
+        key = id(request)
+        if key not in self._tokens:
+            self._tokens[key] = asyncio.ensure_future(self._fetch_csrf_token(request))
+        try:
+            return await asyncio.shield(self._tokens[key])
+        except RuntimeError:
+            self._tokens.pop(key, None)
+            raise
+
+    async def _fetch_csrf_token(self, request: APIRequestContext) -> str:
+        response = await request.get(f"{self.base_url}/")
+        token = find_csrf_token(await response.text()) if response.ok else None
+        if not token:
+            raise RuntimeError("無法取得上傳圖片所需的 CSRF token，請確認已登入")
+        return token
+
+    @classmethod
+    def _find_url(cls, data) -> str | None:
+        """從上傳回應中找出圖片網址（url、link、location 等欄位，可能包在 data 中）"""
+        if isinstance(data, str):
+            return data
+        if isinstance(data, dict):
+            for key in ("url", "link", "location", "src", "path"):
+                if isinstance(data.get(key), str):
+                    return data[key]
+            for value in data.values():
+                if isinstance(value, dict) and (url := cls._find_url(value)):
+                    return url
+        return None
+
+    @staticmethod
+    def _replace(description: str, urls: dict) -> str:
+        """將圖片引用改為網址（不改寫程式碼中的圖片語法）"""
+        def replacer(spans: list[tuple[int, int]], strip: str):
+            def replace(match):
+                url = None if _in_code(match.start(), spans) else urls.get(match.group(2).strip(strip))
+                return f"{match.group(1)}{url}{match.group(3)}" if url else match.group(0)
+            return replace
+
+        description = MARKDOWN_IMAGE.sub(replacer(_code_spans(description), '<>'), description)
+        # 改寫後位置改變，重新找出程式碼的範圍
+        return HTML_IMAGE.sub(replacer(_code_spans(description), ''), description)
+
+    def _load(self) -> dict:
+        """讀取快取檔案（只在第一次使用時讀取）"""
+        if self._cache is None:
+            self._cache = {}
+            if self.cache_file.exists():
+                try:
+                    with open(self.cache_file, 'r', encoding='utf-8') as f:
+                        self._cache = json.load(f)
+                except (OSError, ValueError):
+                    # 快取損毀時視為沒有快取（圖片會重新上傳）
+                    self._cache = {}
+        return self._cache
+
+    def _save(self) -> None:
+        """寫入快取檔案（先寫入暫存檔再取代）"""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_file.parent, prefix=f".{self.cache_file.name}.")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._load(), f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(temp_path, self.cache_file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    def _hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
@@ -4,6 +4,36 @@ reCAPTCHA 處理模組
 import random
 from playwright.async_api import Page
 
+from .waiting import wait_for_condition, wait_for_locator
+
+# reCAPTCHA iframe 已捲動到可視範圍內
+RECAPTCHA_IN_VIEWPORT = """
+    () => {
+        const iframe = document.querySelector('iframe[src*="recaptcha/api2/anchor"]');
+        if (!iframe) {
+            return true;
+        }
+        const rect = iframe.getBoundingClientRect();
+        return rect.top >= 0 && rect.bottom <= window.innerHeight;
+    }
+"""
+
+# reCAPTCHA 已取得 token，或出現圖片挑戰
+RECAPTCHA_SETTLED = """
+    () => {
+        const token = document.querySelector('textarea[name="g-recaptcha-response"]');
+        if (token && token.value) {
+            return true;
+        }
+        const challenge = document.querySelector('iframe[src*="recaptcha/api2/bframe"]');
+        if (!challenge) {
+            return false;
+        }
+        const rect = challenge.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    }
+"""
+
 
 class ReCaptcha:
     """reCAPTCHA 處理器"""
@@ -55,7 +85,7 @@ class ReCaptcha:
             recaptcha_iframe = self.page.locator('iframe[src*="recaptcha/api2/anchor"]')
             if await recaptcha_iframe.count() > 0:
                 await recaptcha_iframe.first.scroll_into_view_if_needed()
-                await self.page.wait_for_timeout(500)
+                await wait_for_condition(self.page, RECAPTCHA_IN_VIEWPORT, timeout=1000)
                 # 已捲動到 reCAPTCHA
         except Exception as e:
             # 捲動到 reCAPTCHA 失敗: {e}
@@ -65,8 +95,11 @@ class ReCaptcha:
         """嘗試自動解決 reCAPTCHA"""
         # 嘗試自動處理 reCAPTCHA checkbox...
 
-        # 隨機等待，模擬人類行為
-        await self.page.wait_for_timeout(random.randint(1000, 3000))
+        # 等待 checkbox 載入完成
+        recaptcha_frame = self.page.frame_locator('iframe[src*="recaptcha/api2/anchor"]')
+        await wait_for_locator(
+            self.page, recaptcha_frame.locator('.recaptcha-checkbox'), "visible", timeout=5000
+        )
 
         # 使用 frame_locator 點擊 checkbox
         if await self._try_frame_locator():
@@ -101,9 +134,8 @@ class ReCaptcha:
 
     async def _verify_completion(self) -> bool:
         """驗證 reCAPTCHA 完成狀態"""
-        # 等待驗證完成
-        # 等待 reCAPTCHA 驗證完成...
-        await self.page.wait_for_timeout(3000)
+        # 等待 reCAPTCHA 驗證完成（取得 token 或出現圖片挑戰）
+        await wait_for_condition(self.page, RECAPTCHA_SETTLED, timeout=3000)
 
         # 檢查是否出現圖片挑戰
         if await self._has_image_challenge():
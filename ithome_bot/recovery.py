@@ -0,0 +1,173 @@
+"""
+提交結果確認模組
+
+提交後等待跳轉逾時不代表失敗，表單常常其實已經送出。
+結果不明時以共用 BrowserContext cookies 的 HTTP 請求（不轉譯頁面）確認線上的實際狀態:
+    - 更新：比較編輯表單中的標題與內容雜湊值
+    - 建立：在系列文章列表中尋找相同標題的文章
+確認未成功時才以指數退避重試；建立文章只在確認線上沒有該文章時才重試，
+無法確認（列表讀取失敗、找不到使用者、分頁未讀完）時停止並回報失敗，不會重複發表。
+"""
+import re
+from urllib.parse import urlparse
+
+from playwright.async_api import Page
+
+from .article_state import ArticleState
+from .authenticator import ITHELP_URL
+from .forms import find_article_links, find_edit_form, find_user
+from .timing import timed
+
+# 系列文章列表最多讀取的分頁數
+MAX_SERIES_PAGES = 10
+
+
+class VerificationUnknown(Exception):
+    """無法確認線上狀態（不能視為未生效）"""
+
+
+class RetryPolicy:
+    """提交失敗時的重試次數與指數退避等待時間"""
+
+    def __init__(self, retries: int = 2, backoff: float = 1.0, factor: float = 2.0, max_backoff: float = 30.0):
+        """
+        初始化
+
+        Args:
+            retries: 確認未成功後的重試次數（0 表示只確認不重試）
+            backoff: 第一次確認前的等待時間（秒）
+            factor: 每次重試後等待時間的倍數
+            max_backoff: 等待時間上限（秒）
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.factor = factor
+        self.max_backoff = max_backoff
+
+    def delay(self, attempt: int) -> float:
+        """
+        第 attempt 次（從 0 開始）失敗後，確認與重試前的等待時間
+
+        Args:
+            attempt: 失敗的次數（從 0 開始）
+
+        Returns:
+            float: 等待時間（秒）
+        """
+        return min(self.backoff * self.factor ** attempt, self.max_backoff)
+
+
+class SubmitVerifier:
+    """以 HTTP 請求確認提交是否已經生效"""
+
+    def __init__(self, page: Page, base_url: str = ITHELP_URL):
+        """
+        初始化
+
+        Args:
+            page: Playwright 頁面物件（使用其 BrowserContext 的 cookies）
+            base_url: iThome 鐵人賽網站的網址
+        """
+        self.page = page
+        self.base_url = base_url.rstrip('/')
+        # 最近一次確認時被導向其他網站（例如登入頁面），重試也不會成功
+        self.logged_out = False
+        self._user = None
+
+    @timed()
+    async def verify_update(self, article_id: str, subject: str, description: str) -> bool:
+        """
+        確認線上的文章標題與內容是否已經是預期的內容
+
+        Args:
+            article_id: 文章 ID
+            subject: 預期的標題
+            description: 預期的內容
+
+        Returns:
+            bool: 線上內容與預期相同時回傳 True
+        """
+        html = await self._get(f"{self.base_url}/articles/{article_id}/edit")
+        form = find_edit_form(html) if html else None
+        if form is None:
+            return False
+
+        fields = dict(form['fields'])
+        current = ArticleState.content_hash(fields.get('subject', ''), self._normalize(fields.get('description', '')))
+        return current == ArticleState.content_hash(subject, self._normalize(description))
+
+    @timed()
+    async def find_created(self, category_id: str, subject: str) -> str | None:
+        """
+        在系列文章列表中尋找相同標題的文章
+
+        Args:
+            category_id: 系列 ID
+            subject: 文章標題
+
+        Returns:
+            str | None: 找到時回傳 article_id，確認列表中沒有該文章時回傳 None
+
+        Raises:
+            VerificationUnknown: 找不到使用者、列表讀取失敗或分頁未讀完，無法確認是否已建立
+        """
+        user = await self._find_user()
+        if user is None:
+            raise VerificationUnknown("無法從頁首取得使用者路徑")
+
+        expected = " ".join(subject.split())
+        url = f"{self.base_url}/users/{user}/ironman/{category_id}"
+        visited = set()
+        pending = [url]
+        while pending and len(visited) < MAX_SERIES_PAGES:
+            url = pending.pop()
+            visited.add(url)
+            html = await self._get(url)
+            if not html:
+                raise VerificationUnknown(f"無法讀取系列文章列表 {url}")
+
+            articles, page_links = find_article_links(html, url)
+            for article_id, title in articles:
+                if title == expected:
+                    return article_id
+            # 新文章通常在最後一頁，先讀取編號較大的分頁
+            pending = sorted(set(pending) | (set(page_links) - visited), key=self._page_number)
+        if pending:
+            raise VerificationUnknown(f"系列文章列表超過 {MAX_SERIES_PAGES} 頁，未讀取完")
+        return None
+
+    async def _find_user(self) -> str | None:
+        """從頁首的使用者選單取得使用者路徑（只讀取一次）"""
+        if self._user is None:
+            self._user = find_user(await self._get(f"{self.base_url}/"))
+        return self._user
+
+    async def _get(self, url: str) -> str | None:
+        """
+        以 BrowserContext 的 cookies 送出 GET 請求
+
+        Returns:
+            str | None: 回應內容，失敗或被導向其他網站時回傳 None
+        """
+        try:
+            response = await self.page.context.request.get(url)
+        except Exception:
+            return None
+
+        if urlparse(response.url).netloc != urlparse(self.base_url).netloc or "/login" in urlparse(response.url).path:
+            self.logged_out = True
+            return None
+        if not response.ok:
+            return None
+        self.logged_out = False
+        return await response.text()
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """表單欄位會將換行統一為 \\n"""
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+
+    @staticmethod
+    def _page_number(url: str) -> int:
+        match = re.search(r'[?&]page=(\d+)', url)
+        return int(match.group(1)) if match else 1
@@ -0,0 +1,129 @@
+"""
+網路請求過濾模組
+
+攔截自動化流程用不到的圖片、字型、廣告與追蹤腳本，
+減少頁面載入時間與等待 networkidle 的時間
+"""
+from urllib.parse import urlparse
+
+from playwright.async_api import BrowserContext, Request, Route
+
+# 預設攔截的資源類型
+DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+
+# 預設攔截的網域（廣告與追蹤，包含子網域）
+DEFAULT_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "facebook.net",
+    "facebook.com",
+    "scorecardresearch.com",
+    "hotjar.com",
+    "clarity.ms",
+)
+
+# 一律放行的 URL（reCAPTCHA 需要載入圖片與腳本才能運作）
+DEFAULT_ALLOWED_URLS = (
+    "www.google.com/recaptcha/",
+    "www.gstatic.com/recaptcha/",
+    "www.recaptcha.net/recaptcha/",
+)
+
+
+class RequestFilter:
+    """網路請求過濾器"""
+
+    def __init__(
+        self,
+        blocked_resource_types: tuple = DEFAULT_BLOCKED_RESOURCE_TYPES,
+        blocked_domains: tuple = DEFAULT_BLOCKED_DOMAINS,
+        allowed_urls: tuple = DEFAULT_ALLOWED_URLS
+    ):
+        """
+        初始化
+
+        Args:
+            blocked_resource_types: 要攔截的資源類型（Playwright 的 resource_type）
+            blocked_domains: 要攔截的網域（包含子網域）
+            allowed_urls: 一律放行的 URL 片段（優先於攔截規則）
+        """
+        self.blocked_resource_types = set(blocked_resource_types)
+        self.blocked_domains = tuple(blocked_domains)
+        self.allowed_urls = tuple(allowed_urls)
+
+        # 執行期間的統計
+        self.allowed_count = 0
+        self.blocked_count = 0
+        self.blocked_by_type = {}
+        self.transferred_bytes = 0
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """
+        判斷請求是否要攔截
+
+        Args:
+            url: 請求 URL
+            resource_type: 資源類型
+
+        Returns:
+            bool: 是否攔截
+        """
+        if any(allowed in url for allowed in self.allowed_urls):
+            return False
+
+        if resource_type in self.blocked_resource_types:
+            return True
+
+        host = urlparse(url).hostname or ""
+        return any(host == domain or host.endswith(f".{domain}") for domain in self.blocked_domains)
+
+    async def install(self, context: BrowserContext) -> None:
+        """
+        在 BrowserContext 上安裝過濾器（套用到 context 中所有的 Page）
+
+        Args:
+            context: Playwright 的 BrowserContext 物件
+        """
+        await context.route("**/*", self._handle_route)
+        context.on("requestfinished", self._on_request_finished)
+
+    def summary(self) -> str:
+        """
+        取得統計摘要
+
+        Returns:
+            str: 一行統計摘要
+        """
+        by_type = ", ".join(f"{resource_type}: {count}" for resource_type, count in sorted(self.blocked_by_type.items()))
+        blocked = f"已攔截 {self.blocked_count} 個請求" + (f"（{by_type}）" if by_type else "")
+        return f"{blocked}，放行 {self.allowed_count} 個請求，傳輸 {self.transferred_bytes / 1024:.1f} KB"
+
+    async def _handle_route(self, route: Route) -> None:
+        """攔截或放行請求"""
+        request = route.request
+        if not self.should_block(request.url, request.resource_type):
+            self.allowed_count += 1
+            await route.continue_()
+            return
+
+        self.blocked_count += 1
+        self.blocked_by_type[request.resource_type] = self.blocked_by_type.get(request.resource_type, 0) + 1
+
+        if request.resource_type == "script":
+            # 腳本回傳空內容，避免頁面因載入失敗而中斷
+            await route.fulfill(status=200, content_type="application/javascript", body="")
+        else:
+            await route.abort("blockedbyclient")
+
+    async def _on_request_finished(self, request: Request) -> None:
+        """累計放行請求的傳輸量"""
+        try:
+            sizes = await request.sizes()
+            self.transferred_bytes += sizes['responseBodySize'] + sizes['responseHeadersSize']
+        except Exception:
+            # 頁面已關閉等情況無法取得大小
+            pass
@@ -0,0 +1,202 @@
+"""
+鐵人賽系列解析模組
+
+從頁首的鐵人發文選單找出使用者的系列與各系列的建立文章網址，快取到本機（有效期限內不重新讀取），
+建立文章時直接導航到建立頁面，省去開啟選單與選擇系列的操作。
+快取的網址失效（例如 404）時由呼叫端改用選單，並以實際的網址更新快取。
+"""
+import asyncio
+import html
+import json
+import re
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+from playwright.async_api import APIRequestContext
+
+from .authenticator import ITHELP_URL
+
+# 預設的鐵人賽路徑（每年不同，可用 --contest-path 或 ITHOME_CONTEST_PATH 設定）
+DEFAULT_CONTEST_PATH = "2025ironman"
+
+# 快取有效期限（秒）
+SERIES_TTL = 24 * 3600
+
+# 選單中的系列連結
+SERIES_LINK = r'<a\b[^>]*?href="([^"]*?/{contest}/create/(\d+))"[^>]*>(.*?)</a>'
+
+
+class SeriesResolver:
+    """解析並快取鐵人賽系列的建立文章網址"""
+
+    def __init__(
+        self,
+        contest_path: str = DEFAULT_CONTEST_PATH,
+        cache_file: str | None = None,
+        ttl: float = SERIES_TTL
+    ):
+        """
+        初始化
+
+        Args:
+            contest_path: 鐵人賽路徑（例如 2025ironman）
+            cache_file: 快取檔案路徑（可選，未提供時只快取在記憶體中）
+            ttl: 快取有效期限（秒）
+        """
+        self.contest_path = contest_path.strip('/')
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.ttl = ttl
+        self._cache = None
+        self._lock = asyncio.Lock()
+
+    def create_url_pattern(self, category_id: str) -> str:
+        """
+        建立文章網址中的路徑（用於在選單中尋找連結）
+
+        Args:
+            category_id: 系列 ID
+
+        Returns:
+            str: 例如 /2025ironman/create/8446
+        """
+        return f"/{self.contest_path}/create/{category_id}"
+
+    async def resolve(self, request: APIRequestContext, base_url: str, category_id: str) -> str | None:
+        """
+        取得系列的建立文章網址（快取過期或沒有該系列時重新讀取選單）
+
+        Args:
+            request: 用來讀取選單的 APIRequestContext（例如 page.context.request，共用登入狀態）
+            base_url: iThome 鐵人賽網站的網址
+            category_id: 系列 ID
+
+        Returns:
+            str | None: 建立文章網址，選單中找不到該系列時回傳 None
+        """
+        category_id = str(category_id)
+        async with self._lock:
+            entry = self._entry(base_url)
+            fresh = time.time() - entry.get('fetched_at', 0) < self.ttl
+            if not fresh or category_id not in entry.get('series', {}):
+                series = await self._discover(request, base_url)
+                if series is not None:
+                    # 快取仍有效時合併（多個帳號共用快取時保留其他帳號的系列）
+                    if fresh:
+                        series = {**entry.get('series', {}), **series}
+                    entry = {"fetched_at": time.time(), "series": series}
+                    self._store(base_url, entry)
+
+        series = entry.get('series', {}).get(category_id)
+        return series['create_url'] if series else None
+
+    async def discover(self, request: APIRequestContext, base_url: str = ITHELP_URL) -> dict:
+        """
+        重新讀取選單並更新快取
+
+        Args:
+            request: 用來讀取選單的 APIRequestContext（需已登入）
+            base_url: iThome 鐵人賽網站的網址
+
+        Returns:
+            dict: {系列 ID: {"name": 名稱, "create_url": 建立文章網址}}，讀取失敗時回傳快取中的系列
+        """
+        async with self._lock:
+            series = await self._discover(request, base_url)
+            if series is not None:
+                self._store(base_url, {"fetched_at": time.time(), "series": series})
+        return self.series(base_url)
+
+    def series(self, base_url: str = ITHELP_URL) -> dict:
+        """
+        取得快取中的系列
+
+        Args:
+            base_url: iThome 鐵人賽網站的網址
+
+        Returns:
+            dict: {系列 ID: {"name": 名稱, "create_url": 建立文章網址}}
+        """
+        return dict(self._entry(base_url).get('series', {}))
+
+    def remember(self, base_url: str, category_id: str, create_url: str) -> None:
+        """
+        以實際使用的網址更新快取（例如經由選單導航後）
+
+        Args:
+            base_url: iThome 鐵人賽網站的網址
+            category_id: 系列 ID
+            create_url: 建立文章網址
+        """
+        entry = self._entry(base_url)
+        series = dict(entry.get('series', {}))
+        name = series.get(str(category_id), {}).get('name', "")
+        series[str(category_id)] = {"name": name, "create_url": create_url}
+        self._store(base_url, {"fetched_at": entry.get('fetched_at', time.time()), "series": series})
+
+    def invalidate(self, base_url: str, category_id: str | None = None) -> None:
+        """
+        移除快取（網址失效時呼叫）
+
+        Args:
+            base_url: iThome 鐵人賽網站的網址
+            category_id: 系列 ID（未提供時移除整個網站的快取）
+        """
+        entry = self._entry(base_url)
+        if category_id is None:
+            entry = {}
+        else:
+            series = dict(entry.get('series', {}))
+            series.pop(str(category_id), None)
+            entry = {**entry, "series": series}
+        self._store(base_url, entry)
+
+    async def _discover(self, request: APIRequestContext, base_url: str) -> dict | None:
+        """
+        讀取頁首的鐵人發文選單（以 HTTP 請求取得，不轉譯頁面）
+
+        Returns:
+            dict | None: {系列 ID: {"name", "create_url"}}，讀取失敗時回傳 None
+        """
+        try:
+            response = await request.get(f"{base_url.rstrip('/')}/")
+            if not response.ok:
+                return None
+            content = await response.text()
+        except Exception:
+            return None
+
+        pattern = re.compile(SERIES_LINK.format(contest=re.escape(self.contest_path)), re.S | re.I)
+        series = {}
+        for href, category_id, label in pattern.findall(content):
+            name = " ".join(html.unescape(re.sub(r'<[^>]+>', ' ', label)).split())
+            series[category_id] = {
+                "name": name,
+                "create_url": urljoin(f"{base_url.rstrip('/')}/", html.unescape(href)),
+            }
+        return series
+
+    def _key(self, base_url: str) -> str:
+        return f"{base_url.rstrip('/')}/{self.contest_path}"
+
+    def _entry(self, base_url: str) -> dict:
+        """取得網站的快取（只在第一次使用時讀取檔案）"""
+        if self._cache is None:
+            self._cache = {}
+            if self.cache_file and self.cache_file.exists():
+                try:
+                    with open(self.cache_file, 'r', encoding='utf-8') as f:
+                        self._cache = json.load(f)
+                except (OSError, ValueError):
+                    # 快取檔案損毀時視為沒有快取
+                    self._cache = {}
+        return self._cache.get(self._key(base_url), {})
+
+    def _store(self, base_url: str, entry: dict) -> None:
+        """更新網站的快取並寫入檔案"""
+        self._entry(base_url)
+        self._cache[self._key(base_url)] = entry
+        if self.cache_file:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f, ensure_ascii=False, indent=2, sort_keys=True)
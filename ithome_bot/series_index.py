@@ -0,0 +1,300 @@
+"""
+系列文章索引模組
+
+讀取使用者的系列文章列表，在本機建立「文章 ID、標題、第幾天、最後變更時間」的索引，
+讓命令列以 --day 或檔案名稱（例如 day07.md）找到文章 ID，不需要每次執行都讀取網頁。
+
+系列文章列表依發表順序排列，新文章只會出現在最後一頁，
+因此同步時只讀取上次同步的最後一頁與之後的分頁（--full 時重新讀取全部），其餘分頁同時讀取。
+"""
+import asyncio
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from playwright.async_api import APIRequestContext
+
+from .authenticator import ITHELP_URL
+from .forms import find_article_links, find_user
+from .timing import timed
+
+# 索引檔案格式版本
+INDEX_VERSION = 1
+
+# 標題中的天數（Day 07、Day7、第 7 天）
+TITLE_DAY = re.compile(r'\bday\s*[-_]?\s*0*(\d+)|第\s*0*(\d+)\s*[天日篇]', re.I)
+
+# 鐵人賽的天數上限
+MAX_DAY = 30
+
+# 檔案名稱中的天數（day07.md、day-7-xxx.md、python-day_12.md）
+FILE_DAY = re.compile(r'(?:^|[^a-z])day[-_ ]?0*(\d+)(?!\d)', re.I)
+
+# 檔案名稱開頭的天數（07-xxx.md）
+FILE_LEADING_DAY = re.compile(r'^0*(\d+)(?!\d)')
+
+
+def day_from_title(title: str) -> int | None:
+    """
+    從文章標題取得第幾天
+
+    Args:
+        title: 文章標題
+
+    Returns:
+        int | None: 天數，標題中沒有天數時回傳 None
+    """
+    match = TITLE_DAY.search(title)
+    return int(match.group(1) or match.group(2)) if match else None
+
+
+def day_from_filename(path: str) -> int | None:
+    """
+    從檔案名稱取得第幾天
+
+    檔名沒有 day 時只接受開頭不超過 MAX_DAY 的數字，
+    避免把 2025-09-01-intro.md 的年份當成天數
+
+    Args:
+        path: 檔案路徑（只看檔名，不含副檔名）
+
+    Returns:
+        int | None: 天數，檔名中沒有天數時回傳 None
+    """
+    stem = Path(path).stem
+    match = FILE_DAY.search(stem)
+    if match:
+        return int(match.group(1))
+
+    match = FILE_LEADING_DAY.match(stem)
+    if match and 1 <= int(match.group(1)) <= MAX_DAY:
+        return int(match.group(1))
+    return None
+
+
+class SeriesIndex:
+    """本機的系列文章索引"""
+
+    def __init__(self, index_file: str = ".ithome_index.json"):
+        """
+        初始化
+
+        Args:
+            index_file: 索引檔案路徑
+        """
+        self.index_file = Path(index_file)
+        self._series = None
+        self._by_id = {}
+        self._by_day = {}
+
+    def find(self, day: int, category_id: str | None = None) -> str | None:
+        """
+        以天數尋找文章 ID
+
+        Args:
+            day: 第幾天
+            category_id: 系列 ID（索引中只有一個系列時可省略）
+
+        Returns:
+            str | None: 文章 ID，找不到時回傳 None
+
+        Raises:
+            ValueError: 索引中有多個系列且未指定 category_id
+        """
+        self._load()
+        if category_id is None:
+            series = self.series()
+            if len(series) > 1:
+                raise ValueError(f"索引中有多個系列（{', '.join(series)}），請指定系列 ID")
+            if not series:
+                return None
+            category_id = series[0]
+        return self._by_day.get((str(category_id), day))
+
+    def get(self, article_id: str) -> dict | None:
+        """
+        取得文章在索引中的資料
+
+        Args:
+            article_id: 文章 ID
+
+        Returns:
+            dict | None: {"article_id", "category_id", "title", "day", "modified"}，找不到時回傳 None
+        """
+        self._load()
+        return self._by_id.get(str(article_id))
+
+    def series(self) -> list[str]:
+        """
+        取得索引中的系列 ID
+
+        Returns:
+            list[str]: 系列 ID 列表
+        """
+        return sorted(self._load())
+
+    def articles(self, category_id: str) -> list[dict]:
+        """
+        取得系列中的文章（依列表順序）
+
+        Args:
+            category_id: 系列 ID
+
+        Returns:
+            list[dict]: 文章資料列表
+        """
+        entry = self._load().get(str(category_id), {})
+        return [self._by_id[row[0]] for row in entry.get('articles', [])]
+
+    @timed()
+    async def refresh(
+        self,
+        request: APIRequestContext,
+        category_id: str,
+        user: str | None = None,
+        base_url: str = ITHELP_URL,
+        full: bool = False,
+        concurrency: int = 4
+    ) -> dict:
+        """
+        讀取系列文章列表並更新索引
+
+        Args:
+            request: 用來讀取網頁的 APIRequestContext（未指定 user 時需已登入）
+            category_id: 系列 ID
+            user: 使用者路徑（/users/{user}，未提供時使用索引中的值或從頁首取得）
+            base_url: iThome 鐵人賽網站的網址
+            full: 是否重新讀取所有分頁
+            concurrency: 同時讀取的分頁數量
+
+        Returns:
+            dict: {"pages": 讀取的分頁數, "added": 新增的文章數, "changed": 標題變更的文章數}
+
+        Raises:
+            RuntimeError: 無法取得使用者路徑或讀取列表失敗
+        """
+        category_id = str(category_id)
+        base_url = base_url.rstrip('/')
+        entry = self._load().get(category_id, {})
+
+        user = user or entry.get('user')
+        if not user:
+            user = find_user(await self._get(request, f"{base_url}/"))
+            if not user:
+                raise RuntimeError("無法取得使用者路徑，請先登入或指定 --user")
+
+        # 只讀取上次同步的最後一頁與之後的分頁
+        url = f"{base_url}/users/{user}/ironman/{category_id}"
+        start = 1 if full or entry.get('user') != user else entry.get('pages', 1)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(number: int) -> tuple[int, list, int]:
+            async with semaphore:
+                html = await self._get(request, f"{url}?page={number}" if number > 1 else url)
+            if html is None:
+                raise RuntimeError(f"無法讀取系列文章列表第 {number} 頁")
+            articles, page_links = find_article_links(html, url)
+            return number, articles, max((self._page_number(link) for link in page_links), default=1)
+
+        # 先讀取起始頁得知分頁數量，再同時讀取之後的分頁（分頁連結只顯示部分頁碼時繼續讀取）
+        pages = {}
+        pending = [start]
+        while pending:
+            for number, articles, last in await asyncio.gather(*(fetch(number) for number in pending)):
+                pages[number] = (articles, last)
+            last = max(max(last for _, last in pages.values()), max(pages))
+            pending = [number for number in range(start, last + 1) if number not in pages]
+
+        # 保留未重新讀取的分頁中的文章，合併新讀取的文章
+        now = int(time.time())
+        previous = {row[0]: row for row in entry.get('articles', [])}
+        fetched = [article for number in sorted(pages) for article in pages[number][0]]
+        fetched_ids = {article_id for article_id, _ in fetched}
+        rows = [row for row in entry.get('articles', []) if row[0] not in fetched_ids] if not full else []
+        added = changed = 0
+        for article_id, title in fetched:
+            row = previous.get(article_id)
+            if row is None:
+                added += 1
+                row = [article_id, title, day_from_title(title), now]
+            elif row[1] != title:
+                changed += 1
+                row = [article_id, title, day_from_title(title), now]
+            rows.append(row)
+
+        self._series[category_id] = {
+            "user": user,
+            "pages": max(pages),
+            "synced_at": now,
+            "articles": rows,
+        }
+        self._rebuild()
+        self._save()
+        return {"pages": len(pages), "added": added, "changed": changed}
+
+    def _load(self) -> dict:
+        """讀取索引檔案（只在第一次使用時讀取）"""
+        if self._series is None:
+            self._series = {}
+            if self.index_file.exists():
+                try:
+                    with open(self.index_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if data.get('version') == INDEX_VERSION:
+                        self._series = data.get('series', {})
+                except (OSError, ValueError):
+                    # 索引損毀時視為沒有索引，下次同步時重建
+                    self._series = {}
+            self._rebuild()
+        return self._series
+
+    def _rebuild(self) -> None:
+        """建立以文章 ID 與天數查詢的對照表"""
+        self._by_id = {}
+        self._by_day = {}
+        for category_id, entry in self._series.items():
+            for article_id, title, day, modified in entry.get('articles', []):
+                self._by_id[article_id] = {
+                    "article_id": article_id,
+                    "category_id": category_id,
+                    "title": title,
+                    "day": day,
+                    "modified": modified,
+                }
+                if day is not None:
+                    # 同一天有多篇文章時使用列表中較前面的文章
+                    self._by_day.setdefault((category_id, day), article_id)
+
+    def _save(self) -> None:
+        """以精簡格式寫入索引檔案（先寫入暫存檔再取代）"""
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.index_file.parent, prefix=f".{self.index_file.name}.")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {"version": INDEX_VERSION, "series": self._series},
+                    f, ensure_ascii=False, separators=(',', ':'), sort_keys=True
+                )
+            os.replace(temp_path, self.index_file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    async def _get(request: APIRequestContext, url: str) -> str | None:
+        """送出 GET 請求，失敗時回傳 None"""
+        try:
+            response = await request.get(url)
+        except Exception:
+            return None
+        if not response.ok:
+            return None
+        return await response.text()
+
+    @staticmethod
+    def _page_number(url: str) -> int:
+        match = re.search(r'[?&]page=(\d+)', url)
+        return int(match.group(1)) if match else 1
@@ -0,0 +1,192 @@
+"""
+登入狀態儲存模組
+
+以 Playwright 的 storage_state（cookies 與 localStorage）保存登入狀態。
+寫入時先寫到同目錄的暫存檔再以 rename 取代（不會留下寫到一半的檔案），
+並以檔案鎖避免多個行程同時寫入；內容未變更時不寫入。
+讀取時也接受舊版 Client 儲存的 Base64 cookies 格式，下次儲存時即轉換為新格式。
+"""
+import base64
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from playwright.async_api import BrowserContext
+
+try:
+    import fcntl
+except ImportError:
+    # Windows 沒有 fcntl，改為不加鎖（仍保有原子寫入）
+    fcntl = None
+
+# 在新頁面載入前還原 localStorage（只套用到相同 origin）
+RESTORE_LOCAL_STORAGE = """
+(origins => {
+    const origin = origins.find((item) => item.origin === window.location.origin);
+    if (!origin) {
+        return;
+    }
+    for (const {name, value} of origin.localStorage) {
+        if (window.localStorage.getItem(name) === null) {
+            window.localStorage.setItem(name, value);
+        }
+    }
+})(%s)
+"""
+
+
+class SessionStore:
+    """以檔案保存 Playwright storage_state 的登入狀態"""
+
+    def __init__(self, path: str | Path = "cookies.txt"):
+        """
+        初始化
+
+        Args:
+            path: 登入狀態檔案路徑（預設為當前目錄的 cookies.txt）
+        """
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+
+    def load(self) -> dict | None:
+        """
+        讀取登入狀態
+
+        Returns:
+            dict | None: storage_state（包含 cookies 與 origins），檔案不存在或格式錯誤時回傳 None
+        """
+        if not self.path.exists():
+            return None
+
+        with self._lock(exclusive=False):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    content = f.read().strip()
+            except OSError:
+                return None
+        return self._parse(content)
+
+    def save(self, state: dict) -> bool:
+        """
+        寫入登入狀態（內容未變更時略過）
+
+        Args:
+            state: context.storage_state() 的回傳值
+
+        Returns:
+            bool: 是否寫入檔案
+        """
+        content = self._serialize(state)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock(exclusive=True):
+            if self.path.exists():
+                # 比較檔案原文，舊版格式即使內容相同也會轉換為新格式
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    if f.read() == content:
+                        return False
+
+            # 寫到同目錄的暫存檔後以 rename 取代
+            fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            except BaseException:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+        return True
+
+    async def capture(self, context: BrowserContext) -> bool:
+        """
+        儲存 BrowserContext 目前的登入狀態
+
+        Args:
+            context: Playwright 的 BrowserContext
+
+        Returns:
+            bool: 是否寫入檔案
+        """
+        return self.save(await context.storage_state())
+
+    async def restore(self, context: BrowserContext) -> bool:
+        """
+        將儲存的登入狀態套用到已建立的 BrowserContext
+
+        新建立的 context 可直接使用 browser.new_context(storage_state=store.load())
+
+        Args:
+            context: Playwright 的 BrowserContext
+
+        Returns:
+            bool: 是否成功載入
+        """
+        state = self.load()
+        if not state or not (state['cookies'] or state['origins']):
+            return False
+
+        try:
+            if state['cookies']:
+                await context.add_cookies(state['cookies'])
+            origins = [origin for origin in state['origins'] if origin.get('localStorage')]
+            if origins:
+                await context.add_init_script(RESTORE_LOCAL_STORAGE % json.dumps(origins, ensure_ascii=False))
+        except Exception:
+            return False
+        return True
+
+    @staticmethod
+    def _parse(content: str) -> dict | None:
+        """解析 storage_state JSON 或舊版 Base64 cookies 格式"""
+        if not content:
+            return None
+
+        try:
+            data = json.loads(content)
+        except ValueError:
+            try:
+                data = json.loads(base64.b64decode(content).decode('utf-8'))
+            except ValueError:
+                return None
+
+        # 舊版格式只有 cookies 列表
+        if isinstance(data, list):
+            return {"cookies": data, "origins": []}
+        if isinstance(data, dict) and isinstance(data.get('cookies', []), list):
+            return {"cookies": data.get('cookies', []), "origins": data.get('origins', [])}
+        return None
+
+    @staticmethod
+    def _serialize(state: dict) -> str:
+        """將 storage_state 轉成固定順序的 JSON（順序不同但內容相同時結果一致）"""
+        cookies = sorted(
+            state.get('cookies', []),
+            key=lambda cookie: (cookie.get('domain', ''), cookie.get('path', ''), cookie.get('name', ''))
+        )
+        origins = sorted(
+            (
+                {**origin, "localStorage": sorted(origin.get('localStorage', []), key=lambda item: item['name'])}
+                for origin in state.get('origins', [])
+            ),
+            key=lambda origin: origin['origin']
+        )
+        return json.dumps({"cookies": cookies, "origins": origins}, ensure_ascii=False, indent=2, sort_keys=True)
+
+    @contextmanager
+    def _lock(self, exclusive: bool):
+        """以鎖定檔案取得共享鎖（讀取）或獨占鎖（寫入）"""
+        if fcntl is None:
+            yield
+            return
+
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
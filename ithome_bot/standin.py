@@ -0,0 +1,546 @@
+"""
+iThome 替身伺服器
+
+在本機模擬 bot 會操作到的 iThome 頁面（登入表單、頁首的使用者選單、
+鐵人發文系列選單、系列文章列表、文章建立與編輯頁面、編輯器的圖片上傳及提交後的跳轉），
+讓測試與效能量測不需要網路與真實帳號。回應延遲與失敗機率可以設定。
+
+只使用標準函式庫，在背景執行緒中執行:
+
+    with StandInServer(latency=0.05) as server:
+        client = Client(page, base_url=server.base_url, login_url=server.login_url)
+        await client.login(STANDIN_ACCOUNT, STANDIN_PASSWORD)
+
+也可以獨立啟動:
+    python -m ithome_bot.standin --port 8765 --latency 0.2 --failure-rate 0.1
+"""
+import hashlib
+import html
+import json
+import random
+import re
+import secrets
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import PurePosixPath
+from urllib.parse import parse_qs, quote, urlparse
+
+import click
+
+STANDIN_ACCOUNT = "tester"
+STANDIN_PASSWORD = "secret"
+SESSION_COOKIE = "ithelp_session"
+FIRST_ARTICLE_ID = 10000001
+
+# 系列文章列表每頁的文章數量
+SERIES_PAGE_SIZE = 10
+
+PAGE = """<!doctype html>
+<html>
+<head><meta charset="utf-8">{meta}<title>{title}</title></head>
+<body>
+<header>{header}</header>
+<main>{body}</main>
+</body>
+</html>
+"""
+
+HEADER_LOGGED_IN = """
+<button type="button" class="menu__ironman-btn"
+        onclick="document.getElementById('ir-select-series__common').style.display = 'block'">鐵人發文</button>
+<a id="dLabel" href="#"
+   onclick="document.getElementById('user-menu').style.display = 'block'; return false;">{account}</a>
+<ul id="user-menu" style="display: none"><li><a href="/users/{account}">我的主頁</a></li></ul>
+<div id="ir-select-series__common" style="display: none">{series}</div>
+"""
+
+HEADER_LOGGED_OUT = """<a href="/login?redirect=%2F">登入/註冊</a>"""
+
+LOGIN_FORM = """
+<form method="post" action="/login?redirect={redirect}">
+  {error}
+  <input type="text" id="account" name="account">
+  <input type="password" id="password" name="password">
+  <label><input type="checkbox" name="remember" value="1"> 記住我</label>
+  <button type="submit" id="loginBtn">登入</button>
+</form>
+"""
+
+# 最小化的 jQuery、SimpleMDE 與 CodeMirror 替身（提供 $(textarea).data('simplemde').codemirror）
+# 文件內容存放在 textarea 中；replaceRange 的呼叫記錄在 window.replacedRanges，用來確認只更新了變更的範圍
+EDITOR_SCRIPT = """
+<script>
+  const textarea = document.querySelector('textarea[name="description"]');
+  window.replacedRanges = [];
+  const codemirror = {
+    getValue() {
+      return textarea.value;
+    },
+    setValue(content) {
+      // 與 CodeMirror 相同，換行一律存為 \\n
+      textarea.value = content.replace(/\\r\\n?/g, '\\n');
+    },
+    indexFromPos(pos) {
+      const lines = textarea.value.split('\\n');
+      let index = 0;
+      for (let i = 0; i < pos.line; i++) {
+        index += lines[i].length + 1;
+      }
+      return index + pos.ch;
+    },
+    replaceRange(text, from, to) {
+      window.replacedRanges.push({from, to, text});
+      const value = textarea.value;
+      textarea.value = value.slice(0, this.indexFromPos(from)) + text + value.slice(this.indexFromPos(to || from));
+    },
+    operation(fn) {
+      return fn();
+    }
+  };
+  const simplemde = {
+    codemirror,
+    value(content) {
+      if (content === undefined) {
+        return codemirror.getValue();
+      }
+      codemirror.setValue(content);
+    }
+  };
+  window.jQuery = window.$ = (element) => ({
+    data: (key) => (key === 'simplemde' && element === textarea ? simplemde : undefined)
+  });
+</script>
+"""
+
+EDIT_FORM = """
+<form method="post" action="/articles/{article_id}">
+  <input type="text" name="subject" value="{subject}">
+  <textarea name="description">{description}</textarea>
+  <button type="submit" id="updateSubmitBtn">更新</button>
+</form>
+"""
+
+CREATE_FORM = """
+<form method="post" action="/{contest_path}/create/{category_id}">
+  <input type="text" name="subject" value="">
+  <textarea name="description"></textarea>
+  <div class="save-group">
+    <button type="button" class="save-group__dropdown-toggle"
+            onclick="document.getElementById('createSubmitBtn').style.display = 'inline-block'">儲存選項</button>
+    <button type="submit" id="createSubmitBtn" style="display: none">發表</button>
+  </div>
+</form>
+"""
+
+
+class StandInServer:
+    """iThome 替身伺服器"""
+
+    def __init__(
+        self,
+        accounts: dict | None = None,
+        series: dict | None = None,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        contest_path: str = "2025ironman"
+    ):
+        """
+        初始化
+
+        Args:
+            accounts: 可登入的帳號 {帳號: 密碼}（預設為 STANDIN_ACCOUNT / STANDIN_PASSWORD）
+            series: 鐵人賽系列 {系列 ID: 名稱}
+            latency: 每個回應的延遲（秒）
+            failure_rate: 回應 503 的機率（0 到 1）
+            seed: 失敗機率的亂數種子（可選，用於重現結果）
+            host: 監聽的位址
+            port: 監聽的埠號（0 表示自動選擇）
+            contest_path: 鐵人賽路徑（例如 2025ironman）
+        """
+        self.accounts = accounts or {STANDIN_ACCOUNT: STANDIN_PASSWORD}
+        self.series = series or {"8446": "Python pytest TDD 實戰"}
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.contest_path = contest_path
+        self.host = host
+        self.port = port
+
+        # 伺服器狀態
+        self.articles = {}
+        self.sessions = {}
+        self.csrf_tokens = {}
+        # 上傳的圖片 {檔名: 內容}
+        self.images = {}
+        self.upload_count = 0
+        self.request_count = 0
+        self.failure_count = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._next_article_id = FIRST_ARTICLE_ID
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """替身伺服器的網址（對應 ithelp.ithome.com.tw）"""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def login_url(self) -> str:
+        """登入頁面的網址（對應 member.ithome.com.tw/login）"""
+        return f"{self.base_url}/login"
+
+    def start(self) -> "StandInServer":
+        """在背景執行緒中啟動伺服器"""
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.standin = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """停止伺服器"""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def add_article(self, subject: str = "", description: str = "", category_id: str | None = None) -> str:
+        """
+        新增一篇文章
+
+        Args:
+            subject: 文章標題
+            description: 文章內容
+            category_id: 所屬系列 ID
+
+        Returns:
+            str: 文章 ID
+        """
+        with self._lock:
+            article_id = str(self._next_article_id)
+            self._next_article_id += 1
+            self.articles[article_id] = {
+                "subject": subject,
+                "description": description,
+                "category_id": category_id,
+                "updated": 0,
+            }
+        return article_id
+
+    def _should_fail(self) -> bool:
+        """依失敗機率決定這次回應是否失敗"""
+        with self._lock:
+            self.request_count += 1
+            if self.failure_rate and self._random.random() < self.failure_rate:
+                self.failure_count += 1
+                return True
+        return False
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """替身伺服器的請求處理器"""
+
+    server_version = "iThomeStandIn/1.0"
+
+    @property
+    def standin(self) -> StandInServer:
+        return self.server.standin
+
+    def log_message(self, format, *args):
+        # 不輸出存取記錄
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        """依路徑分派請求"""
+        if self.standin.latency:
+            time.sleep(self.standin.latency)
+        if self.standin._should_fail():
+            self._send(503, "<h1>Service Unavailable</h1>")
+            return
+
+        url = urlparse(self.path)
+        self.query = parse_qs(url.query)
+        self.form = {}
+        self.files = {}
+        if method == "POST":
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length)
+            content_type = self.headers.get("Content-Type", "")
+            if content_type.startswith("multipart/form-data"):
+                self.form, self.files = _parse_multipart(content_type, body)
+            else:
+                self.form = parse_qs(body.decode("utf-8"), keep_blank_values=True)
+
+        contest = re.escape(self.standin.contest_path)
+        routes = [
+            (r"/", self._home),
+            (r"/login", self._login),
+            (r"/users/([^/]+)", self._profile),
+            (r"/users/([^/]+)/ironman/(\d+)", self._series),
+            (rf"/{contest}/create/(\d+)", self._create),
+            (r"/articles/(\d+)/edit", self._edit),
+            (r"/articles/(\d+)", self._article),
+            (r"/upload/images", self._upload_image),
+        ]
+        for pattern, handler in routes:
+            match = re.fullmatch(pattern, url.path)
+            if match:
+                handler(method, *match.groups())
+                return
+
+        self._send(404, "<h1>Not Found</h1>")
+
+    # 頁面
+
+    def _home(self, method: str) -> None:
+        self._send_page("iT 邦幫忙", "<h1>iT 邦幫忙</h1>")
+
+    def _login(self, method: str) -> None:
+        redirect = self.query.get("redirect", ["/"])[0]
+
+        if method == "POST":
+            account = self.form.get("account", [""])[0]
+            password = self.form.get("password", [""])[0]
+            if self.standin.accounts.get(account) == password:
+                token = secrets.token_hex(16)
+                self.standin.sessions[token] = account
+                self.standin.csrf_tokens[token] = secrets.token_hex(16)
+                max_age = 30 * 24 * 3600 if self.form.get("remember") else None
+                self._redirect(redirect, session=(token, max_age))
+                return
+            error = '<p class="error">帳號或密碼錯誤</p>'
+        elif self._account():
+            # 已登入時直接導回（模擬單一登入）
+            self._redirect(redirect)
+            return
+        else:
+            error = ""
+
+        body = LOGIN_FORM.format(redirect=quote(redirect, safe=""), error=error)
+        self._send(200, PAGE.format(title="會員登入", meta="", header="", body=body))
+
+    def _profile(self, method: str, account: str) -> None:
+        if self._require_login():
+            self._send_page(account, f"<h1>{html.escape(account)} 的主頁</h1>")
+
+    def _series(self, method: str, account: str, category_id: str) -> None:
+        if category_id not in self.standin.series:
+            self._send(404, "<h1>Not Found</h1>")
+            return
+
+        # 與實際網站相同地分頁，分頁連結只顯示目前頁碼附近的分頁
+        articles = [
+            (article_id, article) for article_id, article in list(self.standin.articles.items())
+            if article['category_id'] == category_id
+        ]
+        pages = max(1, -(-len(articles) // SERIES_PAGE_SIZE))
+        number = min(max(int(self.query.get("page", ["1"])[0] or 1), 1), pages)
+        items = "".join(
+            f'<li><a class="qa-list__title-link" href="/articles/{article_id}">{html.escape(article["subject"])}</a></li>'
+            for article_id, article in articles[(number - 1) * SERIES_PAGE_SIZE:number * SERIES_PAGE_SIZE]
+        )
+        links = "".join(
+            f'<a href="?page={page}">{page}</a>'
+            for page in range(max(1, number - 2), min(pages, number + 2) + 1) if page != number
+        )
+        self._send_page(self.standin.series[category_id], f'<ul>{items}</ul><nav class="pagination">{links}</nav>')
+
+    def _create(self, method: str, category_id: str) -> None:
+        if not self._require_login():
+            return
+        if category_id not in self.standin.series:
+            self._send(404, "<h1>Not Found</h1>")
+            return
+
+        if method == "POST":
+            article_id = self.standin.add_article(
+                self.form.get("subject", [""])[0],
+                self.form.get("description", [""])[0],
+                category_id
+            )
+            self._redirect(f"/articles/{article_id}")
+            return
+
+        body = CREATE_FORM.format(contest_path=self.standin.contest_path, category_id=category_id) + EDITOR_SCRIPT
+        self._send_page("發表文章", body)
+
+    def _edit(self, method: str, article_id: str) -> None:
+        if not self._require_login():
+            return
+        article = self.standin.articles.get(article_id)
+        if article is None:
+            self._send(404, "<h1>Not Found</h1>")
+            return
+
+        body = EDIT_FORM.format(
+            article_id=article_id,
+            subject=html.escape(article['subject']),
+            description=html.escape(article['description'])
+        ) + EDITOR_SCRIPT
+        self._send_page("編輯文章", body)
+
+    def _article(self, method: str, article_id: str) -> None:
+        article = self.standin.articles.get(article_id)
+        if article is None:
+            self._send(404, "<h1>Not Found</h1>")
+            return
+
+        if method == "POST":
+            if not self._require_login():
+                return
+            article['subject'] = self.form.get("subject", [article['subject']])[0]
+            article['description'] = self.form.get("description", [article['description']])[0]
+            article['updated'] += 1
+            self._redirect(f"/articles/{article_id}")
+            return
+
+        body = f"<h2>{html.escape(article['subject'])}</h2><div class=\"markdown\">{html.escape(article['description'])}</div>"
+        self._send_page(article['subject'], body)
+
+    def _upload_image(self, method: str) -> None:
+        """編輯器的圖片上傳（需要登入與 CSRF token），回傳 JSON {"url": 圖片網址}"""
+        if method != "POST":
+            self._send(405, "<h1>Method Not Allowed</h1>")
+            return
+        if not self._account():
+            self._send_json(401, {"error": "Unauthenticated."})
+            return
+        token = self.headers.get("X-CSRF-TOKEN") or self.form.get("_token", [""])[0]
+        if token != self.standin.csrf_tokens.get(self._session()):
+            self._send_json(419, {"error": "CSRF token mismatch."})
+            return
+        if "image" not in self.files:
+            self._send_json(422, {"error": "The image field is required."})
+            return
+
+        filename, data = self.files["image"]
+        name = hashlib.sha256(data).hexdigest()[:16] + PurePosixPath(filename).suffix.lower()
+        with self.standin._lock:
+            self.standin.images[name] = data
+            self.standin.upload_count += 1
+        self._send_json(200, {"url": f"{self.standin.base_url}/images/{name}"})
+
+    # 共用方法
+
+    def _session(self) -> str | None:
+        """取得 session cookie 的值"""
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else None
+
+    def _account(self) -> str | None:
+        """取得目前登入的帳號"""
+        return self.standin.sessions.get(self._session())
+
+    def _require_login(self) -> bool:
+        """未登入時導向登入頁面"""
+        if self._account():
+            return True
+        self._redirect(f"/login?redirect={quote(self.path, safe='')}")
+        return False
+
+    def _send_page(self, title: str, body: str) -> None:
+        """回應包含頁首的 ithelp 頁面"""
+        account = self._account()
+        if account:
+            series = "".join(
+                f'<a href="/{self.standin.contest_path}/create/{category_id}">{html.escape(name)}</a>'
+                for category_id, name in self.standin.series.items()
+            )
+            header = HEADER_LOGGED_IN.format(account=html.escape(account), series=series)
+            meta = f'<meta name="csrf-token" content="{self.standin.csrf_tokens[self._session()]}">'
+        else:
+            header = HEADER_LOGGED_OUT
+            meta = ""
+        self._send(200, PAGE.format(title=html.escape(title), meta=meta, header=header, body=body))
+
+    def _send_json(self, status: int, data: dict) -> None:
+        self._send(status, json.dumps(data), "application/json")
+
+    def _send(self, status: int, body: str, content_type: str = "text/html; charset=utf-8") -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _redirect(self, location: str, session: tuple | None = None) -> None:
+        self.send_response(302)
+        self.send_header("Location", location)
+        if session:
+            token, max_age = session
+            cookie = f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"
+            if max_age:
+                cookie += f"; Max-Age={max_age}"
+            self.send_header("Set-Cookie", cookie)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+def _parse_multipart(content_type: str, body: bytes) -> tuple[dict, dict]:
+    """
+    解析 multipart/form-data
+
+    Returns:
+        tuple: (一般欄位 {名稱: [值]}, 檔案欄位 {名稱: (檔名, 內容)})
+    """
+    message = BytesParser(policy=HTTP).parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + body)
+    form = {}
+    files = {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        data = part.get_payload(decode=True) or b""
+        if part.get_filename() is not None:
+            files[name] = (part.get_filename(), data)
+        else:
+            form.setdefault(name, []).append(data.decode("utf-8"))
+    return form, files
+
+
+@click.command()
+@click.option('--host', default="127.0.0.1", show_default=True, help='監聽的位址')
+@click.option('--port', default=8765, show_default=True, type=int, help='監聽的埠號')
+@click.option('--latency', default=0.0, show_default=True, type=float, help='每個回應的延遲（秒）')
+@click.option('--failure-rate', default=0.0, show_default=True, type=click.FloatRange(0, 1), help='回應 503 的機率')
+@click.option('--articles', default=1, show_default=True, type=click.IntRange(min=0), help='預先建立的文章篇數')
+def main(host: str, port: int, latency: float, failure_rate: float, articles: int):
+    """啟動 iThome 替身伺服器"""
+    server = StandInServer(host=host, port=port, latency=latency, failure_rate=failure_rate)
+    for index in range(articles):
+        server.add_article(f"[Day {index + 1:02d}] 測試文章", "內容", next(iter(server.series)))
+
+    server.start()
+    click.echo(f"🧪 替身伺服器: {server.base_url}（帳號 {STANDIN_ACCOUNT} / 密碼 {STANDIN_PASSWORD}）")
+    click.echo(f"📄 文章 ID: {', '.join(server.articles) or '無'}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
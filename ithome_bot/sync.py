@@ -0,0 +1,267 @@
+"""
+目錄同步模組
+
+以 Markdown 檔案開頭的 front matter（article_id / subject / series）描述文章，
+並以「修改時間 + 檔案大小 + 雜湊值」的同步索引找出上次同步成功後變更的檔案：
+修改時間與大小都沒變的檔案不會被讀取，只有變更的檔案才會更新或建立文章。
+
+    ---
+    article_id: 10376177
+    subject: "[Day 07] pytest fixture"
+    series: 8446
+    ---
+    文章內容...
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from .series_index import SeriesIndex, day_from_filename
+
+# 檔案開頭的 front matter（以 --- 包住）
+FRONT_MATTER = re.compile(r'\A---[ \t]*\r?\n(.*?)(?:\r?\n)?^---[ \t]*(?:\r?\n|\Z)', re.S | re.M)
+
+# 同步索引檔案格式版本
+SYNC_INDEX_VERSION = 1
+
+
+def parse_front_matter(text: str) -> tuple[dict | None, str]:
+    """
+    取出 front matter 與文章內容
+
+    已安裝 PyYAML 時以 YAML 解析，否則只解析 `key: value` 格式的單行欄位
+
+    Args:
+        text: 檔案內容
+
+    Returns:
+        tuple: (front matter，沒有 front matter 時為 None, 文章內容)
+
+    Raises:
+        ValueError: front matter 格式錯誤
+    """
+    match = FRONT_MATTER.match(text)
+    if not match:
+        return None, text
+
+    body = text[match.end():]
+    try:
+        import yaml
+    except ImportError:
+        return _parse_simple(match.group(1)), body
+
+    try:
+        data = yaml.safe_load(match.group(1)) or {}
+    except yaml.YAMLError as e:
+        raise ValueError(f"front matter 格式錯誤: {e}")
+    if not isinstance(data, dict):
+        raise ValueError("front matter 格式錯誤：需要 key: value 格式")
+    return data, body
+
+
+def set_front_matter_field(text: str, key: str, value: str) -> str:
+    """
+    設定 front matter 中的欄位（只修改該行，保留其他內容與格式）
+
+    Args:
+        text: 檔案內容
+        key: 欄位名稱
+        value: 欄位值
+
+    Returns:
+        str: 修改後的檔案內容（沒有 front matter 時新增）
+    """
+    newline = '\r\n' if '\r\n' in text else '\n'
+    line = f"{key}: {value}"
+    match = FRONT_MATTER.match(text)
+    if not match:
+        return f"---{newline}{line}{newline}---{newline}{text}"
+
+    field = re.compile(rf'^{re.escape(key)}[ \t]*:.*$', re.M)
+    header = match.group(1)
+    if field.search(header):
+        header = field.sub(lambda _: line, header, count=1)
+    else:
+        header = f"{line}{newline}{header}" if header else line
+    return f"---{newline}{header}{newline}---{newline}{text[match.end():]}"
+
+
+def _parse_simple(header: str) -> dict:
+    """解析 key: value 格式的單行欄位（未安裝 PyYAML 時使用）"""
+    data = {}
+    for line in header.splitlines():
+        if not line.strip() or line.lstrip().startswith('#') or ':' not in line:
+            continue
+        key, value = line.split(':', 1)
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+            value = value[1:-1]
+        data[key.strip()] = value
+    return data
+
+
+class SyncIndex:
+    """記錄上次同步成功時各檔案的修改時間、大小與雜湊值"""
+
+    def __init__(self, index_file: str):
+        """
+        初始化
+
+        Args:
+            index_file: 同步索引檔案路徑
+        """
+        self.index_file = Path(index_file)
+        self._entries = None
+        self._scanned = {}
+
+    def scan(self, directory: str, pattern: str = "*.md", force: bool = False) -> list[Path]:
+        """
+        找出上次同步成功後變更的檔案
+
+        修改時間與大小都沒變時不讀取檔案；有變但雜湊值相同（例如只是 touch）時只更新記錄
+
+        Args:
+            directory: 文章目錄
+            pattern: 檔案名稱的 glob 樣式（遞迴尋找子目錄）
+            force: 是否視所有檔案為已變更
+
+        Returns:
+            list[Path]: 變更的檔案（依路徑排序）
+        """
+        entries = self._load()
+        root = Path(directory)
+        changed = []
+        seen = set()
+        for path in sorted(root.rglob(pattern)):
+            if not path.is_file() or any(part.startswith('.') for part in path.relative_to(root).parts):
+                continue
+            key = self._key(path)
+            seen.add(key)
+            stat = path.stat()
+            entry = entries.get(key)
+            if not force and entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                continue
+
+            digest = self._hash(path.read_bytes())
+            if not force and entry and entry[2] == digest:
+                entries[key] = [stat.st_mtime_ns, stat.st_size, digest]
+                continue
+            self._scanned[key] = [stat.st_mtime_ns, stat.st_size, digest]
+            changed.append(path)
+
+        # 移除已刪除的檔案
+        for key in [key for key in entries if key not in seen and self._within(key, root)]:
+            del entries[key]
+        return changed
+
+    def mark(self, path: Path, data: bytes | None = None) -> None:
+        """
+        記錄檔案已同步
+
+        Args:
+            path: 檔案路徑
+            data: 同步後寫回檔案的內容（例如寫入 article_id 後），未提供時使用 scan 時的記錄
+        """
+        key = self._key(path)
+        if data is None and key in self._scanned:
+            self._load()[key] = self._scanned.pop(key)
+            return
+        stat = path.stat()
+        self._load()[key] = [stat.st_mtime_ns, stat.st_size, self._hash(data if data is not None else path.read_bytes())]
+        self._scanned.pop(key, None)
+
+    def save(self) -> None:
+        """寫入同步索引（先寫入暫存檔再取代）"""
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.index_file.parent, prefix=f".{self.index_file.name}.")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {"version": SYNC_INDEX_VERSION, "files": self._load()},
+                    f, ensure_ascii=False, separators=(',', ':'), sort_keys=True
+                )
+            os.replace(temp_path, self.index_file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _load(self) -> dict:
+        """讀取同步索引（只在第一次使用時讀取）"""
+        if self._entries is None:
+            self._entries = {}
+            if self.index_file.exists():
+                try:
+                    with open(self.index_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if data.get('version') == SYNC_INDEX_VERSION:
+                        self._entries = data.get('files', {})
+                except (OSError, ValueError):
+                    # 索引損毀時視為全部變更
+                    self._entries = {}
+        return self._entries
+
+    def _key(self, path: Path) -> str:
+        """以相對於索引檔案所在目錄的路徑記錄（移動整個目錄時仍然有效）"""
+        return os.path.relpath(Path(path).resolve(), self.index_file.parent.resolve())
+
+    def _within(self, key: str, root: Path) -> bool:
+        path = (self.index_file.parent / key).resolve()
+        return path == root.resolve() or root.resolve() in path.parents
+
+    @staticmethod
+    def _hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+
+def load_article_file(
+    path: Path,
+    default_series: str | None = None,
+    series_index: SeriesIndex | None = None
+) -> dict | None:
+    """
+    讀取以 front matter 描述的文章檔案
+
+    沒有 article_id 時，先以天數（front matter 的 day 或檔案名稱）在系列文章索引中尋找已發表的文章，
+    找不到才建立新文章（系列為 front matter 的 series 或 default_series）
+
+    Args:
+        path: 檔案路徑
+        default_series: 預設的系列 ID（可選）
+        series_index: 系列文章索引（可選）
+
+    Returns:
+        dict | None: 文章資料（含 description_file），沒有 front matter 或 subject 時回傳 None（不是文章）
+
+    Raises:
+        ValueError: front matter 格式錯誤，或建立文章時缺少系列
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+    front_matter, body = parse_front_matter(text)
+    subject = (front_matter or {}).get('subject') or (front_matter or {}).get('title')
+    if not subject:
+        return None
+
+    # front matter 與內容之間的空行不屬於文章內容
+    article_data = {"subject": str(subject), "description": body.lstrip('\r\n'), "description_file": str(path)}
+    category_id = front_matter.get('series') or default_series
+    if front_matter.get('article_id'):
+        article_data['article_id'] = str(front_matter['article_id'])
+    else:
+        day = front_matter.get('day') or day_from_filename(path)
+        article_id = None
+        if day and series_index is not None:
+            article_id = series_index.find(int(day), str(category_id) if category_id else None)
+        if article_id:
+            article_data['article_id'] = article_id
+        elif category_id:
+            article_data['category_id'] = str(category_id)
+        else:
+            raise ValueError("沒有 article_id 時需要 series（或 --series）")
+
+    if front_matter.get('account'):
+        article_data['account'] = str(front_matter['account'])
+    return article_data
@@ -0,0 +1,215 @@
+"""
+執行時間量測模組
+
+以 span 樹記錄各步驟的耗時（使用單調時鐘）。
+沒有啟用記錄（不在 collect() 之中也沒有註冊 listener）時不會建立任何物件。
+
+使用範例:
+    from ithome_bot import timing
+
+    # 收集整次執行的 span 樹
+    with timing.collect("run") as root:
+        await client.update_article(article_data)
+    print(root.summary())
+
+    # 將每個完成的 span 送到自己的監控系統
+    timing.add_span_listener(lambda span: metrics.observe(span.name, span.duration))
+"""
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable
+
+# 目前所在的 span（asyncio task 會複製 context，並行的工作會掛在各自的父 span 下）
+_current_span: ContextVar["Span | None"] = ContextVar("ithome_bot_current_span", default=None)
+
+# span 結束時呼叫的 callback
+_listeners: list[Callable[["Span"], None]] = []
+
+
+class Span:
+    """一個步驟的耗時記錄"""
+
+    def __init__(self, name: str, parent: "Span | None" = None):
+        """
+        初始化
+
+        Args:
+            name: 步驟名稱
+            parent: 父 span
+        """
+        self.name = name
+        self.parent = parent
+        self.children = []
+        self.error = None
+        self.started = time.perf_counter()
+        self.finished = None
+
+    @property
+    def duration(self) -> float:
+        """耗時（秒），尚未結束時為目前為止的耗時"""
+        return (self.finished or time.perf_counter()) - self.started
+
+    def to_dict(self) -> dict:
+        """
+        轉為可輸出成 JSON 的字典
+
+        Returns:
+            dict: 包含 name、start（相對於根 span 的秒數）、duration、error、children
+        """
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        return self._to_dict(root.started)
+
+    def _to_dict(self, origin: float) -> dict:
+        result = {
+            "name": self.name,
+            "start": round(self.started - origin, 6),
+            "duration": round(self.duration, 6),
+            "children": [child._to_dict(origin) for child in self.children],
+        }
+        if self.error:
+            result['error'] = self.error
+        return result
+
+    def totals(self) -> dict:
+        """
+        依步驟名稱彙總所有子孫 span 的耗時
+
+        Returns:
+            dict: {name: (總耗時, 次數)}
+        """
+        totals = {}
+        pending = list(self.children)
+        while pending:
+            span = pending.pop()
+            duration, count = totals.get(span.name, (0.0, 0))
+            totals[span.name] = (duration + span.duration, count + 1)
+            pending.extend(span.children)
+        return totals
+
+    def summary(self, limit: int = 5) -> str:
+        """
+        取得一行耗時摘要（總耗時與最耗時的步驟）
+
+        Args:
+            limit: 列出的步驟數量
+
+        Returns:
+            str: 一行摘要
+        """
+        slowest = sorted(self.totals().items(), key=lambda item: item[1][0], reverse=True)[:limit]
+        steps = "，".join(
+            f"{name} {duration:.2f} 秒" + (f" ×{count}" if count > 1 else "")
+            for name, (duration, count) in slowest
+        )
+        return f"總計 {self.duration:.2f} 秒" + (f"（{steps}）" if steps else "")
+
+
+def add_span_listener(listener: Callable[[Span], None]) -> None:
+    """
+    註冊 span 結束時呼叫的 callback
+
+    註冊後即使沒有根 span 也會記錄每個步驟
+
+    Args:
+        listener: 接收已結束 Span 的函數
+    """
+    _listeners.append(listener)
+
+
+def remove_span_listener(listener: Callable[[Span], None]) -> None:
+    """
+    取消註冊 callback
+
+    Args:
+        listener: 先前註冊的函數
+    """
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def _is_active() -> bool:
+    """是否正在記錄（已有父 span 或註冊了 listener）"""
+    return _current_span.get() is not None or bool(_listeners)
+
+
+@contextmanager
+def collect(name: str = "run"):
+    """
+    建立根 span，收集其中所有步驟的耗時
+
+    Args:
+        name: 根 span 名稱
+
+    Yields:
+        Span: 根 span（結束後可呼叫 to_dict() 或 summary()）
+    """
+    with _record(name) as root:
+        yield root
+
+
+@contextmanager
+def span(name: str):
+    """
+    記錄一個步驟的耗時（可巢狀）
+
+    Args:
+        name: 步驟名稱
+
+    Yields:
+        Span | None: 目前的 span；沒有啟用記錄時為 None
+    """
+    if not _is_active():
+        yield None
+        return
+
+    with _record(name) as current:
+        yield current
+
+
+@contextmanager
+def _record(name: str):
+    """建立 span 並設為目前的 span，結束時通知 listener"""
+    parent = _current_span.get()
+    current = Span(name, parent)
+    if parent is not None:
+        parent.children.append(current)
+
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = type(e).__name__
+        raise
+    finally:
+        current.finished = time.perf_counter()
+        _current_span.reset(token)
+        for listener in list(_listeners):
+            listener(current)
+
+
+def timed(name: str | None = None):
+    """
+    記錄 async 方法耗時的裝飾器
+
+    只有在已有父 span 或註冊了 listener 時才會記錄
+
+    Args:
+        name: 步驟名稱（預設為方法的 qualname，例如 Authenticator._ithelp_login）
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not _is_active():
+                return await func(*args, **kwargs)
+            with _record(span_name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,58 @@
+"""
+等待條件模組
+
+以實際的頁面狀態取代固定秒數的等待：條件成立就立即繼續，
+逾時則直接繼續（超時時間不短於原本的固定等待，不需要再額外等待）
+"""
+from playwright.async_api import Locator, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+
+async def wait_for_condition(
+    page: Page,
+    expression: str,
+    arg=None,
+    timeout: int = 3000
+) -> bool:
+    """
+    等待頁面中的 JavaScript 條件成立
+
+    Args:
+        page: Playwright 頁面物件
+        expression: 回傳 truthy 值表示條件成立的 JavaScript 函式
+        arg: 傳給 expression 的參數
+        timeout: 等待條件的超時時間（毫秒）
+
+    Returns:
+        bool: 條件是否在超時前成立
+    """
+    try:
+        await page.wait_for_function(expression, arg=arg, timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def wait_for_locator(
+    page: Page,
+    locator: Locator,
+    state: str = "visible",
+    timeout: int = 3000
+) -> bool:
+    """
+    等待元素達到指定狀態
+
+    Args:
+        page: Playwright 頁面物件
+        locator: 要等待的元素
+        state: 元素狀態（attached、detached、visible、hidden）
+        timeout: 等待狀態的超時時間（毫秒）
+
+    Returns:
+        bool: 元素是否在超時前達到指定狀態
+    """
+    try:
+        await locator.wait_for(state=state, timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
@@ -0,0 +1,305 @@
+"""
+監看模式模組
+
+保持已登入的頁面停在文章的編輯頁面，監看 Markdown 檔案：
+存檔後等待一小段時間（連續存檔合併為一次），以差異更新編輯器中的內容，
+只在要求時（或依設定的間隔）才提交，省去每次存檔都要啟動瀏覽器、登入與載入編輯頁面的時間。
+
+已安裝 watchdog 時使用檔案系統事件（Linux 為 inotify），否則定期檢查檔案的修改時間與大小。
+"""
+import asyncio
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import AsyncIterator
+
+from .article_updater import ArticleUpdater
+from .images import ImageUploader
+from .sync import parse_front_matter
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+# 最後一次變更後等待的時間（秒），期間的變更合併為一次
+DEBOUNCE = 0.3
+
+# 沒有 watchdog 時檢查檔案的間隔（秒）
+POLL_INTERVAL = 0.25
+
+
+class _ChangeHandler(FileSystemEventHandler):
+    """watchdog 事件處理：監看目錄中的目標檔案（編輯器常以寫入暫存檔再改名的方式存檔）"""
+
+    def __init__(self, path: Path, notify):
+        super().__init__()
+        self.path = path
+        self.notify = notify
+
+    def on_any_event(self, event):
+        paths = {getattr(event, 'src_path', None), getattr(event, 'dest_path', None)}
+        if any(path and Path(os.fsdecode(path)).resolve() == self.path for path in paths):
+            self.notify()
+
+
+class FileWatcher:
+    """監看單一檔案的內容變更"""
+
+    def __init__(self, path: str, debounce: float = DEBOUNCE, poll_interval: float = POLL_INTERVAL, polling: bool = False):
+        """
+        初始化
+
+        Args:
+            path: 檔案路徑
+            debounce: 最後一次變更後等待的時間（秒），期間的變更合併為一次
+            poll_interval: 定期檢查檔案的間隔（秒）
+            polling: 是否一律定期檢查（不使用 watchdog）
+        """
+        self.path = Path(path).resolve()
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.polling = polling or Observer is None
+
+    async def changes(self, initial: bool = True) -> AsyncIterator[str]:
+        """
+        依序取得變更後的檔案內容
+
+        Args:
+            initial: 是否先取得目前的內容
+
+        Yields:
+            str: 檔案內容（與上一次相同的內容不會重複取得）
+        """
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+        stop = self._start(lambda: loop.call_soon_threadsafe(changed.set), changed)
+
+        try:
+            digest = None
+            content = self.read()
+            if content is not None:
+                digest = self._hash(content)
+                if initial:
+                    yield content
+
+            while True:
+                await changed.wait()
+                # 連續的變更合併為一次：等到一段時間沒有新的變更
+                while True:
+                    changed.clear()
+                    try:
+                        await asyncio.wait_for(changed.wait(), self.debounce)
+                    except asyncio.TimeoutError:
+                        break
+
+                content = self.read()
+                if content is None or self._hash(content) == digest:
+                    # 存檔途中（檔案暫時不存在）或內容未變更
+                    continue
+                digest = self._hash(content)
+                yield content
+        finally:
+            await stop()
+
+    def read(self) -> str | None:
+        """
+        讀取檔案內容
+
+        Returns:
+            str | None: 檔案內容，檔案不存在時回傳 None
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8', newline='') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _start(self, notify, changed: asyncio.Event):
+        """
+        開始監看
+
+        Returns:
+            停止監看的 coroutine function
+        """
+        if not self.polling:
+            observer = Observer()
+            observer.schedule(_ChangeHandler(self.path, notify), str(self.path.parent))
+            observer.start()
+
+            async def stop_observer():
+                observer.stop()
+                await asyncio.to_thread(observer.join)
+            return stop_observer
+
+        async def poll():
+            last = self._stat()
+            while True:
+                await asyncio.sleep(self.poll_interval)
+                current = self._stat()
+                if current != last:
+                    last = current
+                    changed.set()
+
+        task = asyncio.create_task(poll())
+
+        async def stop_polling():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        return stop_polling
+
+    def _stat(self) -> tuple | None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _hash(content: str) -> str:
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class WatchSession:
+    """將檔案變更推送到保持開啟的編輯頁面，在要求時或依間隔提交"""
+
+    def __init__(
+        self,
+        updater: ArticleUpdater,
+        article_id: str,
+        subject: str,
+        watcher: FileWatcher,
+        submit_interval: float | None = None,
+        images: ImageUploader | None = None
+    ):
+        """
+        初始化
+
+        Args:
+            updater: 已登入頁面的文章更新器（建議啟用 incremental_editor）
+            article_id: 文章 ID
+            subject: 文章標題
+            watcher: 檔案監看器
+            submit_interval: 有未提交的變更時自動提交的間隔（秒），0 表示每次更新編輯器後立即提交，
+                None 表示只在呼叫 request_submit() 時提交
+            images: 本機圖片上傳器（可選，提供時先上傳內容中引用的本機圖片再更新編輯器）
+        """
+        self.updater = updater
+        self.article_id = article_id
+        self.subject = subject
+        self.watcher = watcher
+        self.submit_interval = submit_interval
+        self.images = images
+        # 編輯器中尚未提交的內容
+        self.pending = None
+        self._submit_requested = asyncio.Event()
+
+    def request_submit(self) -> None:
+        """要求提交（可從訊號處理或其他 task 呼叫）"""
+        self._submit_requested.set()
+
+    async def run(self) -> AsyncIterator[dict]:
+        """
+        開始監看，依序回傳事件:
+            - {"event": "edited", "length": 內容長度, "elapsed": 秒}
+            - {"event": "submitted", "article_id": 文章 ID, "success": bool, "elapsed": 秒}
+            - {"event": "error", "action": "edit" 或 "submit", "error": 錯誤訊息}
+
+        Yields:
+            dict: 事件
+        """
+        events = asyncio.Queue()
+        # 編輯與提交都操作同一個頁面，不能同時進行
+        lock = asyncio.Lock()
+
+        async def edit_loop():
+            async for content in self.watcher.changes():
+                started = time.perf_counter()
+                try:
+                    article_data = self._article_data(content)
+                    if self.images is not None:
+                        # 上傳使用 APIRequestContext，不需要等待頁面上的操作
+                        article_data['description'] = await self.images.rewrite(
+                            article_data['description'], self.watcher.path.parent, self.updater.page.context.request
+                        )
+                    async with lock:
+                        changed = await self.updater.edit(article_data)
+                except Exception as e:
+                    await events.put({"event": "error", "action": "edit", "error": str(e)})
+                    continue
+                # 編輯器與檔案內容已經相同（例如剛開始監看時）且沒有未提交的變更時不需要提交
+                if not changed and self.pending is None:
+                    continue
+                self.pending = article_data
+                await events.put({
+                    "event": "edited", "length": len(article_data['description']), "elapsed": time.perf_counter() - started
+                })
+                if self.submit_interval == 0:
+                    self.request_submit()
+
+        async def submit_loop():
+            while True:
+                if self.submit_interval:
+                    try:
+                        await asyncio.wait_for(self._submit_requested.wait(), self.submit_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    await self._submit_requested.wait()
+                self._submit_requested.clear()
+                if self.pending is None:
+                    continue
+
+                started = time.perf_counter()
+                async with lock:
+                    article_data = self.pending
+                    try:
+                        result = await self.updater.submit_edited(article_data)
+                        error = None
+                    except Exception as e:
+                        result = None
+                        error = str(e)
+                    if result and self.pending is article_data:
+                        self.pending = None
+
+                if error:
+                    await events.put({"event": "error", "action": "submit", "error": error})
+                else:
+                    await events.put({
+                        "event": "submitted",
+                        "article_id": result or self.article_id,
+                        "success": result is not None,
+                        "elapsed": time.perf_counter() - started,
+                    })
+
+        tasks = [asyncio.create_task(edit_loop()), asyncio.create_task(submit_loop())]
+        try:
+            while True:
+                getter = asyncio.create_task(events.get())
+                done, _ = await asyncio.wait([getter, *tasks], return_when=asyncio.FIRST_COMPLETED)
+                if getter in done:
+                    yield getter.result()
+                    continue
+                # 監看意外結束：回報例外
+                getter.cancel()
+                for task in done:
+                    task.result()
+                return
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _article_data(self, content: str) -> dict:
+        """由檔案內容建立文章資料（有 front matter 時以其中的 subject 為標題，與 sync 相同）"""
+        front_matter, body = parse_front_matter(content)
+        if front_matter is None:
+            return {"article_id": self.article_id, "subject": self.subject, "description": content}
+        subject = front_matter.get('subject') or front_matter.get('title') or self.subject
+        return {"article_id": self.article_id, "subject": str(subject), "description": body.lstrip('\r\n')}
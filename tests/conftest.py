@@ -7,7 +7,9 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 from playwright.async_api import async_playwright
+from ithome_bot.browser import launch_browser
 from ithome_bot.client import Client
+from ithome_bot.standin import StandInServer
 
 # 載入環境變數
 load_dotenv()
@@ -33,12 +35,19 @@ def credential():
     }
 
 
+@pytest.fixture
+def standin():
+    """啟動本機的 iThome 替身伺服器（不需要網路與真實帳號）"""
+    with StandInServer() as server:
+        yield server
+
+
 @pytest_asyncio.fixture
 async def page():
-    """建立並初始化 Playwright Page"""
+    """建立並初始化 Playwright Page（瀏覽器引擎與啟動選項由 ITHOME_BROWSER 等環境變數設定）"""
     # 啟動 Playwright 和瀏覽器
     playwright = await async_playwright().start()
-    browser = await playwright.webkit.launch(headless=False)
+    browser = await launch_browser(playwright)
     page = await browser.new_page()
     
     yield page
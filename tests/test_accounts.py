@@ -0,0 +1,116 @@
+"""
+測試多帳號排程
+"""
+import json
+
+import pytest
+
+from ithome_bot import accounts as accounts_module
+from ithome_bot.accounts import AccountScheduler, load_accounts
+
+
+def test_load_accounts(tmp_path, monkeypatch):
+    """測試讀取帳號清單（密碼可從環境變數讀取，預設各帳號使用獨立的登入狀態檔案）"""
+    monkeypatch.setenv("BOB_PASSWORD", "secret")
+    accounts_file = tmp_path / "accounts.json"
+    accounts_file.write_text(json.dumps({
+        "accounts": [
+            {"name": "alice", "account": "alice@example.com", "password": "pw"},
+            {"account": "bob", "password_env": "BOB_PASSWORD", "cookies_file": "bob.txt"},
+        ]
+    }), encoding="utf-8")
+
+    accounts = load_accounts(str(accounts_file))
+
+    assert [account["name"] for account in accounts] == ["alice", "bob"]
+    assert accounts[0]["cookies_file"] == str(tmp_path / "cookies-alice.txt")
+    assert accounts[1]["password"] == "secret"
+    assert accounts[1]["cookies_file"] == str(tmp_path / "bob.txt")
+
+
+def test_load_accounts_rejects_duplicates(tmp_path):
+    """測試帳號名稱重複時回報錯誤"""
+    accounts_file = tmp_path / "accounts.json"
+    accounts_file.write_text(json.dumps([
+        {"account": "alice", "password": "pw"},
+        {"account": "alice", "password": "pw"},
+    ]), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        load_accounts(str(accounts_file))
+
+
+class FakeContext:
+    """模擬 BrowserContext"""
+
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        return object()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    """模擬 Browser，記錄建立過的 BrowserContext"""
+
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+class FakeClient:
+    """模擬 Client：帳號為 "locked" 時登入失敗、"timeout" 時登入拋出例外，更新時回傳 cookies 檔案名稱以確認使用的帳號"""
+
+    def __init__(self, page, cookies_file, state=None, **options):
+        self.page = page
+        self.cookies_file = cookies_file
+
+    async def load_cookies(self):
+        return False
+
+    async def login(self, account, password):
+        if account == "timeout":
+            raise TimeoutError("Timeout 30000ms exceeded")
+        return account != "locked"
+
+    async def save_cookies(self):
+        return True
+
+    async def update_article(self, article_data, force=False):
+        return self.cookies_file
+
+
+@pytest.mark.asyncio
+async def test_scheduler_routes_articles_to_account_contexts(monkeypatch):
+    """測試文章分配到對應帳號的獨立 context，且單一帳號失敗不影響其他帳號"""
+    monkeypatch.setattr(accounts_module, "Client", FakeClient)
+    browser = FakeBrowser()
+    accounts = [
+        {"name": "alice", "account": "alice", "password": "pw", "cookies_file": "alice.txt"},
+        {"name": "bob", "account": "bob", "password": "pw", "cookies_file": "bob.txt"},
+        {"name": "carol", "account": "locked", "password": "pw", "cookies_file": "carol.txt"},
+        {"name": "erin", "account": "timeout", "password": "pw", "cookies_file": "erin.txt"},
+    ]
+    articles = [
+        {"article_id": "1", "subject": "Day 01", "description": ""},
+        {"article_id": "2", "subject": "Day 02", "description": "", "account": "bob"},
+        {"article_id": "3", "subject": "Day 03", "description": "", "account": "carol"},
+        {"article_id": "4", "subject": "Day 04", "description": "", "account": "dave"},
+        {"article_id": "5", "subject": "Day 05", "description": "", "account": "erin"},
+    ]
+
+    results = await AccountScheduler(browser, accounts).run(articles)
+
+    assert [result["account"] for result in results] == ["alice", "bob", "carol", "dave", "erin"]
+    assert [result["article_id"] for result in results] == ["alice.txt", "bob.txt", "3", "4", "5"]
+    assert [result["success"] for result in results] == [True, True, False, False, False]
+    assert results[4]["error"] == "Timeout 30000ms exceeded"
+    assert len(browser.contexts) == 4
+    assert all(context.closed for context in browser.contexts)
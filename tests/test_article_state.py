@@ -0,0 +1,27 @@
+"""
+測試文章推送狀態
+"""
+from ithome_bot.article_state import ArticleState
+
+
+def test_unchanged_after_record(tmp_path):
+    """測試記錄後相同內容視為未變更，且狀態會寫入檔案"""
+    state_file = tmp_path / "state.json"
+    article_data = {"article_id": "10376177", "subject": "Day 01", "description": "內容"}
+
+    state = ArticleState(str(state_file))
+    assert state.is_unchanged(article_data) is False
+
+    state.record("10376177", "Day 01", "內容")
+
+    # 重新讀取狀態檔案
+    reloaded = ArticleState(str(state_file))
+    assert reloaded.is_unchanged(article_data) is True
+    assert reloaded.is_unchanged({**article_data, "description": "新內容"}) is False
+
+
+def test_create_without_article_id_is_never_unchanged(tmp_path):
+    """測試沒有 article_id 的文章（建立文章）不會被略過"""
+    state = ArticleState(str(tmp_path / "state.json"))
+
+    assert state.is_unchanged({"category_id": "8446", "subject": "Day 01", "description": "內容"}) is False
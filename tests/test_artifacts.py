@@ -0,0 +1,35 @@
+"""
+測試 trace 與 HAR 記錄檔輪替
+"""
+import os
+
+from ithome_bot.artifacts import ArtifactRecorder
+
+
+def _write(path, size, mtime):
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_rotate_by_count(tmp_path):
+    """測試超過數量上限時刪除最舊的記錄檔"""
+    files = [_write(tmp_path / f"{index}.har", 10, 1000 + index) for index in range(5)]
+    other = _write(tmp_path / "notes.txt", 10, 0)
+
+    removed = ArtifactRecorder(str(tmp_path), har=True, max_files=3).rotate()
+
+    assert sorted(removed) == sorted(files[:2])
+    assert all(path.exists() for path in files[2:])
+    assert other.exists()
+
+
+def test_rotate_by_size_keeps_newest(tmp_path):
+    """測試超過總大小上限時刪除舊檔，但至少保留最新的一個"""
+    old = _write(tmp_path / "old.trace.zip", 60, 1000)
+    new = _write(tmp_path / "new.trace.zip", 200, 2000)
+
+    removed = ArtifactRecorder(str(tmp_path), trace=True, max_bytes=100).rotate()
+
+    assert removed == [old]
+    assert new.exists()
@@ -0,0 +1,107 @@
+"""
+測試批次處理
+"""
+import json
+
+import pytest
+
+from ithome_bot.batch import BatchRunner, load_manifest
+
+
+def test_load_json_manifest(tmp_path):
+    """測試讀取 JSON 清單並載入文章內容"""
+    (tmp_path / "day01.md").write_text("# Day 01", encoding="utf-8")
+    manifest_file = tmp_path / "manifest.json"
+    manifest_file.write_text(json.dumps({
+        "articles": [
+            {"article_id": 10376177, "subject": "Day 01", "description_file": "day01.md"},
+            {"category_id": "8446", "subject": "Day 02", "description": "內容"},
+        ]
+    }), encoding="utf-8")
+
+    articles = load_manifest(str(manifest_file))
+
+    assert articles[0]["article_id"] == "10376177"
+    assert articles[0]["description"] == "# Day 01"
+    assert articles[1]["category_id"] == "8446"
+    assert articles[1]["description"] == "內容"
+
+
+def test_load_yaml_manifest(tmp_path):
+    """測試讀取 YAML 清單"""
+    pytest.importorskip("yaml")
+    manifest_file = tmp_path / "manifest.yaml"
+    manifest_file.write_text(
+        "- article_id: 10376177\n  subject: Day 01\n  description: 內容\n",
+        encoding="utf-8"
+    )
+
+    articles = load_manifest(str(manifest_file))
+
+    assert articles == [{"article_id": "10376177", "subject": "Day 01", "description": "內容"}]
+
+
+def test_manifest_entry_requires_target(tmp_path):
+    """測試缺少 article_id 與 category_id 時回報錯誤"""
+    manifest_file = tmp_path / "manifest.json"
+    manifest_file.write_text(json.dumps([{"subject": "Day 01", "description": "內容"}]), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        load_manifest(str(manifest_file))
+
+
+class FakePage:
+    """模擬 Playwright Page，只記錄是否已關閉"""
+
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    """模擬 BrowserContext，記錄開啟過的 Page"""
+
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+
+class FakeClient:
+    """模擬 Client：article_id 為 "fail" 時拋出例外"""
+
+    def __init__(self, page):
+        self.page = page
+
+    def for_page(self, page):
+        return FakeClient(page)
+
+    async def update_article(self, article_data, force=False):
+        if article_data["article_id"] == "fail":
+            raise RuntimeError("boom")
+        return article_data["article_id"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batch_isolates_failures():
+    """測試同時處理時單篇失敗不影響其他文章，且每篇使用獨立的 Page"""
+    context = FakeContext()
+    runner = BatchRunner(FakeClient(FakePage(context)), concurrency=2)
+    articles = [
+        {"article_id": article_id, "subject": f"Day {article_id}", "description": ""}
+        for article_id in ("1", "fail", "3")
+    ]
+
+    results = await runner.run(articles)
+
+    assert [result["article_id"] for result in results] == ["1", "fail", "3"]
+    assert [result["success"] for result in results] == [True, False, True]
+    assert results[1]["error"] == "boom"
+    assert len(context.pages) == 3
+    assert all(page.closed for page in context.pages)
@@ -0,0 +1,36 @@
+"""
+測試效能測試結果的比較
+"""
+from bench.run import compare_results
+
+
+def _results(**values):
+    units = {"single_update": False, "batch_throughput": True}
+    return {"stages": {
+        name: {"value": value, "higher_is_better": units[name]} for name, value in values.items()
+    }}
+
+
+def test_slower_stage_is_regression():
+    """測試耗時增加超過門檻時視為退步"""
+    rows = compare_results(_results(single_update=1.0), _results(single_update=1.2), threshold=10)
+
+    assert rows[0]['regressed'] is True
+    assert round(rows[0]['change']) == 20
+
+
+def test_throughput_drop_is_regression():
+    """測試吞吐量（越大越好）下降超過門檻時視為退步，提升則不算"""
+    baseline = _results(batch_throughput=100.0)
+
+    assert compare_results(baseline, _results(batch_throughput=80.0), threshold=10)[0]['regressed'] is True
+    assert compare_results(baseline, _results(batch_throughput=150.0), threshold=10)[0]['regressed'] is False
+
+
+def test_stage_threshold_overrides_default():
+    """測試個別階段的門檻優先於預設門檻"""
+    rows = compare_results(
+        _results(single_update=1.0), _results(single_update=1.2), threshold=10, stage_thresholds={"single_update": 30}
+    )
+
+    assert rows[0]['regressed'] is False
@@ -0,0 +1,167 @@
+"""
+測試常駐服務的工作格式、逐行 JSON 通訊與重新登入
+"""
+import asyncio
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ithome_bot.daemon import Daemon, submit_job
+
+LOGIN_URL = "https://member.ithome.com.tw/login"
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.url = "about:blank"
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    async def new_page(self):
+        return FakePage(self)
+
+
+class FakeClient:
+    """
+    模擬 Client：expired 為 True 時工作被導向登入頁面（回傳 None），重新登入後才成功
+    """
+
+    def __init__(self, expired=False):
+        self.page = FakePage(FakeContext())
+        self.login_url = LOGIN_URL
+        self.expired = expired
+        self.logins = 0
+        self.jobs = []
+        self.last_url = None
+
+    def for_page(self, page):
+        return self
+
+    async def login(self, account, password):
+        self.logins += 1
+        self.expired = False
+        return True
+
+    async def save_cookies(self):
+        return False
+
+    async def update_article(self, article_data, force=False):
+        self.jobs.append(("update", article_data['article_id'], force))
+        if self.expired:
+            self.last_url = f"{LOGIN_URL}?redirect=%2F"
+            return None
+        self.last_url = f"https://ithelp.ithome.com.tw/articles/{article_data['article_id']}"
+        return article_data['article_id']
+
+    async def create_article(self, article_data):
+        self.jobs.append(("create", article_data['category_id'], False))
+        if article_data['subject'] == "boom":
+            raise RuntimeError("找不到發表按鈕")
+        return "10376999"
+
+
+@pytest.fixture
+def socket_path():
+    # Unix domain socket 路徑有長度限制，不使用 tmp_path
+    directory = tempfile.mkdtemp(prefix="ithome-")
+    yield str(Path(directory) / "bot.sock")
+    shutil.rmtree(directory)
+
+
+async def _serve(client, socket_path):
+    """以假的 Client 啟動常駐服務，回傳 (daemon, 服務 task)"""
+    daemon = Daemon("tester", "secret", socket_path, launch_options={"browser": "webkit", "headless": False})
+    daemon.client = client
+    task = asyncio.create_task(daemon.serve_forever())
+    while not Path(socket_path).exists():
+        await asyncio.sleep(0.01)
+    return daemon, task
+
+
+async def _stop(task):
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+def test_validate_job():
+    """測試工作格式檢查"""
+    Daemon._validate_job({"action": "update", "article_id": "1", "subject": "Day 01", "description": ""})
+    Daemon._validate_job({"action": "create", "category_id": "8446", "subject": "Day 01", "description": ""})
+
+    for job in (
+        [],
+        {"action": "delete", "article_id": "1"},
+        {"action": "update", "subject": "Day 01", "description": ""},
+        {"action": "create", "article_id": "1", "subject": "Day 01", "description": ""},
+    ):
+        with pytest.raises(ValueError):
+            Daemon._validate_job(job)
+
+
+@pytest.mark.asyncio
+async def test_submit_job_round_trip(socket_path):
+    """測試送出工作後依序收到 accepted、started 與 result，工作失敗時回報錯誤"""
+    client = FakeClient()
+    _, task = await _serve(client, socket_path)
+    try:
+        job = {"action": "update", "article_id": "10376177", "subject": "Day 07", "description": "內容 😀", "force": True}
+        events = [event async for event in submit_job(job, socket_path)]
+
+        assert [event["event"] for event in events] == ["accepted", "started", "result"]
+        assert events[-1]["success"] is True
+        assert events[-1]["article_id"] == "10376177"
+        assert client.jobs == [("update", "10376177", True)]
+
+        job = {"action": "create", "category_id": "8446", "subject": "boom", "description": ""}
+        result = [event async for event in submit_job(job, socket_path)][-1]
+        assert result["success"] is False
+        assert result["error"] == "找不到發表按鈕"
+    finally:
+        await _stop(task)
+    assert not Path(socket_path).exists()
+
+
+@pytest.mark.asyncio
+async def test_malformed_jobs_get_error_reply(socket_path):
+    """測試不是 JSON 或缺少欄位的工作只回傳一行 error 事件"""
+    client = FakeClient()
+    _, task = await _serve(client, socket_path)
+    try:
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        writer.write(b"not json\n")
+        await writer.drain()
+        lines = (await reader.read()).decode("utf-8").splitlines()
+        writer.close()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["event"] == "error"
+
+        events = [event async for event in submit_job({"action": "update", "article_id": "1"}, socket_path)]
+        assert [event["event"] for event in events] == ["error"]
+        assert "subject" in events[0]["error"]
+        assert client.jobs == []
+    finally:
+        await _stop(task)
+
+
+@pytest.mark.asyncio
+async def test_expired_session_is_relogged_and_retried(socket_path):
+    """測試工作被導向登入頁面時重新登入並重試一次"""
+    client = FakeClient(expired=True)
+    _, task = await _serve(client, socket_path)
+    try:
+        job = {"action": "update", "article_id": "10376177", "subject": "Day 07", "description": "內容"}
+        result = [event async for event in submit_job(job, socket_path)][-1]
+    finally:
+        await _stop(task)
+
+    assert result["success"] is True
+    assert client.logins == 1
+    assert len(client.jobs) == 2
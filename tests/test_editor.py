@@ -0,0 +1,77 @@
+"""
+測試編輯器的差異更新（Myers 行差異與 replaceRange 區塊）
+"""
+import pytest
+
+from ithome_bot.editor import MAX_CHANGED_RATIO, MAX_EDIT_DISTANCE, UPDATE_EDITOR
+from ithome_bot.standin import EDITOR_SCRIPT
+
+
+async def _update(page, current, content, incremental=True):
+    """
+    在只有 CodeMirror 替身的頁面中以 UPDATE_EDITOR 更新內容
+
+    Returns:
+        tuple: (UPDATE_EDITOR 的回傳值, 更新後的內容, replaceRange 的呼叫)
+    """
+    await page.set_content(f'<textarea name="description"></textarea>{EDITOR_SCRIPT}')
+    await page.evaluate("(value) => { document.querySelector('textarea').value = value; }", current)
+    result = await page.evaluate(UPDATE_EDITOR, [content, incremental, MAX_EDIT_DISTANCE, MAX_CHANGED_RATIO])
+    value = await page.evaluate("() => document.querySelector('textarea').value")
+    return result, value, await page.evaluate("() => window.replacedRanges")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("current, content, replaced", [
+    # 只有插入
+    ("a\nb\nc", "a\nb\nX\nc", [{"from": {"line": 2, "ch": 0}, "to": {"line": 2, "ch": 0}, "text": "X\n"}]),
+    # 只有刪除
+    ("a\nb\nc\nd", "a\nd", [{"from": {"line": 1, "ch": 0}, "to": {"line": 3, "ch": 0}, "text": ""}]),
+    # 在最後一行之後插入與刪除最後幾行
+    ("a\nb", "a\nb\nc", [{"from": {"line": 1, "ch": 1}, "to": {"line": 1, "ch": 1}, "text": "\nc"}]),
+    ("a\nb\nc", "a", [{"from": {"line": 0, "ch": 1}, "to": {"line": 2, "ch": 1}, "text": ""}]),
+    # CRLF 的檔案與以 \n 儲存的編輯器比對
+    (
+        "第一行\n第二行\n第三行", "第一行\r\n第二行（修改）\r\n第三行",
+        [{"from": {"line": 1, "ch": 0}, "to": {"line": 2, "ch": 0}, "text": "第二行（修改）\n"}],
+    ),
+    # emoji（UTF-16 surrogate pair）所在的行
+    ("😀 a\nb\n🎉 c", "😀 a\nb 😀\n🎉 c", [{"from": {"line": 1, "ch": 0}, "to": {"line": 2, "ch": 0}, "text": "b 😀\n"}]),
+])
+async def test_incremental_update_replaces_only_changed_lines(page, current, content, replaced):
+    """測試只以 replaceRange 更新變更的行，結果與新內容相同"""
+    result, value, ranges = await _update(page, current, content)
+
+    assert result == {"mode": "incremental", "hunks": 1}
+    assert value == content.replace("\r\n", "\n")
+    assert ranges == replaced
+
+
+@pytest.mark.asyncio
+async def test_incremental_update_applies_hunks_from_the_end(page):
+    """測試多個區塊由後往前套用，前面區塊的行號不受影響"""
+    current = "\n".join(f"line {i}" for i in range(20))
+    lines = current.split("\n")
+    lines[2] = "changed 2"
+    lines.insert(10, "inserted")
+    del lines[18]
+    content = "\n".join(lines)
+
+    result, value, ranges = await _update(page, current, content)
+
+    assert result == {"mode": "incremental", "hunks": 3}
+    assert value == content
+    assert [replaced["from"]["line"] for replaced in ranges] == [17, 10, 2]
+
+
+@pytest.mark.asyncio
+async def test_update_falls_back_to_full_replace(page):
+    """測試內容相同時不更新，差異過大或未啟用差異更新時整份取代"""
+    assert (await _update(page, "x\ny", "x\ny"))[0] == {"mode": "unchanged", "hunks": 0}
+
+    result, value, ranges = await _update(page, "a\nb\nc\nd", "1\n2\n3\n4")
+    assert result == {"mode": "full", "hunks": 0}
+    assert value == "1\n2\n3\n4"
+    assert ranges == []
+
+    assert (await _update(page, "a\nb", "a\nc", incremental=False))[0] == {"mode": "full", "hunks": 0}
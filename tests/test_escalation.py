@@ -0,0 +1,162 @@
+"""
+測試需要人工處理 reCAPTCHA 時改用有畫面瀏覽器
+"""
+import pytest
+
+from ithome_bot import article_base
+from ithome_bot.article_updater import ArticleUpdater
+from ithome_bot.browser import browser_options
+from ithome_bot.escalation import HeadedEscalation
+
+EDIT_URL = "https://ithelp.ithome.com.tw/articles/10376177/edit"
+
+
+class FakeContext:
+    """模擬 BrowserContext：記錄登入狀態與 cookies 的轉移"""
+
+    def __init__(self, storage_state=None, cookies=()):
+        self.storage_state_arg = storage_state
+        self._cookies = list(cookies)
+        self.added_cookies = []
+
+    async def storage_state(self):
+        return {"cookies": self._cookies, "origins": []}
+
+    async def cookies(self):
+        return self._cookies
+
+    async def add_cookies(self, cookies):
+        self.added_cookies += cookies
+
+    async def new_page(self):
+        return FakePage(self)
+
+
+class FakePage:
+    """模擬 Playwright Page：只提供 locator、context 與導航"""
+
+    def __init__(self, context, url="about:blank"):
+        self.context = context
+        self.url = url
+
+    def locator(self, selector):
+        return selector
+
+    async def goto(self, url):
+        self.url = url
+
+    async def wait_for_load_state(self, state):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self, cookies):
+        self.cookies = cookies
+        self.contexts = []
+        self.closed = False
+
+    async def new_context(self, storage_state=None):
+        context = FakeContext(storage_state, self.cookies)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowserType:
+    """模擬 playwright.webkit：記錄啟動參數，人工處理後的 context 有新的 cookies"""
+
+    def __init__(self):
+        self.launches = []
+        self.browser = FakeBrowser([{"name": "ithelp_session", "value": "after-recaptcha"}])
+
+    async def launch(self, **kwargs):
+        self.launches.append(kwargs)
+        return self.browser
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.webkit = FakeBrowserType()
+
+
+class FakeReCaptcha:
+    """模擬無法自動處理的 reCAPTCHA"""
+    manual_waits = 0
+
+    def __init__(self, page):
+        pass
+
+    async def handle_recaptcha(self):
+        return False
+
+    async def wait_for_manual_recaptcha(self):
+        FakeReCaptcha.manual_waits += 1
+
+
+def test_headless_is_opt_in_without_escalation(monkeypatch):
+    """測試未指定時只有能改用有畫面瀏覽器的呼叫端預設使用無頭模式，環境變數優先"""
+    monkeypatch.delenv("ITHOME_HEADLESS", raising=False)
+    assert browser_options()["headless"] is False
+    assert browser_options(default_headless=True)["headless"] is True
+
+    monkeypatch.setenv("ITHOME_HEADLESS", "0")
+    assert browser_options(default_headless=True)["headless"] is False
+    monkeypatch.setenv("ITHOME_HEADLESS", "1")
+    assert browser_options()["headless"] is True
+
+
+@pytest.mark.asyncio
+async def test_escalation_hands_off_storage_state_and_form(monkeypatch):
+    """測試以相同的登入狀態與表單內容在有畫面瀏覽器中提交，並將 cookies 帶回原本的 context"""
+    playwright = FakePlaywright()
+    escalated = []
+    escalation = HeadedEscalation(playwright, {"browser": "webkit", "headless": True}, escalated.append)
+    context = FakeContext(cookies=[{"name": "ithelp_session", "value": "before"}])
+    worker = ArticleUpdater(FakePage(context, EDIT_URL), escalation=escalation)
+    filled = []
+
+    async def read_form(self):
+        return {"subject": "Day 07", "description": "內容"}
+
+    async def fill(self, subject, description, clear_first=False):
+        filled.append((self.page.url, subject, description, clear_first))
+
+    async def submit(self):
+        return "10376177"
+
+    monkeypatch.setattr(ArticleUpdater, "_read_form", read_form)
+    monkeypatch.setattr(ArticleUpdater, "_fill", fill)
+    monkeypatch.setattr(ArticleUpdater, "_submit", submit)
+
+    assert await escalation.submit(worker) == "10376177"
+
+    assert escalated == [EDIT_URL]
+    assert playwright.webkit.launches == [{"headless": False}]
+    headed_context = playwright.webkit.browser.contexts[0]
+    assert headed_context.storage_state_arg == {"cookies": [{"name": "ithelp_session", "value": "before"}], "origins": []}
+    assert filled == [(EDIT_URL, "Day 07", "內容", True)]
+    assert context.added_cookies == [{"name": "ithelp_session", "value": "after-recaptcha"}]
+    assert playwright.webkit.browser.closed is True
+
+
+@pytest.mark.asyncio
+async def test_submit_escalates_only_when_recaptcha_needs_manual_handling(monkeypatch):
+    """測試自動處理 reCAPTCHA 失敗時交給 escalation，沒有 escalation 時在目前頁面等待人工處理"""
+    monkeypatch.setattr(article_base, "ReCaptcha", FakeReCaptcha)
+    FakeReCaptcha.manual_waits = 0
+    workers = []
+
+    class FakeEscalation:
+        async def submit(self, worker):
+            workers.append(worker)
+            return "10376177"
+
+    updater = ArticleUpdater(FakePage(FakeContext(), EDIT_URL), escalation=FakeEscalation())
+    assert await updater._submit() == "10376177"
+    assert workers == [updater]
+    assert FakeReCaptcha.manual_waits == 0
+
+    assert await ArticleUpdater(FakePage(FakeContext(), EDIT_URL))._handle_recaptcha() is True
+    assert FakeReCaptcha.manual_waits == 1
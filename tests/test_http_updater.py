@@ -0,0 +1,152 @@
+"""
+測試不啟動瀏覽器的 HTTP 文章更新（以本機 http.server 回應編輯頁面）
+"""
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ithome_bot import cli
+from ithome_bot.article_state import ArticleState
+from ithome_bot.http_updater import HttpArticleUpdater
+from ithome_bot.session_store import SessionStore
+
+ARTICLE_ID = "10376177"
+
+EDIT_PAGE = """<html><head>{meta}</head><body>{extra}
+<form method="post" action="/articles/10376177">
+  {token}
+  <input type="text" name="subject" value="舊標題">
+  <textarea name="description">舊內容</textarea>
+</form></body></html>"""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """依 server.pages 回應編輯頁面，並記錄收到的請求"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path, self.headers.get("Cookie"), None))
+        if self.path not in self.server.pages:
+            self._reply(404, "")
+            return
+        status, location, body = self.server.pages[self.path]
+        self._reply(status, body, location)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8")
+        self.server.requests.append(("POST", self.path, self.headers.get("Cookie"), urllib.parse.parse_qs(body)))
+        self._reply(302, "", f"/articles/{ARTICLE_ID}")
+
+    def _reply(self, status, body, location=None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.pages = {}
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _updater(server, cookies=None) -> HttpArticleUpdater:
+    if cookies is None:
+        cookies = [{"name": "ithelp_session", "value": "abc", "domain": "127.0.0.1", "path": "/"}]
+    return HttpArticleUpdater(cookies, base_url=f"http://127.0.0.1:{server.server_address[1]}")
+
+
+def _edit_page(meta="", token="", extra="") -> tuple:
+    return 200, None, EDIT_PAGE.format(meta=meta, token=token, extra=extra)
+
+
+ARTICLE_DATA = {"article_id": ARTICLE_ID, "subject": "新標題", "description": "新內容\n😀"}
+
+
+def test_cookie_conversion():
+    """測試 Playwright 格式的 cookie 轉為 http.cookiejar 的 Cookie"""
+    session = HttpArticleUpdater._to_cookiejar_cookie(
+        {"name": "ithelp_session", "value": "abc", "domain": ".ithome.com.tw", "path": "/", "expires": -1,
+         "httpOnly": True, "secure": True}
+    )
+    assert session.domain_initial_dot is True
+    assert session.discard is True and session.expires is None
+    assert session.has_nonstandard_attr("HttpOnly")
+    assert session.secure is True
+
+    persistent = HttpArticleUpdater._to_cookiejar_cookie(
+        {"name": "remember", "value": "1", "domain": "ithelp.ithome.com.tw", "expires": 1900000000.5}
+    )
+    assert persistent.domain_initial_dot is False
+    assert persistent.discard is False and persistent.expires == 1900000000
+    assert persistent.path == "/"
+    assert not persistent.has_nonstandard_attr("HttpOnly")
+
+
+def test_update_posts_form_with_cookies(server):
+    """測試帶著 cookies 取得編輯表單，只替換標題與內容並附上 CSRF token"""
+    server.pages[f"/articles/{ARTICLE_ID}/edit"] = _edit_page(meta='<meta name="csrf-token" content="token">')
+
+    assert _updater(server)._update(ARTICLE_DATA) == ARTICLE_ID
+
+    (_, _, get_cookie, _), (method, path, post_cookie, form) = server.requests
+    assert get_cookie == post_cookie == "ithelp_session=abc"
+    assert (method, path) == ("POST", f"/articles/{ARTICLE_ID}")
+    assert form == {"_token": ["token"], "subject": ["新標題"], "description": ["新內容\n😀"]}
+
+
+def test_login_redirect_returns_none_without_following(server):
+    """測試編輯頁面被導向登入頁面時不跟隨跳轉也不提交，回傳 None"""
+    server.pages[f"/articles/{ARTICLE_ID}/edit"] = (302, "/login?redirect=%2F", "")
+    server.pages["/login?redirect=%2F"] = _edit_page(token='<input type="hidden" name="_token" value="token">')
+
+    assert _updater(server, cookies=[])._update(ARTICLE_DATA) is None
+    assert [request[:2] for request in server.requests] == [("GET", f"/articles/{ARTICLE_ID}/edit")]
+
+
+@pytest.mark.parametrize("page", [
+    # 找不到 CSRF token
+    _edit_page(),
+    # 需要互動驗證
+    _edit_page(token='<input type="hidden" name="_token" value="token">', extra='<div class="g-recaptcha"></div>'),
+])
+def test_unsafe_forms_are_not_submitted(server, page):
+    """測試找不到 CSRF token 或需要互動驗證時不提交，回傳 None"""
+    server.pages[f"/articles/{ARTICLE_ID}/edit"] = page
+
+    assert _updater(server)._update(ARTICLE_DATA) is None
+    assert [request[0] for request in server.requests] == ["GET"]
+
+
+@pytest.mark.asyncio
+async def test_push_options_base_url_reaches_http_update(server, tmp_path):
+    """測試推送選項的網址同時用於 HTTP 更新、Client 與圖片上傳"""
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    server.pages[f"/articles/{ARTICLE_ID}/edit"] = _edit_page(meta='<meta name="csrf-token" content="token">')
+    cookies_file = tmp_path / "cookies.txt"
+    SessionStore(str(cookies_file)).save({
+        "cookies": [{"name": "ithelp_session", "value": "abc", "domain": "127.0.0.1", "path": "/"}], "origins": []
+    })
+    options = cli.PushOptions(images=cli._build_images(True, str(tmp_path / "images.json"), base_url), base_url=base_url)
+
+    pending, results = await cli._update_over_http(
+        [dict(ARTICLE_DATA)], ArticleState(str(tmp_path / "state.json")), str(cookies_file), base_url=options.base_url
+    )
+
+    assert pending == [] and results[0]["article_id"] == ARTICLE_ID
+    assert [request[:2] for request in server.requests][-1] == ("POST", f"/articles/{ARTICLE_ID}")
+    assert options.client_options(None)["base_url"] == options.images.base_url == base_url
@@ -0,0 +1,143 @@
+"""
+測試本機圖片上傳與快取
+"""
+import asyncio
+
+import pytest
+
+from ithome_bot.images import ImageUploader, local_images
+
+BASE_URL = "https://ithelp.ithome.com.tw"
+
+
+class FakeResponse:
+    def __init__(self, text="", data=None, status=200):
+        self.status = status
+        self.ok = status < 400
+        self._text = text
+        self._data = data
+
+    async def text(self):
+        return self._text
+
+    async def json(self):
+        return self._data
+
+
+class FakeUploader:
+    """模擬 APIRequestContext：首頁提供 CSRF token，上傳圖片時記錄檔名與同時上傳的數量"""
+
+    def __init__(self):
+        self.uploads = []
+        self.active = 0
+        self.max_active = 0
+
+    async def get(self, url):
+        return FakeResponse('<meta name="csrf-token" content="token">')
+
+    async def post(self, url, multipart=None, headers=None):
+        assert url == f"{BASE_URL}/upload/images"
+        assert multipart["_token"] == headers["X-CSRF-TOKEN"] == "token"
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.05)
+        self.active -= 1
+        self.uploads.append(multipart["image"]["name"])
+        return FakeResponse(data={"data": {"link": f"/images/{len(self.uploads)}.png"}})
+
+
+def test_local_images():
+    """測試只找出本機圖片（略過網址與 data URI），並保留 title"""
+    description = (
+        '![架構](./img/arch.png "架構圖")\n'
+        '![](https://i.imgur.com/x.png)\n'
+        '<img src="img/flow.png" width="50%">\n'
+        '![](data:image/png;base64,AAAA)\n'
+        '![重複](./img/arch.png)\n'
+    )
+
+    assert local_images(description) == ["./img/arch.png", "img/flow.png"]
+    assert ImageUploader._replace(description, {"./img/arch.png": "https://example.com/a.png"}).splitlines()[0] == (
+        '![架構](https://example.com/a.png "架構圖")'
+    )
+
+
+def test_images_in_code_are_not_rewritten():
+    """測試圍欄程式碼區塊與行內程式碼中的圖片語法不上傳也不改寫"""
+    description = (
+        '![](a.png) `![](a.png)` 與 ``<img src="a.png">``\n'
+        '```markdown\n'
+        '![](b.png)\n'
+        '<img src="a.png">\n'
+        '```\n'
+        '~~~\n'
+        '![](c.png)\n'
+    )
+
+    assert local_images(description) == ["a.png"]
+    urls = {name: f"https://example.com/{name}" for name in ("a.png", "b.png", "c.png")}
+    assert ImageUploader._replace(description, urls) == description.replace("![](a.png) `", "![](https://example.com/a.png) `", 1)
+
+
+@pytest.mark.asyncio
+async def test_upload_endpoint_is_configurable(tmp_path):
+    """測試上傳路徑與欄位名稱可以覆寫"""
+    (tmp_path / "a.png").write_bytes(b"a")
+    posts = []
+
+    class Request(FakeUploader):
+        async def post(self, url, multipart=None, headers=None):
+            posts.append((url, sorted(multipart)))
+            return FakeResponse(data={"url": "/images/a.png"})
+
+    uploader = ImageUploader(str(tmp_path / "images.json"), upload_path="api/images", upload_field="file")
+
+    assert await uploader.rewrite("![](a.png)", tmp_path, Request()) == f"![]({BASE_URL}/images/a.png)"
+    assert posts == [(f"{BASE_URL}/api/images", ["_token", "file"])]
+
+
+@pytest.mark.asyncio
+async def test_same_content_is_uploaded_once(tmp_path):
+    """測試內容相同的圖片只上傳一次，其他圖片同時上傳，找不到的檔案保留原本的引用"""
+    (tmp_path / "a.png").write_bytes(b"same")
+    (tmp_path / "copy.png").write_bytes(b"same")
+    (tmp_path / "b.png").write_bytes(b"b")
+    (tmp_path / "c.png").write_bytes(b"c")
+    request = FakeUploader()
+    uploader = ImageUploader(str(tmp_path / "images.json"))
+
+    first, second = await asyncio.gather(
+        uploader.rewrite("![](a.png)\n![](b.png)\n![](missing.png)", tmp_path, request),
+        uploader.rewrite("![](copy.png)\n![](c.png)", tmp_path, request),
+    )
+
+    assert len(request.uploads) == uploader.upload_count == 3
+    assert request.max_active == 3
+    assert first.splitlines()[0] == second.splitlines()[0]
+    assert first.startswith(f"![]({BASE_URL}/images/")
+    assert first.endswith("![](missing.png)")
+
+
+@pytest.mark.asyncio
+async def test_cached_images_are_not_uploaded_again(tmp_path):
+    """測試重新執行時已上傳過的圖片不需要任何網路請求，只有變更的圖片重新上傳"""
+    (tmp_path / "img").mkdir()
+    for day in range(1, 31):
+        (tmp_path / "img" / f"day{day:02d}.png").write_bytes(f"day {day}".encode())
+    articles = [f"# Day {day}\n![](img/day{day:02d}.png)" for day in range(1, 31)]
+    cache_file = str(tmp_path / "images.json")
+    first = ImageUploader(cache_file)
+    rewritten = [await first.rewrite(article, tmp_path, FakeUploader()) for article in articles]
+
+    # 沒有提供 request 時只以快取改寫，結果與上傳時相同
+    second = ImageUploader(cache_file)
+    assert [await second.rewrite(article, tmp_path) for article in articles] == rewritten
+    assert second.pending(articles[0], tmp_path) == []
+
+    (tmp_path / "img" / "day07.png").write_bytes(b"day 7 v2")
+    request = FakeUploader()
+    third = ImageUploader(cache_file)
+    assert third.pending(articles[6], tmp_path) == [tmp_path / "img" / "day07.png"]
+    for article in articles:
+        await third.rewrite(article, tmp_path, request)
+    assert request.uploads == ["day07.png"]
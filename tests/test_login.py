@@ -12,7 +12,7 @@ async def test_user_can_login_to_ithome(page, credential):
     client = Client(page)
 
     # Act - 執行登入
-    login_success = await client.login(credential["account"], credential["password"])
+    login_success = await client.login(credential["account"], credential["password"], navigate_to_profile=True)
 
     # Assert - 驗證登入成功
     assert login_success is True, "登入應該要成功"
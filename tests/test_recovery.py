@@ -0,0 +1,169 @@
+"""
+測試提交結果確認與重試
+"""
+import pytest
+
+from ithome_bot.article_creator import ArticleCreator
+from ithome_bot.forms import find_article_links, find_edit_form
+from ithome_bot.recovery import RetryPolicy, VerificationUnknown
+
+BASE_URL = "https://ithelp.ithome.com.tw"
+
+
+class FakeResponse:
+    def __init__(self, url, status=200, text=""):
+        self.url = url
+        self.status = status
+        self.ok = status < 400
+        self._text = text
+
+    async def text(self):
+        return self._text
+
+
+class FakeRequest:
+    """模擬 APIRequestContext：依網址回傳設定的狀態碼與內容"""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    async def get(self, url):
+        status, text = self.pages.get(url, (404, ""))
+        return FakeResponse(url, status, text)
+
+
+class FakeContext:
+    def __init__(self, pages=None):
+        self.request = FakeRequest(pages or {})
+
+
+class FakePage:
+    """模擬 Playwright Page，只提供建立 locator 與 BrowserContext 的 HTTP 請求"""
+
+    def __init__(self, pages=None):
+        self.context = FakeContext(pages)
+
+    def locator(self, selector):
+        return selector
+
+
+def _creator(verified=None, results=(None,), retries=2, pages=None):
+    """建立以假資料取代提交與確認的 ArticleCreator（提供 pages 時以 HTTP 回應確認）"""
+    creator = ArticleCreator(FakePage(pages), retry=RetryPolicy(retries=retries, backoff=0))
+    creator.attempts = 0
+    creator.lookups = 0
+
+    async def create_once(category_id, subject, description):
+        result = results[min(creator.attempts, len(results) - 1)]
+        creator.attempts += 1
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def find_created(category_id, subject):
+        creator.lookups += 1
+        return verified
+
+    creator._create_once = create_once
+    if pages is None:
+        creator.verifier.find_created = find_created
+    return creator
+
+
+def test_retry_policy_backoff():
+    """測試指數退避的等待時間與上限"""
+    policy = RetryPolicy(backoff=1.0, factor=2.0, max_backoff=5.0)
+
+    assert [policy.delay(attempt) for attempt in range(4)] == [1.0, 2.0, 4.0, 5.0]
+
+
+@pytest.mark.asyncio
+async def test_ambiguous_create_is_verified_instead_of_resubmitted():
+    """測試提交結果不明但文章已建立時，回報成功且不重新發表"""
+    creator = _creator(verified="10376177")
+
+    result = await creator.create({"category_id": "8446", "subject": "Day 01", "description": ""})
+
+    assert result == "10376177"
+    assert creator.attempts == 1
+    assert creator.lookups == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_create_retries_after_verification():
+    """測試確認未建立時以退避重試，成功後停止"""
+    creator = _creator(results=(RuntimeError("timeout"), "10376178"))
+
+    result = await creator.create({"category_id": "8446", "subject": "Day 02", "description": ""})
+
+    assert result == "10376178"
+    assert creator.attempts == 2
+    assert creator.lookups == 1
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_raise_last_error():
+    """測試重試用盡且確認未成功時拋出最後一次的例外"""
+    creator = _creator(results=(RuntimeError("timeout"),), retries=1)
+
+    with pytest.raises(RuntimeError):
+        await creator.create({"category_id": "8446", "subject": "Day 03", "description": ""})
+    assert creator.attempts == 2
+    assert creator.lookups == 2
+
+
+USER_MENU = '<a href="/users/20168812/profile">個人檔案</a>'
+SERIES_URL = f"{BASE_URL}/users/20168812/ironman/8446"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pages", [
+    # 系列文章列表回應 500
+    {f"{BASE_URL}/": (200, USER_MENU), SERIES_URL: (500, "")},
+    # 頁首沒有使用者選單
+    {f"{BASE_URL}/": (200, "<html></html>")},
+])
+async def test_unknown_create_is_not_resubmitted(pages):
+    """測試無法確認文章是否已建立時停止並回報失敗，只按下一次發表"""
+    creator = _creator(results=(RuntimeError("timeout"), "10376179"), pages=pages)
+
+    with pytest.raises(VerificationUnknown):
+        await creator.create({"category_id": "8446", "subject": "Day 04", "description": ""})
+    assert creator.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_confirmed_absent_create_is_retried():
+    """測試讀完列表確認沒有該文章時才重試"""
+    pages = {
+        f"{BASE_URL}/": (200, USER_MENU),
+        SERIES_URL: (200, '<a class="qa-list__title-link" href="/articles/10376177">Day 01</a>'),
+    }
+    creator = _creator(results=(RuntimeError("timeout"), "10376179"), pages=pages)
+
+    assert await creator.create({"category_id": "8446", "subject": "Day 04", "description": ""}) == "10376179"
+    assert creator.attempts == 2
+
+
+def test_find_edit_form_ignores_leading_textarea_newline():
+    """測試與瀏覽器相同地忽略 textarea 開頭的換行"""
+    form = find_edit_form(
+        '<form method="post"><input name="subject" value="標題">'
+        '<textarea name="description">\n\n內容 &amp; 程式碼</textarea></form>'
+    )
+
+    assert dict(form["fields"]) == {"subject": "標題", "description": "\n內容 & 程式碼"}
+
+
+def test_find_article_links():
+    """測試從系列文章列表取得文章與分頁連結"""
+    html = (
+        '<a class="qa-list__title-link" href="https://ithelp.ithome.com.tw/articles/10376177">\n  Day 01 標題\n</a>'
+        '<a href="/articles/10376178/edit">編輯</a>'
+        '<a href="?page=2">2</a>'
+    )
+
+    articles, pages = find_article_links(html, "https://ithelp.ithome.com.tw/users/20168812/ironman/8446")
+
+    assert articles == [("10376177", "Day 01 標題")]
+    assert pages == ["https://ithelp.ithome.com.tw/users/20168812/ironman/8446?page=2"]
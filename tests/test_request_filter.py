@@ -0,0 +1,24 @@
+"""
+測試網路請求過濾規則
+"""
+from ithome_bot.request_filter import RequestFilter
+
+
+def test_blocks_images_fonts_and_trackers():
+    """測試預設規則攔截圖片、字型與追蹤腳本"""
+    request_filter = RequestFilter()
+
+    assert request_filter.should_block("https://ithelp.ithome.com.tw/images/banner.png", "image") is True
+    assert request_filter.should_block("https://fonts.example.com/a.woff2", "font") is True
+    assert request_filter.should_block("https://www.googletagmanager.com/gtag/js", "script") is True
+
+
+def test_keeps_editor_and_recaptcha_working():
+    """測試預設規則放行頁面、編輯器腳本與 reCAPTCHA"""
+    request_filter = RequestFilter()
+
+    assert request_filter.should_block("https://ithelp.ithome.com.tw/articles/1/edit", "document") is False
+    assert request_filter.should_block("https://cdn.jsdelivr.net/simplemde/latest/simplemde.min.js", "script") is False
+    assert request_filter.should_block("https://www.gstatic.com/recaptcha/releases/x/payload.png", "image") is False
+    # 只比對網域，不會誤判包含相同字串的網址
+    assert request_filter.should_block("https://notfacebook.com/app.js", "script") is False
@@ -0,0 +1,85 @@
+"""
+測試鐵人賽系列解析與快取
+"""
+import json
+
+import pytest
+
+from ithome_bot.series import SeriesResolver
+
+BASE_URL = "https://ithelp.ithome.com.tw"
+
+MENU = """
+<div id="ir-select-series__common">
+  <a href="/2025ironman/create/8446"><span>Python pytest</span> TDD 實戰</a>
+  <a href="https://ithelp.ithome.com.tw/2025ironman/create/8447">Rust &amp; WebAssembly</a>
+  <a href="/2024ironman/create/7000">去年的系列</a>
+</div>
+"""
+
+
+class FakeResponse:
+    def __init__(self, text, status=200):
+        self.status = status
+        self.ok = status < 400
+        self._text = text
+
+    async def text(self):
+        return self._text
+
+
+class FakeRequest:
+    """模擬 APIRequestContext，記錄請求次數"""
+
+    def __init__(self, text=MENU):
+        self.text = text
+        self.count = 0
+
+    async def get(self, url):
+        self.count += 1
+        return FakeResponse(self.text)
+
+
+@pytest.mark.asyncio
+async def test_resolve_discovers_and_caches(tmp_path):
+    """測試從選單找出本年度的系列並寫入快取，快取有效時不重新讀取"""
+    cache_file = tmp_path / "series.json"
+    request = FakeRequest()
+    resolver = SeriesResolver(cache_file=str(cache_file))
+
+    assert await resolver.resolve(request, BASE_URL, "8446") == f"{BASE_URL}/2025ironman/create/8446"
+    assert await resolver.resolve(request, BASE_URL, "8447") == f"{BASE_URL}/2025ironman/create/8447"
+    assert request.count == 1
+    assert resolver.series(BASE_URL)["8446"]["name"] == "Python pytest TDD 實戰"
+    assert resolver.series(BASE_URL)["8447"]["name"] == "Rust & WebAssembly"
+    assert "7000" not in resolver.series(BASE_URL)
+
+    # 新的實例從快取檔案讀取
+    cached = SeriesResolver(cache_file=str(cache_file))
+    assert await cached.resolve(FakeRequest(""), BASE_URL, "8446") == f"{BASE_URL}/2025ironman/create/8446"
+
+
+@pytest.mark.asyncio
+async def test_resolve_refreshes_after_ttl_and_invalidate():
+    """測試快取過期或被移除時重新讀取選單"""
+    request = FakeRequest()
+    resolver = SeriesResolver(contest_path="2024ironman", ttl=0)
+
+    assert await resolver.resolve(request, BASE_URL, "7000") == f"{BASE_URL}/2024ironman/create/7000"
+    assert await resolver.resolve(request, BASE_URL, "7000") == f"{BASE_URL}/2024ironman/create/7000"
+    assert request.count == 2
+
+    resolver.ttl = 3600
+    resolver.invalidate(BASE_URL, "7000")
+    assert await resolver.resolve(FakeRequest(""), BASE_URL, "7000") is None
+
+
+def test_remember_keeps_series_name(tmp_path):
+    """測試以實際網址更新快取時保留系列名稱"""
+    cache_file = tmp_path / "series.json"
+    resolver = SeriesResolver(cache_file=str(cache_file))
+
+    resolver.remember(BASE_URL, "8446", f"{BASE_URL}/2025ironman/create/8446?from=menu")
+
+    cache = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert cache[f"{BASE_URL}/2025ironman"]["series"]["8446"]["create_url"].endswith("?from=menu")
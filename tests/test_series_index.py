@@ -0,0 +1,125 @@
+"""
+測試本機系列文章索引
+"""
+import json
+import re
+
+import pytest
+
+from ithome_bot.series_index import SeriesIndex, day_from_filename, day_from_title
+
+BASE_URL = "https://ithelp.ithome.com.tw"
+
+
+class FakeResponse:
+    def __init__(self, text, status=200):
+        self.status = status
+        self.ok = status < 400
+        self._text = text
+
+    async def text(self):
+        return self._text
+
+
+class FakeSeries:
+    """模擬 APIRequestContext：每頁 10 篇文章，分頁連結只顯示目前頁碼前後兩頁，並記錄讀取的分頁"""
+
+    def __init__(self, titles):
+        self.titles = list(titles)
+        self.requested = []
+
+    async def get(self, url):
+        if url == f"{BASE_URL}/":
+            return FakeResponse('<a href="/users/20168812">我的主頁</a>')
+
+        match = re.search(r'\?page=(\d+)', url)
+        number = int(match.group(1)) if match else 1
+        self.requested.append(number)
+        pages = max(1, -(-len(self.titles) // 10))
+        items = "".join(
+            f'<a class="qa-list__title-link" href="/articles/{10376000 + i}">{title}</a>'
+            for i, title in enumerate(self.titles) if (number - 1) * 10 <= i < number * 10
+        )
+        links = "".join(
+            f'<a href="?page={page}">{page}</a>'
+            for page in range(max(1, number - 2), min(pages, number + 2) + 1) if page != number
+        )
+        return FakeResponse(items + links)
+
+
+def test_day_parsing():
+    """測試從標題與檔案名稱取得天數"""
+    assert day_from_title("[Day 07] pytest fixture") == 7
+    assert day_from_title("Day07：總結") == 7
+    assert day_from_title("第 12 天 - 部署") == 12
+    assert day_from_title("Monday 也要寫文章") is None
+
+    assert day_from_filename("articles/day07.md") == 7
+    assert day_from_filename("day-7-fixtures.md") == 7
+    assert day_from_filename("python-day_12.md") == 12
+    assert day_from_filename("07-fixtures.md") == 7
+    assert day_from_filename("README.md") is None
+    assert day_from_filename("01-setup.md") == 1
+    assert day_from_filename("2025-09-01-intro.md") is None
+    assert day_from_filename("2025-09-01-day03-intro.md") == 3
+    assert day_from_filename("monday-notes.md") is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_builds_index_and_lookups(tmp_path):
+    """測試讀取所有分頁建立索引，並以天數與文章 ID 查詢"""
+    index_file = tmp_path / "index.json"
+    request = FakeSeries(f"[Day {day:02d}] 標題 {day}" for day in range(1, 26))
+
+    result = await SeriesIndex(str(index_file)).refresh(request, "8446")
+
+    assert result == {"pages": 3, "added": 25, "changed": 0}
+    assert sorted(request.requested) == [1, 2, 3]
+
+    # 新的實例從精簡格式的索引檔案讀取
+    index = SeriesIndex(str(index_file))
+    assert index.find(7) == "10376006"
+    assert index.find(7, "8446") == "10376006"
+    assert index.find(99) is None
+    assert index.get("10376024")["title"] == "[Day 25] 標題 25"
+    assert [article["day"] for article in index.articles("8446")] == list(range(1, 26))
+    assert "\n" not in index_file.read_text(encoding="utf-8")
+    assert json.loads(index_file.read_text(encoding="utf-8"))["series"]["8446"]["user"] == "20168812"
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_incremental(tmp_path):
+    """測試只讀取上次同步的最後一頁之後的分頁（分頁連結只顯示部分頁碼時繼續讀取）"""
+    index_file = tmp_path / "index.json"
+    request = FakeSeries(f"Day {day}" for day in range(1, 13))
+    await SeriesIndex(str(index_file)).refresh(request, "8446")
+
+    request.titles += [f"Day {day}" for day in range(13, 61)]
+    request.requested = []
+    result = await SeriesIndex(str(index_file)).refresh(request, "8446")
+
+    assert sorted(request.requested) == [2, 3, 4, 5, 6]
+    assert result == {"pages": 5, "added": 48, "changed": 0}
+    assert SeriesIndex(str(index_file)).find(60) == "10376059"
+
+    # --full 時重新讀取所有分頁並更新變更的標題
+    request.titles[0] = "Day 1（修訂）"
+    request.requested = []
+    result = await SeriesIndex(str(index_file)).refresh(request, "8446", full=True)
+
+    assert sorted(request.requested) == [1, 2, 3, 4, 5, 6]
+    assert result["changed"] == 1
+
+
+def test_find_requires_series_when_ambiguous(tmp_path):
+    """測試索引中有多個系列時需指定系列 ID"""
+    index_file = tmp_path / "index.json"
+    index_file.write_text(json.dumps({"version": 1, "series": {
+        "8446": {"user": "u", "pages": 1, "synced_at": 0, "articles": [["1", "Day 1", 1, 0]]},
+        "8447": {"user": "u", "pages": 1, "synced_at": 0, "articles": [["2", "Day 1", 1, 0]]},
+    }}), encoding="utf-8")
+    index = SeriesIndex(str(index_file))
+
+    with pytest.raises(ValueError):
+        index.find(1)
+    assert index.find(1, "8447") == "2"
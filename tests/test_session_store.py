@@ -0,0 +1,67 @@
+"""
+測試登入狀態儲存
+"""
+import base64
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from ithome_bot.client import read_cookies_file
+from ithome_bot.session_store import SessionStore
+
+COOKIE = {"name": "session", "value": "abc", "domain": "ithelp.ithome.com.tw", "path": "/", "expires": -1}
+
+
+def _state(value="abc", local_storage=None):
+    return {
+        "cookies": [{**COOKIE, "value": value}],
+        "origins": [{"origin": "https://ithelp.ithome.com.tw", "localStorage": local_storage or []}],
+    }
+
+
+def test_load_legacy_base64_cookies(tmp_path):
+    """測試讀取舊版 Base64 cookies 格式"""
+    path = tmp_path / "cookies.txt"
+    path.write_text(base64.b64encode(json.dumps([COOKIE]).encode('utf-8')).decode('ascii'))
+
+    assert SessionStore(path).load() == {"cookies": [COOKIE], "origins": []}
+    assert read_cookies_file(path) == [COOKIE]
+
+
+def test_save_migrates_and_skips_unchanged(tmp_path):
+    """測試儲存後轉換為 storage_state 格式，內容未變更時不寫入"""
+    path = tmp_path / "cookies.txt"
+    path.write_text(base64.b64encode(json.dumps([COOKIE]).encode('utf-8')).decode('ascii'))
+    store = SessionStore(path)
+
+    assert store.save({"cookies": [COOKIE], "origins": []}) is True
+    assert json.loads(path.read_text())['cookies'] == [COOKIE]
+    assert store.save({"cookies": [COOKIE], "origins": []}) is False
+    assert store.save(_state(local_storage=[{"name": "theme", "value": "dark"}])) is True
+
+    # 暫存檔已被取代，不會殘留
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cookies.txt", "cookies.txt.lock"]
+
+
+def test_load_missing_or_corrupt(tmp_path):
+    """測試檔案不存在或格式錯誤時回傳 None"""
+    path = tmp_path / "cookies.txt"
+    assert SessionStore(path).load() is None
+
+    path.write_text("not a session")
+    assert SessionStore(path).load() is None
+    assert read_cookies_file(path) == []
+
+
+def test_concurrent_saves_keep_file_valid(tmp_path):
+    """測試多個寫入者同時儲存時檔案仍為完整的 JSON"""
+    path = tmp_path / "cookies.txt"
+
+    def save(index):
+        return SessionStore(path).save(_state(value=str(index)))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(save, range(40)))
+
+    state = SessionStore(path).load()
+    assert state is not None
+    assert int(state['cookies'][0]['value']) in range(40)
@@ -0,0 +1,306 @@
+"""
+在本機替身伺服器上測試登入、建立與更新文章（不需要網路與真實帳號）
+"""
+import http.cookiejar
+import urllib.error
+import urllib.request
+
+import pytest
+
+from ithome_bot.article_creator import ArticleCreator
+from ithome_bot.article_updater import ArticleUpdater
+from ithome_bot.client import Client
+from ithome_bot.http_updater import HttpArticleUpdater
+from ithome_bot.images import ImageUploader
+from ithome_bot.series import SeriesResolver
+from ithome_bot.series_index import SeriesIndex
+from ithome_bot.standin import STANDIN_ACCOUNT, STANDIN_PASSWORD, StandInServer
+
+
+async def _login(page, standin) -> Client:
+    client = Client(page, base_url=standin.base_url, login_url=standin.login_url)
+    assert await client.login(STANDIN_ACCOUNT, STANDIN_PASSWORD) is True
+    return client
+
+
+@pytest.mark.asyncio
+async def test_login_offline(page, standin):
+    """測試以帳密登入後，再次登入會使用已登入的 session"""
+    client = await _login(page, standin)
+
+    assert await client.login(STANDIN_ACCOUNT, STANDIN_PASSWORD, navigate_to_profile=True) is True
+    await page.wait_for_url(f"**/users/{STANDIN_ACCOUNT}")
+
+
+@pytest.mark.asyncio
+async def test_login_with_wrong_password_fails(page, standin):
+    """測試密碼錯誤時登入失敗"""
+    client = Client(page, base_url=standin.base_url, login_url=standin.login_url)
+
+    assert await client.login(STANDIN_ACCOUNT, "wrong") is False
+
+
+@pytest.mark.asyncio
+async def test_update_article_offline(page, standin):
+    """測試更新文章"""
+    article_id = standin.add_article("舊標題", "舊內容", "8446")
+    client = await _login(page, standin)
+
+    result = await client.update_article({"article_id": article_id, "subject": "新標題", "description": "新內容\n第二行"})
+
+    assert result == article_id
+    assert standin.articles[article_id]['subject'] == "新標題"
+    assert standin.articles[article_id]['description'].replace('\r\n', '\n') == "新內容\n第二行"
+
+
+@pytest.mark.asyncio
+async def test_update_article_fast_fill_offline(page, standin):
+    """測試在一次頁面呼叫中設定並驗證標題與內容"""
+    article_id = standin.add_article("舊標題", "舊內容", "8446")
+    client = await _login(page, standin)
+    client.fast_fill = True
+
+    description = "新內容\r\n包含 emoji 😀 與中文"
+    result = await client.update_article({"article_id": article_id, "subject": "新標題", "description": description})
+
+    assert result == article_id
+    assert standin.articles[article_id]['description'].replace('\r\n', '\n') == description.replace('\r\n', '\n')
+
+
+@pytest.mark.asyncio
+async def test_update_article_incremental_editor_offline(page, standin, monkeypatch):
+    """測試差異更新模式只以 replaceRange 更新變更的行"""
+    article_id = standin.add_article("標題", "第一行\n第二行\n第三行", "8446")
+    client = await _login(page, standin)
+    client.incremental_editor = True
+    modes = []
+    update_content = ArticleUpdater._update_simplemde_content
+
+    async def record_mode(self, content):
+        result = await update_content(self, content)
+        modes.append(result['mode'])
+        return result
+
+    monkeypatch.setattr(ArticleUpdater, "_update_simplemde_content", record_mode)
+
+    result = await client.update_article({"article_id": article_id, "subject": "標題", "description": "第一行\n第二行（修改）\n第三行"})
+
+    assert result == article_id
+    assert modes == ["incremental"]
+    assert standin.articles[article_id]['description'].replace('\r\n', '\n') == "第一行\n第二行（修改）\n第三行"
+
+
+def _record_fills(monkeypatch) -> list:
+    """記錄 ArticleUpdater 實際設定的欄位"""
+    fills = []
+    set_subject = ArticleUpdater._set_subject
+    set_description = ArticleUpdater._set_description
+
+    async def record_subject(self, subject, clear_first=False):
+        fills.append("subject")
+        await set_subject(self, subject, clear_first)
+
+    async def record_description(self, description, clear_first=False):
+        fills.append("description")
+        await set_description(self, description, clear_first)
+
+    monkeypatch.setattr(ArticleUpdater, "_set_subject", record_subject)
+    monkeypatch.setattr(ArticleUpdater, "_set_description", record_description)
+    return fills
+
+
+@pytest.mark.asyncio
+async def test_unchanged_article_is_not_submitted_offline(page, standin, monkeypatch):
+    """測試線上內容與要推送的內容相同（只差在換行符號）時不設定欄位也不提交"""
+    article_id = standin.add_article("標題", "第一行\n第二行", "8446")
+    client = await _login(page, standin)
+    fills = _record_fills(monkeypatch)
+
+    result = await client.update_article({"article_id": article_id, "subject": "標題", "description": "第一行\r\n第二行"})
+
+    assert result == article_id
+    assert fills == []
+    assert standin.articles[article_id]['updated'] == 0
+
+
+@pytest.mark.asyncio
+async def test_only_changed_field_is_filled_offline(page, standin, monkeypatch):
+    """測試只設定有變更的欄位，未變更的欄位保留線上的內容"""
+    article_id = standin.add_article("標題", "舊內容", "8446")
+    client = await _login(page, standin)
+    fills = _record_fills(monkeypatch)
+
+    result = await client.update_article({"article_id": article_id, "subject": "標題", "description": "新內容"})
+
+    assert result == article_id
+    assert fills == ["description"]
+    assert standin.articles[article_id]['updated'] == 1
+    assert standin.articles[article_id]['subject'] == "標題"
+    assert standin.articles[article_id]['description'] == "新內容"
+
+    fills.clear()
+    result = await client.update_article({"article_id": article_id, "subject": "新標題", "description": "新內容"})
+
+    assert result == article_id
+    assert fills == ["subject"]
+    assert standin.articles[article_id]['updated'] == 2
+    assert standin.articles[article_id]['subject'] == "新標題"
+
+
+@pytest.mark.asyncio
+async def test_fast_fill_skips_unchanged_field_offline(page, standin, monkeypatch):
+    """測試 fast_fill 只在一次頁面呼叫中設定有變更的欄位"""
+    article_id = standin.add_article("標題", "舊內容", "8446")
+    client = await _login(page, standin)
+    client.fast_fill = True
+    fills = _record_fills(monkeypatch)
+    forms = []
+    fill_form = ArticleUpdater._fill_form
+
+    async def record_form(self, subject, description):
+        result = await fill_form(self, subject, description)
+        forms.append((subject, description, result))
+        return result
+
+    monkeypatch.setattr(ArticleUpdater, "_fill_form", record_form)
+
+    result = await client.update_article({"article_id": article_id, "subject": "標題", "description": "新內容 😀"})
+
+    assert result == article_id
+    assert forms == [(None, "新內容 😀", True)]
+    assert fills == []
+    assert standin.articles[article_id]['subject'] == "標題"
+    assert standin.articles[article_id]['description'] == "新內容 😀"
+
+
+@pytest.mark.asyncio
+async def test_create_article_offline(page, standin):
+    """測試從鐵人發文選單建立文章"""
+    client = await _login(page, standin)
+
+    result = await client.create_article({"category_id": "8446", "subject": "[Day 01] 新文章", "description": "內容"})
+
+    assert result in standin.articles
+    assert standin.articles[result]['subject'] == "[Day 01] 新文章"
+
+
+@pytest.mark.asyncio
+async def test_create_falls_back_to_menu_when_cached_url_is_stale(page, standin):
+    """測試快取的建立網址 404 時改用鐵人發文選單，並以實際網址更新快取"""
+    client = await _login(page, standin)
+    client.series = SeriesResolver()
+    client.series.remember(standin.base_url, "8446", f"{standin.base_url}/2024ironman/create/8446")
+
+    result = await client.create_article({"category_id": "8446", "subject": "[Day 03] 新文章", "description": "內容"})
+
+    assert result in standin.articles
+    assert client.series.series(standin.base_url)["8446"]["create_url"] == f"{standin.base_url}/2025ironman/create/8446"
+
+
+@pytest.mark.asyncio
+async def test_ambiguous_submit_is_verified_offline(page, standin, monkeypatch):
+    """測試提交後等待跳轉逾時，確認線上狀態後回報成功且不重複發表"""
+    async def redirect_timeout(self):
+        return False
+
+    monkeypatch.setattr(ArticleUpdater, "_wait_for_submit_redirect", redirect_timeout)
+    monkeypatch.setattr(ArticleCreator, "_wait_for_submit_redirect", redirect_timeout)
+    article_id = standin.add_article("舊標題", "舊內容", "8446")
+    client = await _login(page, standin)
+
+    updated = await client.update_article({"article_id": article_id, "subject": "新標題", "description": "新內容"})
+    created = await client.create_article({"category_id": "8446", "subject": "[Day 02] 新文章", "description": "內容"})
+
+    assert updated == article_id
+    assert standin.articles[article_id]['updated'] == 1
+    assert standin.articles[created]['subject'] == "[Day 02] 新文章"
+    assert len(standin.articles) == 2
+
+
+@pytest.mark.asyncio
+async def test_warm_edit_page_offline(page, standin):
+    """測試在保持開啟的編輯頁面上多次更新內容，提交後回到編輯頁面"""
+    article_id = standin.add_article("舊標題", "第一行\n第二行", "8446")
+    client = await _login(page, standin)
+    updater = client.article_updater()
+    updater.incremental_editor = True
+
+    assert await updater.edit({"article_id": article_id, "subject": "新標題", "description": "第一行\n第二行"}) is True
+    article_data = {"article_id": article_id, "subject": "新標題", "description": "第一行\n第二行（修訂）"}
+    assert await updater.edit(article_data) is True
+    assert await updater.submit_edited(article_data) == article_id
+
+    assert standin.articles[article_id]['subject'] == "新標題"
+    assert standin.articles[article_id]['description'].replace('\r\n', '\n') == "第一行\n第二行（修訂）"
+    assert page.url.endswith(f"/articles/{article_id}/edit")
+    assert await updater.edit(article_data) is False
+
+
+@pytest.mark.asyncio
+async def test_series_index_offline(page, standin, tmp_path):
+    """測試從分頁的系列文章列表建立索引，新增文章後只讀取最後一頁之後的分頁"""
+    for day in range(1, 13):
+        standin.add_article(f"[Day {day:02d}] 標題", "內容", "8446")
+    await _login(page, standin)
+    index = SeriesIndex(str(tmp_path / "index.json"))
+
+    assert (await index.refresh(page.context.request, "8446", base_url=standin.base_url))["pages"] == 2
+
+    article_id = standin.add_article("[Day 13] 標題", "內容", "8446")
+    result = await index.refresh(page.context.request, "8446", base_url=standin.base_url)
+
+    assert result == {"pages": 1, "added": 1, "changed": 0}
+    assert index.find(13) == article_id
+
+
+@pytest.mark.asyncio
+async def test_update_article_uploads_local_images_offline(page, standin, tmp_path):
+    """測試更新文章前上傳本機圖片並改寫為網址，重新執行時不會重複上傳"""
+    article_id = standin.add_article("標題", "舊內容", "8446")
+    (tmp_path / "img").mkdir()
+    (tmp_path / "img" / "arch.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+    description_file = tmp_path / "day07.md"
+    description_file.write_text("![架構](./img/arch.png)", encoding="utf-8")
+    article_data = {
+        "article_id": article_id, "subject": "標題", "description": "![架構](./img/arch.png)",
+        "description_file": str(description_file),
+    }
+    client = await _login(page, standin)
+    client.images = ImageUploader(str(tmp_path / "images.json"), base_url=standin.base_url)
+
+    assert await client.update_article(article_data) == article_id
+    assert standin.upload_count == 1
+    assert list(standin.images.values()) == [b"\x89PNG\r\n\x1a\n"]
+    assert standin.articles[article_id]['description'] == f"![架構]({standin.base_url}/images/{next(iter(standin.images))})"
+
+    client.images = ImageUploader(str(tmp_path / "images.json"), base_url=standin.base_url)
+    assert await client.update_article(article_data, force=True) == article_id
+    assert standin.upload_count == 1
+
+
+def test_http_update_offline(standin):
+    """測試不啟動瀏覽器的 HTTP 更新，以及登入失效時回傳 None"""
+    article_id = standin.add_article("舊標題", "舊內容", "8446")
+
+    jar = http.cookiejar.CookieJar()
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(jar))
+    opener.open(standin.login_url, data=f"account={STANDIN_ACCOUNT}&password={STANDIN_PASSWORD}".encode())
+    cookies = [{"name": c.name, "value": c.value, "domain": c.domain, "path": c.path} for c in jar]
+
+    article_data = {"article_id": article_id, "subject": "新標題", "description": "新內容"}
+    updater = HttpArticleUpdater(cookies, base_url=standin.base_url)
+    assert updater._update(article_data) == article_id
+    assert standin.articles[article_id]['subject'] == "新標題"
+
+    # 沒有 cookies 時會被導向登入頁面
+    assert HttpArticleUpdater([], base_url=standin.base_url)._update(article_data) is None
+
+
+def test_failure_rate():
+    """測試設定失敗機率時回應 503"""
+    with StandInServer(failure_rate=1.0) as server:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"{server.base_url}/")
+
+    assert error.value.code == 503
+    assert server.failure_count == 1
@@ -0,0 +1,141 @@
+"""
+測試目錄同步
+"""
+import os
+from pathlib import Path
+
+import pytest
+
+from ithome_bot import cli
+from ithome_bot.sync import SyncIndex, load_article_file, parse_front_matter, set_front_matter_field
+
+ARTICLE = '---\nsubject: "[Day 07] pytest fixture"\nseries: 8446\n---\n\n# fixture\n內容\n'
+
+
+def test_parse_front_matter():
+    """測試取出 front matter 與文章內容"""
+    front_matter, body = parse_front_matter(ARTICLE)
+
+    assert front_matter["subject"] == "[Day 07] pytest fixture"
+    assert str(front_matter["series"]) == "8446"
+    assert body == "\n# fixture\n內容\n"
+    assert parse_front_matter("# 沒有 front matter\n") == (None, "# 沒有 front matter\n")
+
+
+def test_set_front_matter_field_keeps_other_lines():
+    """測試寫入 article_id 時只修改該行，保留其他欄位與內容"""
+    content = set_front_matter_field(ARTICLE, "article_id", "10376177")
+
+    assert content == '---\narticle_id: 10376177\nsubject: "[Day 07] pytest fixture"\nseries: 8446\n---\n\n# fixture\n內容\n'
+    assert set_front_matter_field(content, "article_id", "1").count("article_id") == 1
+    assert set_front_matter_field("內容\r\n", "article_id", "1") == "---\r\narticle_id: 1\r\n---\r\n內容\r\n"
+
+
+def test_load_article_file(tmp_path):
+    """測試依 front matter 決定更新或建立文章，沒有 subject 的檔案不是文章"""
+    (tmp_path / "day07.md").write_text(ARTICLE, encoding="utf-8")
+    (tmp_path / "day08.md").write_text("---\narticle_id: 10376178\nsubject: Day 08\n---\n內容", encoding="utf-8")
+    (tmp_path / "README.md").write_text("# 說明", encoding="utf-8")
+    (tmp_path / "day09.md").write_text("---\nsubject: Day 09\n---\n內容", encoding="utf-8")
+
+    created = load_article_file(tmp_path / "day07.md")
+    assert created["category_id"] == "8446"
+    assert created["description"] == "# fixture\n內容\n"
+    assert load_article_file(tmp_path / "day08.md")["article_id"] == "10376178"
+    assert load_article_file(tmp_path / "README.md") is None
+    with pytest.raises(ValueError):
+        load_article_file(tmp_path / "day09.md")
+    assert load_article_file(tmp_path / "day09.md", default_series="8446")["category_id"] == "8446"
+
+
+def test_scan_skips_unchanged_files_without_reading(tmp_path, monkeypatch):
+    """測試修改時間與大小未變更的檔案不會被讀取，只 touch 的檔案不算變更"""
+    for day in range(1, 4):
+        (tmp_path / f"day{day:02d}.md").write_text(f"Day {day}", encoding="utf-8")
+    index = SyncIndex(str(tmp_path / ".ithome_sync.json"))
+    for path in index.scan(str(tmp_path)):
+        index.mark(path)
+    index.save()
+
+    (tmp_path / "day02.md").write_text("Day 2 修訂", encoding="utf-8")
+    os.utime(tmp_path / "day03.md", ns=(0, 0))
+    read = []
+    read_bytes = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda self: read.append(self.name) or read_bytes(self))
+
+    assert [path.name for path in SyncIndex(str(tmp_path / ".ithome_sync.json")).scan(str(tmp_path))] == ["day02.md"]
+    assert sorted(read) == ["day02.md", "day03.md"]
+
+
+@pytest.mark.asyncio
+async def test_sync_pushes_only_changed_files_and_writes_back_ids(tmp_path, monkeypatch):
+    """測試只推送變更的檔案，建立的文章將 article_id 寫回 front matter"""
+    articles_dir = tmp_path / "articles"
+    articles_dir.mkdir()
+    for day in range(1, 6):
+        (articles_dir / f"day{day:02d}.md").write_text(
+            f"---\narticle_id: {10376000 + day}\nsubject: Day {day}\n---\n內容 {day}", encoding="utf-8"
+        )
+    (articles_dir / "day06.md").write_text(ARTICLE.replace("Day 07", "Day 06"), encoding="utf-8")
+    pushed = []
+
+    async def push_articles(pending, *args):
+        pushed.append([Path(article["description_file"]).name for article in pending])
+        return [{
+            "action": "update" if "article_id" in article else "create",
+            "subject": article["subject"],
+            "article_id": article.get("article_id", "10376006"),
+            "success": True,
+            "error": None,
+            "elapsed": 0.0,
+            "description_file": article["description_file"],
+        } for article in pending]
+
+    monkeypatch.setattr(cli, "_push_articles", push_articles)
+    options = {"state_file": str(tmp_path / "state.json"), "index_file": str(tmp_path / "index.json")}
+
+    assert await cli.sync_with_bot(str(articles_dir), **options) is True
+    assert "article_id: 10376006" in (articles_dir / "day06.md").read_text(encoding="utf-8")
+
+    (articles_dir / "day03.md").write_text("---\narticle_id: 10376003\nsubject: Day 3\n---\n修訂", encoding="utf-8")
+    assert await cli.sync_with_bot(str(articles_dir), **options) is True
+    assert await cli.sync_with_bot(str(articles_dir), **options) is True
+
+    assert pushed == [[f"day{day:02d}.md" for day in range(1, 7)], ["day03.md"]]
+
+
+@pytest.mark.asyncio
+async def test_sync_requires_accounts_for_files_with_account(tmp_path, monkeypatch):
+    """測試 front matter 指定帳號的檔案沒有帳號清單時不以預設帳號推送，有清單時交給多帳號處理"""
+    articles_dir = tmp_path / "articles"
+    articles_dir.mkdir()
+    (articles_dir / "day01.md").write_text("---\narticle_id: 10376001\nsubject: Day 1\n---\n內容", encoding="utf-8")
+    (articles_dir / "day02.md").write_text(
+        "---\narticle_id: 10376002\nsubject: Day 2\naccount: bob\n---\n內容", encoding="utf-8"
+    )
+    accounts_file = tmp_path / "accounts.json"
+    accounts_file.write_text('[{"name": "bob", "account": "bob@example.com", "password": "secret"}]', encoding="utf-8")
+    pushed = []
+
+    async def push_articles(pending, state, account, password, force, concurrency, options, accounts=None):
+        pushed.append(([Path(article["description_file"]).name for article in pending], accounts))
+        return [{
+            "action": "update",
+            "subject": article["subject"],
+            "article_id": article["article_id"],
+            "success": True,
+            "error": None,
+            "elapsed": 0.0,
+            "description_file": article["description_file"],
+        } for article in pending]
+
+    monkeypatch.setattr(cli, "_push_articles", push_articles)
+    options = {"state_file": str(tmp_path / "state.json"), "index_file": str(tmp_path / "index.json")}
+
+    assert await cli.sync_with_bot(str(articles_dir), **options) is False
+    assert pushed == [(["day01.md"], None)]
+
+    # 未推送的檔案下次同步時再推送
+    assert await cli.sync_with_bot(str(articles_dir), accounts_file=str(accounts_file), **options) is True
+    assert pushed[1][0] == ["day02.md"]
+    assert [account["name"] for account in pushed[1][1]] == ["bob"]
@@ -0,0 +1,67 @@
+"""
+測試執行時間量測
+"""
+import asyncio
+
+import pytest
+
+from ithome_bot import timing
+
+
+class Worker:
+    @timing.timed()
+    async def step(self):
+        await asyncio.sleep(0)
+
+    @timing.timed("custom")
+    async def outer(self):
+        await self.step()
+        await self.step()
+
+
+@pytest.mark.asyncio
+async def test_collect_builds_span_tree():
+    """測試 collect() 之中的步驟會記錄為巢狀的 span 樹"""
+    with timing.collect("run") as root:
+        await Worker().outer()
+
+    tree = root.to_dict()
+    assert tree['name'] == "run"
+    assert [child['name'] for child in tree['children']] == ["custom"]
+    assert [child['name'] for child in tree['children'][0]['children']] == ["Worker.step", "Worker.step"]
+    assert root.totals()["Worker.step"][1] == 2
+    assert "Worker.step" in root.summary()
+
+
+@pytest.mark.asyncio
+async def test_listener_receives_spans_without_root():
+    """測試註冊 listener 後，即使沒有根 span 也會收到每個步驟"""
+    received = []
+    timing.add_span_listener(received.append)
+    try:
+        await Worker().outer()
+    finally:
+        timing.remove_span_listener(received.append)
+
+    assert [span.name for span in received] == ["Worker.step", "Worker.step", "custom"]
+    assert all(span.duration >= 0 for span in received)
+
+
+@pytest.mark.asyncio
+async def test_inactive_records_nothing():
+    """測試沒有啟用記錄時不會建立 span"""
+    with timing.span("ignored") as current:
+        await Worker().outer()
+
+    assert current is None
+
+
+def test_error_is_recorded():
+    """測試步驟拋出例外時會記錄例外類型"""
+    with pytest.raises(ValueError):
+        with timing.collect("run") as root:
+            with timing.span("failing"):
+                raise ValueError("boom")
+
+    assert root.children[0].error == "ValueError"
+    assert root.error == "ValueError"
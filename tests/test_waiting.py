@@ -0,0 +1,59 @@
+"""
+測試以頁面狀態取代固定等待
+"""
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from ithome_bot.article_updater import ArticleUpdater
+from ithome_bot.waiting import wait_for_condition, wait_for_locator
+
+
+class FakeLocator:
+    async def wait_for(self, state, timeout):
+        raise PlaywrightTimeoutError("timeout")
+
+
+class FakePage:
+    """模擬條件一直不成立的頁面，記錄額外的固定等待"""
+
+    def __init__(self):
+        self.sleeps = []
+
+    def locator(self, selector):
+        return FakeLocator()
+
+    async def wait_for_function(self, expression, arg=None, timeout=None):
+        raise PlaywrightTimeoutError("timeout")
+
+    async def wait_for_timeout(self, timeout):
+        self.sleeps.append(timeout)
+
+
+@pytest.mark.asyncio
+async def test_timeout_does_not_sleep_again():
+    """測試逾時後直接繼續，不在超時之後再固定等待"""
+    page = FakePage()
+
+    assert await wait_for_condition(page, "() => false", timeout=3000) is False
+    assert await wait_for_locator(page, FakeLocator(), "visible", timeout=2000) is False
+    assert page.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_description_length_ignores_crlf(monkeypatch):
+    """測試 CRLF 的內容以編輯器儲存的 \\n 長度等待"""
+    waits = []
+
+    async def update_simplemde_content(self, content):
+        pass
+
+    async def wait(self, expression, arg=None, timeout=3000):
+        waits.append(arg)
+        return True
+
+    monkeypatch.setattr(ArticleUpdater, "_update_simplemde_content", update_simplemde_content)
+    monkeypatch.setattr(ArticleUpdater, "_wait_for_condition", wait)
+
+    await ArticleUpdater(FakePage())._set_description("第一行 😀\r\n第二行\r第三行")
+
+    assert waits == [len("第一行 😀\n第二行\n第三行") + 1]
@@ -0,0 +1,109 @@
+"""
+測試監看模式
+"""
+import asyncio
+
+import pytest
+
+from ithome_bot.watch import FileWatcher, WatchSession
+
+
+class FakeUpdater:
+    """模擬 ArticleUpdater：記錄編輯器內容與提交的內容"""
+
+    def __init__(self, online=""):
+        self.editor = online
+        self.edits = []
+        self.submits = []
+
+    async def edit(self, article_data):
+        changed = self.editor != article_data["description"]
+        self.editor = article_data["description"]
+        self.edits.append(article_data["description"])
+        return changed
+
+    async def submit_edited(self, article_data):
+        self.submits.append(article_data["description"])
+        return article_data["article_id"]
+
+
+async def _collect(session, count, timeout=5):
+    """取得指定數量的事件"""
+    events = []
+    run = session.run()
+
+    async def collect():
+        async for event in run:
+            events.append(event)
+            if len(events) == count:
+                return
+
+    try:
+        await asyncio.wait_for(collect(), timeout)
+    finally:
+        await run.aclose()
+    return events
+
+
+@pytest.mark.asyncio
+async def test_burst_of_saves_is_coalesced(tmp_path):
+    """測試連續存檔合併為一次變更，內容相同的存檔不會觸發變更"""
+    path = tmp_path / "day07.md"
+    path.write_text("v0", encoding="utf-8")
+    watcher = FileWatcher(str(path), debounce=0.2, poll_interval=0.02, polling=True)
+    changes = watcher.changes()
+
+    assert await changes.__anext__() == "v0"
+    for version in range(1, 6):
+        path.write_text(f"v{version}", encoding="utf-8")
+        await asyncio.sleep(0.05)
+
+    assert await asyncio.wait_for(changes.__anext__(), 2) == "v5"
+    path.write_text("v5", encoding="utf-8")
+    pending = asyncio.ensure_future(changes.__anext__())
+    done, _ = await asyncio.wait([pending], timeout=0.5)
+    assert not done
+    pending.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+
+
+@pytest.mark.asyncio
+async def test_session_edits_warm_page_and_submits_on_request(tmp_path):
+    """測試檔案與線上相同時不需要提交，存檔後只更新編輯器，要求時才提交"""
+    path = tmp_path / "day07.md"
+    path.write_text("---\nsubject: Day 07\n---\n內容", encoding="utf-8")
+    updater = FakeUpdater(online="內容")
+    session = WatchSession(updater, "10376177", "", FileWatcher(str(path), debounce=0.05, poll_interval=0.02, polling=True))
+
+    async def save_then_submit():
+        await asyncio.sleep(0.2)
+        path.write_text("---\nsubject: Day 07\n---\n新內容", encoding="utf-8")
+        await asyncio.sleep(0.5)
+        session.request_submit()
+
+    task = asyncio.create_task(save_then_submit())
+    events = await _collect(session, 2)
+    await task
+
+    assert [event["event"] for event in events] == ["edited", "submitted"]
+    assert updater.edits == ["內容", "新內容"]
+    assert updater.submits == ["新內容"]
+    assert session.pending is None
+
+
+@pytest.mark.asyncio
+async def test_session_submits_after_each_edit_with_zero_interval(tmp_path):
+    """測試 submit_interval 為 0 時每次更新編輯器後提交"""
+    path = tmp_path / "day07.md"
+    path.write_text("新內容", encoding="utf-8")
+    updater = FakeUpdater(online="舊內容")
+    session = WatchSession(
+        updater, "10376177", "Day 07", FileWatcher(str(path), debounce=0.05, polling=True), submit_interval=0
+    )
+
+    events = await _collect(session, 2)
+
+    assert [event["event"] for event in events] == ["edited", "submitted"]
+    assert events[1]["success"] is True
+    assert updater.submits == ["新內容"]